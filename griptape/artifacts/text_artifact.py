@@ -10,9 +10,25 @@ if TYPE_CHECKING:
 
 @define
 class TextArtifact(BaseArtifact):
+    """A piece of text, optionally with the embedding of the text and the offsets of the text in a chunked document.
+
+    Attributes:
+        value: The text.
+        encoding: Encoding used to convert the text to bytes.
+        encoding_error_handler: Error handler used to convert the text to bytes.
+        start_char: Offset of the first character of the text in the chunked document.
+        end_char: Offset after the last character of the text in the chunked document.
+        start_token: Index of the first document token overlapping the text.
+        end_token: Index after the last document token overlapping the text.
+    """
+
     value: str = field(converter=str, metadata={"serializable": True})
     encoding: str = field(default="utf-8", kw_only=True)
     encoding_error_handler: str = field(default="strict", kw_only=True)
+    start_char: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    end_char: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    start_token: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    end_token: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
     _embedding: list[float] = field(factory=list, kw_only=True)
 
     @property
@@ -31,6 +47,17 @@ class TextArtifact(BaseArtifact):
 
         return self.embedding
 
+    @classmethod
+    def generate_embeddings(cls, artifacts: list[TextArtifact], driver: BaseEmbeddingDriver) -> list[list[float]]:
+        """Generates the embeddings of many Text Artifacts with a single call to `BaseEmbeddingDriver.embed_strings()`."""
+        embeddings = driver.embed_strings([str(artifact.value) for artifact in artifacts])
+
+        for artifact, embedding in zip(artifacts, embeddings):
+            artifact._embedding.clear()
+            artifact._embedding.extend(embedding)
+
+        return embeddings
+
     def token_count(self, tokenizer: BaseTokenizer) -> int:
         return tokenizer.count_tokens(str(self.value))
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
+import bisect
 from abc import ABC
-from typing import Optional
+from typing import IO, Optional
+from collections.abc import Iterable, Iterator
 from attr import define, field, Factory
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import ChunkSeparator
@@ -9,7 +11,22 @@ from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 
 @define
 class BaseChunker(ABC):
+    """Splits text into chunks of at most `max_tokens` tokens, preferring to split at `separators` in priority order.
+
+    Attributes:
+        separators: Separators to split text at, in order of priority.
+        tokenizer: Tokenizer used to count tokens.
+        max_tokens: Maximum number of tokens in a chunk.
+        linear: Encodes the text once and picks split points in a single pass over the token offsets instead of
+            recursively re-tokenizing subchunks. Falls back to recursive chunking if the tokenizer doesn't support
+            `token_offsets()`. Chunks produced in linear mode record their start and end character and token offsets.
+        overlap_tokens: Number of tokens each chunk repeats from the end of the previous chunk. Implies linear mode and
+            requires a tokenizer that supports `token_offsets()`.
+        stream_buffer_size: Number of characters `chunk_stream()` buffers before chunking them.
+    """
+
     DEFAULT_SEPARATORS = [ChunkSeparator(" ")]
+    SYNC_CHECK_TOKENS = 8
 
     separators: list[ChunkSeparator] = field(
         default=Factory(lambda self: self.DEFAULT_SEPARATORS, takes_self=True), kw_only=True
@@ -18,11 +35,255 @@ class BaseChunker(ABC):
         default=Factory(lambda: OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)), kw_only=True
     )
     max_tokens: int = field(default=Factory(lambda self: self.tokenizer.max_tokens, takes_self=True), kw_only=True)
+    linear: bool = field(default=False, kw_only=True)
+    overlap_tokens: int = field(default=0, kw_only=True)
+    stream_buffer_size: int = field(default=65536, kw_only=True)
+
+    @overlap_tokens.validator  # pyright: ignore
+    def validate_overlap_tokens(self, _, overlap_tokens: int) -> None:
+        if overlap_tokens < 0 or (overlap_tokens > 0 and overlap_tokens >= self.max_tokens):
+            raise ValueError("overlap_tokens must be at least 0 and less than max_tokens.")
 
     def chunk(self, text: TextArtifact | str) -> list[TextArtifact]:
         text = text.value if isinstance(text, TextArtifact) else text
 
-        return [TextArtifact(c) for c in self._chunk_recursively(text)]
+        return self._chunk(text)
+
+    def chunk_stream(self, stream: Iterable[str] | IO) -> Iterator[TextArtifact]:
+        """Chunks text read incrementally from a file-like object or an iterable of strings.
+
+        Chunks are yielded while the stream is read, so only about `stream_buffer_size` characters past the
+        current chunk are held in memory at once.
+
+        In linear mode a chunk is only yielded once `stream_buffer_size // 2` characters past the end of its token window
+        have been read, and the buffer is only trimmed at a token that the tokenizer splits the same way when it starts
+        there. The chunks and their offsets are then the same as chunking the whole text at once, unless a single word
+        or run of whitespace is longer than that look-ahead.
+        """
+        if hasattr(stream, "read"):
+            texts = iter(lambda: stream.read(self.stream_buffer_size), "")
+        else:
+            texts = iter(stream)
+
+        buffer = ""
+        start = 0
+        previous_end = 0
+        char_offset = 0
+        token_offset = 0
+
+        for text in texts:
+            buffer += text
+
+            # Only chunk again once enough new text has been read after the carried over text.
+            if len(buffer) - start < self.stream_buffer_size:
+                continue
+
+            token_offsets = self._token_offsets(buffer)
+
+            if token_offsets is None:
+                index = self._split_index(buffer, 0, len(buffer))
+                head = buffer[:index].strip()
+
+                if head:
+                    yield from (TextArtifact(c) for c in self._chunk_recursively(head))
+
+                buffer = buffer[index:]
+            else:
+                # Tokens near the end of the buffer can still merge with text that hasn't been read yet.
+                spans, start, previous_end = self._split_linearly(
+                    buffer, token_offsets, start, previous_end, limit=len(buffer) - self.stream_buffer_size // 2
+                )
+
+                yield from (self._span_to_artifact(buffer, span, char_offset, token_offset) for span in spans)
+
+                # Overlapping chunks look back overlap_tokens tokens from the end of the chunk at start.
+                sync_token = self._sync_token(
+                    buffer, token_offsets, bisect.bisect_right(token_offsets, start) - 1 - self.overlap_tokens
+                )
+                sync_char = token_offsets[sync_token]
+                buffer = buffer[sync_char:]
+                start -= sync_char
+                previous_end -= sync_char
+                char_offset += sync_char
+                token_offset += sync_token
+
+        if buffer.strip():
+            yield from self._chunk(buffer, char_offset, token_offset, start, previous_end)
+
+    def _chunk(
+        self, text: str, char_offset: int = 0, token_offset: int = 0, start: int = 0, previous_end: int = 0
+    ) -> list[TextArtifact]:
+        token_offsets = self._token_offsets(text)
+
+        if token_offsets is None:
+            return [TextArtifact(c) for c in self._chunk_recursively(text)]
+        else:
+            spans, _, _ = self._split_linearly(text, token_offsets, start, previous_end)
+
+            return [self._span_to_artifact(text, span, char_offset, token_offset) for span in spans]
+
+    def _token_offsets(self, text: str) -> Optional[list[int]]:
+        """Returns the token offsets of the text, or `None` if it should be chunked recursively."""
+        if not self.linear and not self.overlap_tokens:
+            return None
+
+        try:
+            return self.tokenizer.token_offsets(text)
+        except NotImplementedError:
+            if self.overlap_tokens:
+                raise ValueError("overlap_tokens requires a tokenizer that supports token_offsets().")
+
+            return None
+
+    def _split_linearly(
+        self, text: str, token_offsets: list[int], start: int = 0, previous_end: int = 0, limit: Optional[int] = None
+    ) -> tuple[list[tuple[int, int, int, int]], int, int]:
+        """Returns the start and end character and token offsets of the chunks of the text in a single pass.
+
+        Chunks are split from `start` and after `previous_end`, the end of the chunk the text overlaps with, if any.
+        If `limit` is set, splitting stops at the first chunk whose token window reaches `limit`.
+
+        Returns:
+            The chunk spans, and the `start` and `previous_end` to resume splitting from.
+        """
+        spans = []
+
+        while start < len(text):
+            first_token = bisect.bisect_left(token_offsets, start)
+            end_token = first_token + self.max_tokens
+
+            if limit is not None and (end_token >= len(token_offsets) or token_offsets[end_token] >= limit):
+                break
+
+            while True:
+                # The window ends where the token max_tokens tokens after the first token of the window starts.
+                end = token_offsets[end_token] if end_token < len(token_offsets) else len(text)
+
+                if end < len(text):
+                    end = self._split_index(text, start, max(end, start + 1), previous_end)
+
+                chunk_start, chunk_end = self._strip_span(text, start, end)
+
+                if chunk_start == chunk_end or end_token <= first_token + 1:
+                    break
+
+                # Tokens can merge differently at chunk boundaries, so the chunk can still be a few tokens too long.
+                overflow = self.tokenizer.count_tokens(text[chunk_start:chunk_end]) - self.max_tokens
+
+                if overflow <= 0:
+                    break
+                else:
+                    end_token = max(end_token - overflow, first_token + 1)
+
+            if chunk_start < chunk_end:
+                spans.append(
+                    (
+                        chunk_start,
+                        chunk_end,
+                        bisect.bisect_right(token_offsets, chunk_start) - 1,
+                        bisect.bisect_left(token_offsets, chunk_end),
+                    )
+                )
+
+            if end >= len(text):
+                start = len(text)
+
+                break
+
+            previous_end = self._whitespace_end(text, chunk_end)
+            overlap_start = self._overlap_start(text, token_offsets, chunk_end) if self.overlap_tokens else end
+            start = overlap_start if start < overlap_start < end else end
+
+        return spans, start, previous_end
+
+    def _sync_token(self, text: str, token_offsets: list[int], max_token: int) -> int:
+        """Returns the last token up to `max_token` that the text can be tokenized again from.
+
+        Tokenizing from the middle of a word can split it differently, so a token is only used if tokenizing from it
+        gives the same next `SYNC_CHECK_TOKENS` tokens. Falls back to the first token.
+        """
+        for token in range(min(max_token, len(token_offsets) - 1), 0, -1):
+            check_end = token + self.SYNC_CHECK_TOKENS
+
+            if check_end >= len(token_offsets):
+                continue
+
+            # The last token of the check window is cut off, so only the tokens before it are compared.
+            expected = [offset - token_offsets[token] for offset in token_offsets[token : check_end - 1]]
+            offsets = self.tokenizer.token_offsets(text[token_offsets[token] : token_offsets[check_end]])
+
+            if offsets[: len(expected)] == expected:
+                return token
+
+        return 0
+
+    def _overlap_start(self, text: str, token_offsets: list[int], chunk_end: int) -> int:
+        """Returns the start of the chunk overlapping the last `overlap_tokens` tokens of the chunk ending at `chunk_end`.
+
+        The overlap is moved forward to the nearest separator so that the chunk doesn't start in the middle of a word.
+        """
+        start = token_offsets[max(bisect.bisect_left(token_offsets, chunk_end) - self.overlap_tokens, 0)]
+        split_indices = []
+
+        for separator in self.separators:
+            index = text.find(separator.value, start, chunk_end)
+
+            if index != -1:
+                split_indices.append(index if separator.is_prefix else index + len(separator.value))
+
+        return min(split_indices, default=start)
+
+    def _whitespace_end(self, text: str, index: int) -> int:
+        while index < len(text) and text[index].isspace():
+            index += 1
+
+        return index
+
+    def _span_to_artifact(
+        self, text: str, span: tuple[int, int, int, int], char_offset: int, token_offset: int
+    ) -> TextArtifact:
+        start_char, end_char, start_token, end_token = span
+
+        return TextArtifact(
+            text[start_char:end_char],
+            start_char=char_offset + start_char,
+            end_char=char_offset + end_char,
+            start_token=token_offset + start_token,
+            end_token=token_offset + end_token,
+        )
+
+    def _strip_span(self, text: str, start: int, end: int) -> tuple[int, int]:
+        chunk = text[start:end]
+        stripped = chunk.lstrip()
+
+        if stripped:
+            return end - len(stripped), start + len(chunk.rstrip())
+        else:
+            return end, end
+
+    def _split_index(self, text: str, start: int, end: int, min_index: int = 0) -> int:
+        """Returns the index to split `text[start:end]` at, using the highest priority separator in the window.
+
+        Only split points after `min_index` are considered, so that overlapping chunks always extend past the end of
+        the previous chunk.
+        """
+        for separator in self.separators:
+            index = text.rfind(separator.value, start, end)
+
+            if index == -1:
+                continue
+
+            if separator.is_prefix:
+                # Don't split inside a run of the separator, such as "###" when splitting at "##".
+                while index > start and text.startswith(separator.value, index - 1):
+                    index -= 1
+            else:
+                index += len(separator.value)
+
+            if index > min_index and text[start:index].strip():
+                return index
+
+        return end
 
     def _chunk_recursively(self, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
         token_count = self.tokenizer.count_tokens(chunk)
@@ -21,9 +21,11 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         session: Optionally provide custom `boto3.Session`.
         tokenizer: Optionally provide custom `BedrockCohereTokenizer`.
         bedrock_client: Optionally provide custom `bedrock-runtime` client.
+        batch_size: Maximum number of texts per request. Defaults to the model limit of 96.
     """
 
     DEFAULT_MODEL = "cohere.embed-english-v3"
+    DEFAULT_BATCH_SIZE = 96
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True)
     input_type: str = field(default="search_query", kw_only=True)
@@ -34,13 +36,17 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
     bedrock_client: Any = field(
         default=Factory(lambda self: self.session.client("bedrock-runtime"), takes_self=True), kw_only=True
     )
+    batch_size: int = field(default=DEFAULT_BATCH_SIZE, kw_only=True)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        payload = {"input_type": self.input_type, "texts": [chunk]}
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        payload = {"input_type": self.input_type, "texts": chunks}
 
         response = self.bedrock_client.invoke_model(
             body=json.dumps(payload), modelId=self.model, accept="*/*", contentType="application/json"
         )
         response_body = json.loads(response.get("body").read())
 
-        return response_body.get("embeddings")[0]
+        return response_body.get("embeddings")
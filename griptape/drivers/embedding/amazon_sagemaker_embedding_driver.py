@@ -29,3 +29,17 @@ class AmazonSageMakerEmbeddingDriver(BaseMultiModelEmbeddingDriver):
 
         response = json.loads(endpoint_response.get("Body").read().decode("utf-8"))
         return self.embedding_model_driver.process_output(response)
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        try:
+            payload = self.embedding_model_driver.chunks_to_model_params(chunks)
+        except NotImplementedError:
+            return super().try_embed_chunks(chunks)
+
+        endpoint_response = self.sagemaker_client.invoke_endpoint(
+            EndpointName=self.model, ContentType="application/x-text", Body=json.dumps(payload).encode("utf-8")
+        )
+
+        response = json.loads(endpoint_response.get("Body").read().decode("utf-8"))
+
+        return self.embedding_model_driver.process_batch_output(response)
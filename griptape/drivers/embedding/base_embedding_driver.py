@@ -1,8 +1,10 @@
 from __future__ import annotations
 import numpy as np
+from concurrent import futures
 from typing import Optional
 from abc import ABC, abstractmethod
-from attr import define, field
+from attr import define, field, Factory
+from griptape import utils
 from griptape.artifacts import TextArtifact
 from griptape.mixins import ExponentialBackoffMixin
 from griptape.tokenizers import BaseTokenizer
@@ -16,10 +18,18 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        batch_size: Maximum number of chunks sent in a single call by `embed_strings()`.
+        max_batch_tokens: Optional maximum number of tokens sent in a single call by `embed_strings()`.
+        futures_executor: Executor embedding the chunks of a batch concurrently for models without batch inputs.
     """
 
+    DEFAULT_BATCH_SIZE = 100
+
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
+    batch_size: int = field(default=DEFAULT_BATCH_SIZE, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=None, kw_only=True)
+    futures_executor: futures.Executor = field(default=Factory(lambda: futures.ThreadPoolExecutor()), kw_only=True)
     chunker: BaseChunker = field(init=False)
 
     def __attrs_post_init__(self) -> None:
@@ -40,27 +50,117 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         else:
             raise RuntimeError("Failed to embed string.")
 
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embeds many strings with as few calls to the embedding model as possible.
+
+        Strings longer than the tokenizer's `max_tokens` are chunked and their chunk embeddings are averaged like in
+        `embed_string()`. Chunks of all strings are embedded in batches of up to `batch_size` chunks and, if set,
+        `max_batch_tokens` tokens with `try_embed_chunks()`.
+
+        Returns:
+            Embeddings in the order of the input strings.
+        """
+        # Each chunk is a tuple of (string index, chunk, token count).
+        chunks: list[tuple[int, str, int]] = []
+
+        for i, string in enumerate(strings):
+            token_count = self.tokenizer.count_tokens(string) if self.tokenizer else 0
+
+            if self.tokenizer and token_count > self.tokenizer.max_tokens:
+                chunks.extend(
+                    (i, chunk.value, chunk.token_count(self.tokenizer) if self.max_batch_tokens is not None else 0)
+                    for chunk in self.chunker.chunk(string)
+                )
+            else:
+                chunks.append((i, string, token_count))
+
+        chunk_embeddings = [
+            embedding
+            for batch in self._batch_chunks([(chunk, token_count) for _, chunk, token_count in chunks])
+            for embedding in self._embed_batch(batch)
+        ]
+
+        string_chunks: list[list[tuple[str, list[float]]]] = [[] for _ in strings]
+        for (i, chunk, _), embedding in zip(chunks, chunk_embeddings):
+            string_chunks[i].append((chunk, embedding))
+
+        return [
+            embeddings[0][1]
+            if len(embeddings) == 1
+            else self._average_embeddings([e for _, e in embeddings], [len(c) for c, _ in embeddings])
+            for embeddings in string_chunks
+        ]
+
     @abstractmethod
     def try_embed_chunk(self, chunk: str) -> list[float]:
         ...
 
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Embeds a batch of chunks. Drivers for models accepting several inputs per call should override this.
+
+        By default, chunks are embedded concurrently with `try_embed_chunk()` on `futures_executor`.
+        """
+        if len(chunks) == 1:
+            return [self.try_embed_chunk(chunks[0])]
+        else:
+            return utils.execute_futures_list([self.futures_executor.submit(self.try_embed_chunk, c) for c in chunks])
+
+    def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        for attempt in self.retrying():
+            with attempt:
+                return self.try_embed_chunks(batch)
+        else:
+            raise RuntimeError("Failed to embed strings.")
+
+    def _batch_chunks(self, chunks: list[tuple[str, int]]) -> list[list[str]]:
+        """Groups chunks into batches of up to `batch_size` chunks and `max_batch_tokens` tokens."""
+        batches = []
+        batch = []
+        batch_tokens = 0
+
+        for chunk, token_count in chunks:
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.max_batch_tokens is not None and batch_tokens + token_count > self.max_batch_tokens)
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+
+            batch.append(chunk)
+            batch_tokens += token_count
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
     def _embed_long_string(self, string: str) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
+        Chunks are embedded in batches with `try_embed_chunks()`, so they are sent in a single call to models
+        accepting several inputs and concurrently otherwise.
+
         Adapted from: https://github.com/openai/openai-cookbook/blob/683e5f5a71bc7a1b0e5b7a35e087f53cc55fceea/examples/Embedding_long_inputs.ipynb
         """
         chunks = self.chunker.chunk(string)
+        batches = self._batch_chunks(
+            [
+                (chunk.value, chunk.token_count(self.tokenizer) if self.max_batch_tokens is not None else 0)
+                for chunk in chunks
+            ]
+        )
+
+        embedding_chunks = [embedding for batch in batches for embedding in self.try_embed_chunks(batch)]
+        length_chunks = [len(chunk) for chunk in chunks]
 
-        embedding_chunks = []
-        length_chunks = []
-        for chunk in chunks:
-            embedding_chunks.append(self.try_embed_chunk(chunk.value))
-            length_chunks.append(len(chunk))
+        return self._average_embeddings(embedding_chunks, length_chunks)
 
+    def _average_embeddings(self, embedding_chunks: list[list[float]], length_chunks: list[int]) -> list[float]:
         # generate weighted averages
-        embedding_chunks = np.average(embedding_chunks, axis=0, weights=length_chunks)
+        embedding = np.average(embedding_chunks, axis=0, weights=length_chunks)
 
         # normalize length to 1
-        embedding_chunks = embedding_chunks / np.linalg.norm(embedding_chunks)
+        embedding = embedding / np.linalg.norm(embedding)
 
-        return embedding_chunks.tolist()
+        return embedding.tolist()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
+from attr import define, field, Factory
+from griptape.drivers import BaseEmbeddingDriver
+from griptape.utils import str_to_hash
+
+
+@define
+class CachedEmbeddingDriver(BaseEmbeddingDriver):
+    """An Embedding Driver that caches the embeddings of another Embedding Driver.
+
+    Embeddings are keyed by the model name and the SHA-256 hash of the embedded string. Lookups go through an
+    in-memory LRU tier first and then through an optional SQLite tier, embeddings found on disk are promoted to memory.
+    Strings missing from both tiers are embedded with the wrapped driver, in bulk when going through `embed_strings()`.
+
+    Attributes:
+        embedding_driver: The Embedding Driver to cache embeddings of.
+        model: The model of the wrapped driver, used in cache keys.
+        max_cache_size: Maximum number of embeddings kept in memory.
+        persist_path: Optional path of a SQLite database to persist embeddings to as float32 blobs.
+        hits: Number of embeddings served from the cache.
+        misses: Number of embeddings computed by the wrapped driver.
+    """
+
+    embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    model: str = field(
+        default=Factory(lambda self: self.embedding_driver.model, takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    max_cache_size: int = field(default=10000, kw_only=True, metadata={"serializable": True})
+    persist_path: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _cache: OrderedDict[str, list[float]] = field(factory=OrderedDict, init=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False, eq=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        super().__attrs_post_init__()
+
+        if self.persist_path is not None:
+            if os.path.dirname(self.persist_path):
+                os.makedirs(os.path.dirname(self.persist_path), exist_ok=True)
+
+            self._connection = sqlite3.connect(self.persist_path, check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB)")
+            self._connection.commit()
+
+    def embed_string(self, string: str) -> list[float]:
+        return self.embed_strings([string])[0]
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        keys = [self._cache_key(string) for string in strings]
+        embeddings: dict[str, list[float]] = {}
+
+        with self._lock:
+            for key in keys:
+                if key not in embeddings:
+                    embedding = self._get(key)
+
+                    if embedding is not None:
+                        embeddings[key] = embedding
+
+        missing = {key: string for key, string in zip(keys, strings) if key not in embeddings}
+        computed = self.embedding_driver.embed_strings(list(missing.values())) if missing else []
+
+        with self._lock:
+            for key, embedding in zip(missing.keys(), computed):
+                self._put(key, embedding)
+                embeddings[key] = embedding
+
+            if missing and self._connection is not None:
+                self._connection.commit()
+
+            self.hits += len(strings) - len(missing)
+            self.misses += len(missing)
+
+        return [embeddings[key] for key in keys]
+
+    def try_embed_chunk(self, chunk: str) -> list[float]:
+        return self.embedding_driver.try_embed_chunk(chunk)
+
+    def clear(self) -> None:
+        """Clears both cache tiers and resets the hit and miss counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM embeddings")
+                self._connection.commit()
+
+    def _cache_key(self, string: str) -> str:
+        return f"{self.model}:{str_to_hash(string)}"
+
+    def _get(self, key: str) -> Optional[list[float]]:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+
+            return self._cache[key]
+        elif self._connection is not None:
+            row = self._connection.execute("SELECT embedding FROM embeddings WHERE key = ?", (key,)).fetchone()
+
+            if row is not None:
+                embedding = np.frombuffer(row[0], dtype=np.float32).tolist()
+                self._put_in_memory(key, embedding)
+
+                return embedding
+
+        return None
+
+    def _put(self, key: str, embedding: list[float]) -> None:
+        self._put_in_memory(key, embedding)
+
+        if self._connection is not None:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                (key, np.asarray(embedding, dtype=np.float32).tobytes()),
+            )
+
+    def _put_in_memory(self, key: str, embedding: list[float]) -> None:
+        self._cache[key] = embedding
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
@@ -21,9 +21,13 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         azure_ad_token: An optional Azure Active Directory token.
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
+        batch_size: Maximum number of inputs per embeddings request. Defaults to the API limit of 2048.
+        max_batch_tokens: Maximum number of tokens per embeddings request. Defaults to the API limit of 300,000.
     """
 
     DEFAULT_MODEL = "text-embedding-ada-002"
+    DEFAULT_BATCH_SIZE = 2048
+    DEFAULT_MAX_BATCH_TOKENS = 300000
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     base_url: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
@@ -38,13 +42,24 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
     tokenizer: OpenAiTokenizer = field(
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True), kw_only=True
     )
+    batch_size: int = field(default=DEFAULT_BATCH_SIZE, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=DEFAULT_MAX_BATCH_TOKENS, kw_only=True)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
+        return self.client.embeddings.create(**self._params(self._clean_chunk(chunk))).data[0].embedding
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        data = self.client.embeddings.create(**self._params([self._clean_chunk(chunk) for chunk in chunks])).data
+
+        return [embedding.embedding for embedding in sorted(data, key=lambda embedding: embedding.index)]
+
+    def _clean_chunk(self, chunk: str) -> str:
         # Address a performance issue in older ada models
         # https://github.com/openai/openai-python/issues/418#issuecomment-1525939500
         if self.model.endswith("001"):
             chunk = chunk.replace("\n", " ")
-        return self.client.embeddings.create(**self._params(chunk)).data[0].embedding
 
-    def _params(self, chunk: str) -> dict:
+        return chunk
+
+    def _params(self, chunk: str | list[str]) -> dict:
         return {"input": chunk, "model": self.model}
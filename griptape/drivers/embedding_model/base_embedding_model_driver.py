@@ -11,3 +11,14 @@ class BaseEmbeddingModelDriver(ABC):
     @abstractmethod
     def process_output(self, output: dict) -> list[float]:
         ...
+
+    def chunks_to_model_params(self, chunks: list[str]) -> dict:
+        """Builds model params for embedding several chunks in one call.
+
+        Raises:
+            NotImplementedError: The model does not accept batch inputs.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support batch inputs.")
+
+    def process_batch_output(self, output: dict) -> list[list[float]]:
+        raise NotImplementedError(f"{self.__class__.__name__} does not support batch inputs.")
@@ -9,3 +9,9 @@ class SageMakerTensorFlowHubEmbeddingModelDriver(BaseEmbeddingModelDriver):
 
     def process_output(self, output: dict) -> list[float]:
         return output["embedding"]
+
+    def chunks_to_model_params(self, chunks: list[str]) -> dict:
+        return {"text_inputs": chunks}
+
+    def process_batch_output(self, output: dict) -> list[list[float]]:
+        return output["embedding"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-from collections.abc import Iterator
+import asyncio
+from typing import TYPE_CHECKING, Optional
+from collections.abc import AsyncIterator, Iterator
 from attr import define, field, Factory
 from griptape.artifacts import TextArtifact
 from griptape.utils import PromptStack, import_optional_dependency
@@ -8,7 +9,7 @@ from griptape.drivers import BasePromptDriver
 from griptape.tokenizers import AnthropicTokenizer
 
 if TYPE_CHECKING:
-    from anthropic import Anthropic
+    from anthropic import Anthropic, AsyncAnthropic
 
 
 @define
@@ -18,6 +19,7 @@ class AnthropicPromptDriver(BasePromptDriver):
         api_key: Anthropic API key.
         model: Anthropic model name.
         client: Custom `Anthropic` client.
+        async_client: Custom `AsyncAnthropic` client used by `arun()` and `astream()`. Created on first use if not provided.
         tokenizer: Custom `AnthropicTokenizer`.
     """
 
@@ -29,10 +31,18 @@ class AnthropicPromptDriver(BasePromptDriver):
         ),
         kw_only=True,
     )
+    _async_client: Optional[AsyncAnthropic] = field(default=None, kw_only=True, alias="async_client")
     tokenizer: AnthropicTokenizer = field(
         default=Factory(lambda self: AnthropicTokenizer(model=self.model), takes_self=True), kw_only=True
     )
 
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        if self._async_client is None:
+            self._async_client = import_optional_dependency("anthropic").AsyncAnthropic(api_key=self.api_key)
+
+        return self._async_client
+
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
         response = self.client.completions.create(**self._base_params(prompt_stack))
 
@@ -44,6 +54,19 @@ class AnthropicPromptDriver(BasePromptDriver):
         for chunk in response:
             yield TextArtifact(value=chunk.completion)
 
+    async def try_arun(self, prompt_stack: PromptStack) -> TextArtifact:
+        params = await asyncio.to_thread(self._base_params, prompt_stack)
+        response = await self.async_client.completions.create(**params)
+
+        return TextArtifact(value=response.completion)
+
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[TextArtifact]:
+        params = await asyncio.to_thread(self._base_params, prompt_stack)
+        response = await self.async_client.completions.create(**params, stream=True)
+
+        async for chunk in response:
+            yield TextArtifact(value=chunk.completion)
+
     def default_prompt_stack_to_string_converter(self, prompt_stack: PromptStack) -> str:
         prompt_lines = []
 
@@ -15,6 +15,7 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
         client: An `openai.AzureOpenAI` client.
+        async_client: An `openai.AsyncAzureOpenAI` client. Created on first use if not provided.
     """
 
     azure_deployment: str = field(kw_only=True, metadata={"serializable": True})
@@ -37,6 +38,17 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
         )
     )
 
+    def default_async_client(self) -> openai.AsyncAzureOpenAI:
+        return openai.AsyncAzureOpenAI(
+            organization=self.organization,
+            api_key=self.api_key,
+            api_version=self.api_version,
+            azure_endpoint=self.azure_endpoint,
+            azure_deployment=self.azure_deployment,
+            azure_ad_token=self.azure_ad_token,
+            azure_ad_token_provider=self.azure_ad_token_provider,
+        )
+
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = super()._base_params(prompt_stack)
         # TODO: Add `seed` parameter once Azure supports it.
@@ -1,7 +1,8 @@
 from __future__ import annotations
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional, Callable, Tuple, Type
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from attr import define, field, Factory
 from griptape.events import StartPromptEvent, FinishPromptEvent, CompletionChunkEvent
 from griptape.memory import meta
@@ -54,6 +55,14 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     def token_count(self, prompt_stack: PromptStack) -> int:
         return self.tokenizer.count_tokens(self.prompt_stack_to_string(prompt_stack))
 
+    def input_token_counts(self, prompt_stack: PromptStack) -> Optional[list[int]]:
+        """Returns the number of tokens each input adds to `token_count()`, or `None` if it doesn't add up per input.
+
+        Drivers that count tokens of the whole prompt string return `None`, since an input's tokens depend on its
+        neighbours there.
+        """
+        return None
+
     def before_run(self, prompt_stack: PromptStack) -> None:
         if self.structure:
             self.structure.publish_event(
@@ -92,6 +101,50 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         else:
             raise Exception("prompt driver failed after all retry attempts")
 
+    async def arun(self, prompt_stack: PromptStack) -> TextArtifact:
+        """Runs the prompt like `run()` without blocking the event loop, including between retry attempts.
+
+        `before_run()` and `after_run()`, which count tokens, run in a thread.
+        """
+        async for attempt in self.aretrying():
+            with attempt:
+                await asyncio.to_thread(self.before_run, prompt_stack)
+
+                if self.stream:
+                    tokens = []
+                    async for chunk in self.try_astream(prompt_stack):
+                        if self.structure:
+                            self.structure.publish_event(CompletionChunkEvent(token=chunk.value))
+                        tokens.append(chunk.value)
+                    result = TextArtifact(value="".join(tokens).strip())
+                else:
+                    result = await self.try_arun(prompt_stack)
+                    result.value = result.value.strip()
+
+                await asyncio.to_thread(self.after_run, result)
+
+                return result
+        else:
+            raise Exception("prompt driver failed after all retry attempts")
+
+    async def astream(self, prompt_stack: PromptStack) -> AsyncIterator[TextArtifact]:
+        """Yields the completion chunks as they arrive, regardless of `stream`.
+
+        Publishes the same events as `run()` with streaming enabled. Failed streams aren't retried because chunks may
+        have been consumed already.
+        """
+        await asyncio.to_thread(self.before_run, prompt_stack)
+
+        tokens = []
+        async for chunk in self.try_astream(prompt_stack):
+            if self.structure:
+                self.structure.publish_event(CompletionChunkEvent(token=chunk.value))
+            tokens.append(chunk.value)
+
+            yield chunk
+
+        await asyncio.to_thread(self.after_run, TextArtifact(value="".join(tokens).strip()))
+
     def default_prompt_stack_to_string_converter(self, prompt_stack: PromptStack) -> str:
         prompt_lines = []
 
@@ -114,3 +167,20 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     @abstractmethod
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[TextArtifact]:
         ...
+
+    async def try_arun(self, prompt_stack: PromptStack) -> TextArtifact:
+        """Runs `try_run()` in a thread. Drivers with asynchronous clients override it."""
+        return await asyncio.to_thread(self.try_run, prompt_stack)
+
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[TextArtifact]:
+        """Iterates `try_stream()` in a thread. Drivers with asynchronous clients override it."""
+        chunks = self.try_stream(prompt_stack)
+        end = object()
+
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, end)
+
+            if chunk is end:
+                break
+            else:
+                yield chunk
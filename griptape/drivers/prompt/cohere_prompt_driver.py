@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-from collections.abc import Iterator
+import asyncio
+from typing import TYPE_CHECKING, Optional
+from collections.abc import AsyncIterator, Iterator
 from attr import define, field, Factory
 from griptape.artifacts import TextArtifact
 from griptape.drivers import BasePromptDriver
@@ -8,7 +9,7 @@ from griptape.tokenizers import CohereTokenizer
 from griptape.utils import PromptStack, import_optional_dependency
 
 if TYPE_CHECKING:
-    from cohere import Client
+    from cohere import AsyncClient, Client
 
 
 @define
@@ -18,6 +19,7 @@ class CoherePromptDriver(BasePromptDriver):
         api_key: Cohere API key.
         model: 	Cohere model name.
         client: Custom `cohere.Client`.
+        async_client: Custom `cohere.AsyncClient` used by `arun()` and `astream()`. Created on first use if not provided.
         tokenizer: Custom `CohereTokenizer`.
     """
 
@@ -27,14 +29,41 @@ class CoherePromptDriver(BasePromptDriver):
         default=Factory(lambda self: import_optional_dependency("cohere").Client(self.api_key), takes_self=True),
         kw_only=True,
     )
+    _async_client: Optional[AsyncClient] = field(default=None, kw_only=True, alias="async_client")
     tokenizer: CohereTokenizer = field(
         default=Factory(lambda self: CohereTokenizer(model=self.model, client=self.client), takes_self=True),
         kw_only=True,
     )
 
+    @property
+    def async_client(self) -> AsyncClient:
+        if self._async_client is None:
+            self._async_client = import_optional_dependency("cohere").AsyncClient(self.api_key)
+
+        return self._async_client
+
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
-        result = self.client.generate(**self._base_params(prompt_stack))
+        return self._process_result(self.client.generate(**self._base_params(prompt_stack)))
+
+    def try_stream(self, prompt_stack: PromptStack) -> Iterator[TextArtifact]:
+        result = self.client.generate(**self._base_params(prompt_stack), stream=True)
+
+        for chunk in result:
+            yield TextArtifact(value=chunk.text)
+
+    async def try_arun(self, prompt_stack: PromptStack) -> TextArtifact:
+        params = await asyncio.to_thread(self._base_params, prompt_stack)
+
+        return self._process_result(await self.async_client.generate(**params))
 
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[TextArtifact]:
+        params = await asyncio.to_thread(self._base_params, prompt_stack)
+        result = await self.async_client.generate(**params, stream=True)
+
+        async for chunk in result:
+            yield TextArtifact(value=chunk.text)
+
+    def _process_result(self, result) -> TextArtifact:
         if result.generations:
             if len(result.generations) == 1:
                 generation = result.generations[0]
@@ -45,12 +74,6 @@ class CoherePromptDriver(BasePromptDriver):
         else:
             raise Exception("model response is empty")
 
-    def try_stream(self, prompt_stack: PromptStack) -> Iterator[TextArtifact]:
-        result = self.client.generate(**self._base_params(prompt_stack), stream=True)
-
-        for chunk in result:
-            yield TextArtifact(value=chunk.text)
-
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         prompt = self.prompt_stack_to_string(prompt_stack)
         return {
@@ -1,6 +1,7 @@
 from __future__ import annotations
+import asyncio
 from typing import Optional, Any, Literal
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 import openai
 from attr import define, field, Factory
 from griptape.artifacts import TextArtifact
@@ -20,6 +21,7 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         api_key: An optional OpenAi API key. If not provided, the `OPENAI_API_KEY` environment variable will be used.
         organization: An optional OpenAI organization. If not provided, the `OPENAI_ORG_ID` environment variable will be used.
         client: An `openai.OpenAI` client.
+        async_client: An `openai.AsyncOpenAI` client used by `arun()` and `astream()`. Created on first use if not provided.
         model: An OpenAI model name.
         tokenizer: An `OpenAiTokenizer`.
         user: A user id. Can be used to track requests by user.
@@ -43,6 +45,7 @@ class OpenAiChatPromptDriver(BasePromptDriver):
             takes_self=True,
         )
     )
+    _async_client: Optional[openai.AsyncOpenAI] = field(default=None, kw_only=True, alias="async_client")
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: BaseTokenizer = field(
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True), kw_only=True
@@ -72,36 +75,72 @@ class OpenAiChatPromptDriver(BasePromptDriver):
     _ratelimit_tokens_remaining: Optional[int] = field(init=False, default=None)
     _ratelimit_tokens_reset_at: Optional[datetime] = field(init=False, default=None)
 
+    @property
+    def async_client(self) -> openai.AsyncOpenAI:
+        if self._async_client is None:
+            self._async_client = self.default_async_client()
+
+        return self._async_client
+
+    def default_async_client(self) -> openai.AsyncOpenAI:
+        return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, organization=self.organization)
+
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
         result = self.client.chat.completions.with_raw_response.create(**self._base_params(prompt_stack))
 
-        self._extract_ratelimit_metadata(result)
-
-        parsed_result = result.parse()
-        if len(parsed_result.choices) == 1:
-            return TextArtifact(value=parsed_result.choices[0].message.content.strip())
-        else:
-            raise Exception("Completion with more than one choice is not supported yet.")
+        return self._process_result(result)
 
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[TextArtifact]:
         result = self.client.chat.completions.create(**self._base_params(prompt_stack), stream=True)
 
         for chunk in result:
-            if len(chunk.choices) == 1:
-                delta = chunk.choices[0].delta
-            else:
-                raise Exception("Completion with more than one choice is not supported yet.")
+            artifact = self._process_chunk(chunk)
+
+            if artifact is not None:
+                yield artifact
+
+    async def try_arun(self, prompt_stack: PromptStack) -> TextArtifact:
+        params = await asyncio.to_thread(self._base_params, prompt_stack)
+        result = await self.async_client.chat.completions.with_raw_response.create(**params)
 
-            if delta.content is not None:
-                delta_content = delta.content
+        return self._process_result(result)
 
-                yield TextArtifact(value=delta_content)
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[TextArtifact]:
+        params = await asyncio.to_thread(self._base_params, prompt_stack)
+        result = await self.async_client.chat.completions.create(**params, stream=True)
+
+        async for chunk in result:
+            artifact = self._process_chunk(chunk)
+
+            if artifact is not None:
+                yield artifact
 
     def token_count(self, prompt_stack: PromptStack) -> int:
         if isinstance(self.tokenizer, OpenAiTokenizer):
-            return self.tokenizer.count_tokens(self._prompt_stack_to_messages(prompt_stack))
+            # The tokens of each message value are counted separately, so the count of the messages without their
+            # content plus the memoized content token counts is exact.
+            empty_messages = [{**m, "content": ""} for m in self._prompt_stack_to_messages(prompt_stack)]
+
+            return self.tokenizer.count_tokens(empty_messages) + prompt_stack.token_count(self.tokenizer)
         else:
-            return self.tokenizer.count_tokens(self.prompt_stack_to_string(prompt_stack))
+            return super().token_count(prompt_stack)
+
+    def input_token_counts(self, prompt_stack: PromptStack) -> Optional[list[int]]:
+        if isinstance(self.tokenizer, OpenAiTokenizer):
+            # A message adds the tokens of its role and formatting on top of its content, which only depend on the role.
+            messages = self._prompt_stack_to_messages(prompt_stack)
+            empty_messages_count = self.tokenizer.count_tokens([])
+            role_token_counts = {
+                role: self.tokenizer.count_tokens([{"role": role, "content": ""}]) - empty_messages_count
+                for role in {m["role"] for m in messages}
+            }
+
+            return [
+                role_token_counts[m["role"]] + i.token_count(self.tokenizer)
+                for m, i in zip(messages, prompt_stack.inputs)
+            ]
+        else:
+            return super().input_token_counts(prompt_stack)
 
     def _prompt_stack_to_messages(self, prompt_stack: PromptStack) -> list[dict[str, Any]]:
         return [{"role": self.__to_openai_role(i), "content": i.content} for i in prompt_stack.inputs]
@@ -129,6 +168,26 @@ class OpenAiChatPromptDriver(BasePromptDriver):
 
         return params
 
+    def _process_result(self, result) -> TextArtifact:
+        self._extract_ratelimit_metadata(result)
+
+        parsed_result = result.parse()
+        if len(parsed_result.choices) == 1:
+            return TextArtifact(value=parsed_result.choices[0].message.content.strip())
+        else:
+            raise Exception("Completion with more than one choice is not supported yet.")
+
+    def _process_chunk(self, chunk) -> Optional[TextArtifact]:
+        if len(chunk.choices) == 1:
+            delta = chunk.choices[0].delta
+        else:
+            raise Exception("Completion with more than one choice is not supported yet.")
+
+        if delta.content is not None:
+            return TextArtifact(value=delta.content)
+        else:
+            return None
+
     def __to_openai_role(self, prompt_input: PromptStack.Input) -> str:
         if prompt_input.is_system():
             return "system"
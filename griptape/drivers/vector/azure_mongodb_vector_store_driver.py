@@ -13,24 +13,23 @@ if TYPE_CHECKING:
 class AzureMongoDbVectorStoreDriver(MongoDbAtlasVectorStoreDriver):
     """A Vector Store Driver for CosmosDB with MongoDB vCore API."""
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         offset: Optional[int] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
-        """Queries the MongoDB collection for documents that match the provided query string.
+        """Queries the MongoDB collection for documents with vectors similar to the provided vector.
 
-        Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
+        Results can be customized based on parameters like count, namespace, metadata filter, inclusion of vectors,
+        offset, and index.
         """
         collection = self.get_collection()
 
-        # Using the embedding driver to convert the query string into a vector
-        vector = self.embedding_driver.embed_string(query)
-
         count = count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
         offset = offset if offset else 0
 
@@ -49,8 +48,8 @@ class AzureMongoDbVectorStoreDriver(MongoDbAtlasVectorStoreDriver):
             }
         )
 
-        if namespace:
-            pipeline.append({"$match": {"namespace": namespace}})
+        if namespace or filter:
+            pipeline.append({"$match": self._match_filter(namespace, filter)})
 
         pipeline.append({"$project": {"similarityScore": {"$meta": "searchScore"}, "document": "$$ROOT"}})
 
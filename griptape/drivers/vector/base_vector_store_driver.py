@@ -31,6 +31,7 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
 
     embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
     futures_executor: futures.Executor = field(default=Factory(lambda: futures.ThreadPoolExecutor()), kw_only=True)
+    batch_size: int = field(default=100, kw_only=True)
 
     def upsert_text_artifacts(
         self, artifacts: dict[str, list[TextArtifact]], meta: Optional[dict] = None, **kwargs
@@ -43,6 +44,36 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
             }
         )
 
+    def upsert_text_artifacts_batched(
+        self, artifacts: dict[str, list[TextArtifact]], meta: Optional[dict] = None, **kwargs
+    ) -> dict[str, list[str]]:
+        """Embeds and upserts Text Artifacts through the batch vector API.
+
+        Artifacts without an embedding are embedded in bulk with `BaseEmbeddingDriver.embed_strings()` and each
+        namespace is then written with [upsert_vectors][griptape.drivers.BaseVectorStoreDriver.upsert_vectors],
+        which sends `batch_size` vectors per backend call instead of one.
+
+        Returns:
+            Upserted vector IDs by namespace.
+        """
+        vectors_by_namespace = utils.execute_futures_dict(
+            {
+                namespace: self.futures_executor.submit(self._embed_text_artifacts, artifact_list)
+                for namespace, artifact_list in artifacts.items()
+            }
+        )
+
+        return {
+            namespace: self.upsert_vectors(
+                vectors_by_namespace[namespace],
+                vector_ids=[a.id for a in artifact_list],
+                namespace=namespace,
+                metas=[{**(meta if meta else {}), "artifact": a.to_json()} for a in artifact_list],
+                **kwargs,
+            )
+            for namespace, artifact_list in artifacts.items()
+        }
+
     def upsert_text_artifact(
         self, artifact: TextArtifact, namespace: Optional[str] = None, meta: Optional[dict] = None, **kwargs
     ) -> str:
@@ -77,6 +108,85 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
             **kwargs,
         )
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates many vectors in a single namespace.
+
+        Vectors are written in chunks of `batch_size` through
+        [try_upsert_vectors][griptape.drivers.BaseVectorStoreDriver.try_upsert_vectors].
+
+        Returns:
+            The vector IDs in input order.
+        """
+        vector_ids = vector_ids if vector_ids is not None else [None] * len(vectors)
+        metas = metas if metas is not None else [None] * len(vectors)
+
+        if not len(vectors) == len(vector_ids) == len(metas):
+            raise ValueError("vectors, vector_ids, and metas must have the same length.")
+
+        upserted_ids = []
+
+        for i in range(0, len(vectors), self.batch_size):
+            upserted_ids.extend(
+                self.try_upsert_vectors(
+                    vectors[i : i + self.batch_size],
+                    vector_ids[i : i + self.batch_size],
+                    namespace,
+                    metas[i : i + self.batch_size],
+                    **kwargs,
+                )
+            )
+
+        return upserted_ids
+
+    def try_upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        vector_ids: list[Optional[str]],
+        namespace: Optional[str],
+        metas: list[Optional[dict]],
+        **kwargs,
+    ) -> list[str]:
+        """Upserts one batch of vectors. Drivers with a native bulk write should override this."""
+        return [
+            self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+            for vector, vector_id, meta in zip(vectors, vector_ids, metas)
+        ]
+
+    def query_batch(
+        self,
+        queries: list[str],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[QueryResult]]:
+        """Runs several queries and returns their results in input order."""
+        return utils.execute_futures_list(
+            [
+                self.futures_executor.submit(
+                    self.query, query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+                )
+                for query in queries
+            ]
+        )
+
+    def _embed_text_artifacts(self, artifacts: list[TextArtifact]) -> list[list[float]]:
+        TextArtifact.generate_embeddings([a for a in artifacts if not a.embedding], self.embedding_driver)
+
+        vectors = [a.embedding for a in artifacts]
+
+        if not all(isinstance(vector, list) for vector in vectors):
+            raise ValueError("Vector must be an instance of 'list'.")
+
+        return vectors
+
     @abstractmethod
     def delete_vector(self, vector_id: str) -> None:
         ...
@@ -100,13 +210,44 @@ class BaseVectorStoreDriver(SerializableMixin, ABC):
     def load_entries(self, namespace: Optional[str] = None) -> list[Entry]:
         ...
 
-    @abstractmethod
     def query(
         self,
         query: str,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
+        **kwargs,
+    ) -> list[QueryResult]:
+        """Embeds the query string and queries the store with
+        [query_vector][griptape.drivers.BaseVectorStoreDriver.query_vector].
+        """
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            filter=filter,
+            **kwargs,
+        )
+
+    @abstractmethod
+    def query_vector(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        filter: Optional[dict] = None,
         **kwargs,
     ) -> list[QueryResult]:
+        """Queries the store with a precomputed vector.
+
+        Args:
+            vector: The query vector.
+            count: The maximum number of results.
+            namespace: Optional namespace to query.
+            include_vectors: Whether to include the stored vectors in the results.
+            filter: Optional metadata filter mapping metadata keys to the values entries must have.
+        """
         ...
@@ -35,6 +35,18 @@ class DummyVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
         raise DummyException(__class__.__name__, "query")
+
+    def query_vector(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        filter: Optional[dict] = None,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        raise DummyException(__class__.__name__, "query_vector")
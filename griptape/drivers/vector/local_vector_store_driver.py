@@ -1,6 +1,10 @@
-from typing import Optional, Callable
-from numpy import dot
-from numpy.linalg import norm
+from __future__ import annotations
+import json
+import os
+import threading
+from itertools import chain
+from typing import Any, Optional, Callable
+import numpy as np
 from griptape import utils
 from griptape.drivers import BaseVectorStoreDriver
 from attr import define, field
@@ -8,8 +12,77 @@ from attr import define, field
 
 @define
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
+    """A Vector Store Driver that keeps all vectors in process memory or in memory-mapped files.
+
+    Vectors are kept in a contiguous float32 matrix alongside their precomputed norms, so a query is a single
+    matrix-vector product followed by a partial sort of the top `count` scores. The namespace of every row is kept in
+    an array next to the matrix, so namespaced queries select their rows with NumPy, and entries are indexed by
+    metadata value so that filtered queries only look at matching rows.
+
+    When `persist_dir` is set, the matrix and norms are memory-mapped float32 files and every upsert is appended
+    to a JSON Lines sidecar file holding the entry metadata. Reopening a store replays the sidecar file and maps
+    the vector files without reading them into memory.
+
+    When `ann_nprobe` is set, queries over at least `ann_min_rows` rows use an inverted file (IVF) index: vectors are
+    clustered with spherical k-means and only rows in the `ann_nprobe` clusters closest to the query are scored.
+    Upserts train the index once the store holds `ann_min_rows` entries and retrain it once the store doubles in size.
+    Every cluster keeps the list of its rows, which new rows join on upsert, so a query only gathers the rows of the
+    clusters it probes.
+
+    Attributes:
+        entries: Stored entries keyed by their namespaced vector id. The matrix is the only copy of the vectors,
+            entries read theirs from it when it is accessed.
+        relatedness_fn: Optional function used to score a query vector against an entry vector.
+            When not provided, cosine similarity is computed against the whole matrix at once.
+        persist_dir: Optional directory to persist the store to. The store is kept in memory only if not provided.
+        ann_nprobe: Number of IVF clusters to search per query. Higher values trade latency for recall.
+            Queries are always exact if not provided.
+        ann_nlist: Number of IVF clusters. Defaults to the square root of the number of rows at training time.
+        ann_min_rows: Minimum number of candidate rows for a query to use the IVF index instead of exact search.
+    """
+
+    INITIAL_CAPACITY = 1024
+    VECTORS_FILE = "vectors.f32"
+    NORMS_FILE = "norms.f32"
+    ENTRIES_FILE = "entries.jsonl"
+    ANN_SAMPLES_PER_CLUSTER = 64
+    ANN_TRAINING_ITERATIONS = 10
+    ANN_ASSIGNMENT_BATCH_SIZE = 65536
+
     entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict, kw_only=True)
-    relatedness_fn: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)), kw_only=True)
+    relatedness_fn: Optional[Callable] = field(default=None, kw_only=True)
+    persist_dir: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    ann_nprobe: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    ann_nlist: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    ann_min_rows: int = field(default=10000, kw_only=True, metadata={"serializable": True})
+    _matrix: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _norms: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _row_keys: list[Optional[str]] = field(factory=list, init=False)
+    _key_rows: dict[str, int] = field(factory=dict, init=False)
+    _row_namespaces: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _namespace_ids: dict[Optional[str], int] = field(factory=dict, init=False)
+    _meta_rows: dict[tuple[str, Any], set[int]] = field(factory=dict, init=False)
+    _free_rows: list[int] = field(factory=list, init=False)
+    _centroids: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _row_clusters: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _cluster_rows: list[set[int]] = field(factory=list, init=False)
+    _trained_row_count: int = field(default=0, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        initial_entries = self.entries
+        self.entries = {}
+
+        if self.persist_dir is not None:
+            os.makedirs(self.persist_dir, exist_ok=True)
+
+            self._load_persisted()
+
+        for entry in initial_entries.values():
+            self.upsert_vector(entry.vector, vector_id=entry.id, namespace=entry.namespace, meta=entry.meta)
+
+        with self._lock:
+            self._cluster_written_rows([])
 
     def upsert_vector(
         self,
@@ -20,54 +93,577 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         **kwargs,
     ) -> str:
         vector_id = vector_id if vector_id else utils.str_to_hash(str(vector))
+        key = self._namespaced_vector_id(vector_id, namespace)
 
-        self.entries[self._namespaced_vector_id(vector_id, namespace)] = self.Entry(
-            id=vector_id, vector=vector, meta=meta, namespace=namespace
-        )
+        with self._lock:
+            row = self._write_row(key, vector, namespace)
+            self._set_entry(key, _MatrixEntry(self, row, id=vector_id, meta=meta, namespace=namespace))
+
+            self._append_to_sidecar({"row": row, "id": vector_id, "namespace": namespace, "meta": meta})
+            self._cluster_written_rows([row])
 
         return vector_id
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        return self.entries.get(self._namespaced_vector_id(vector_id, namespace), None)
+        entry = self.entries.get(self._namespaced_vector_id(vector_id, namespace), None)
+
+        return self._materialize_entry(entry) if entry else None
 
     def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+        if namespace is None:
+            entries = list(self.entries.values())
+        else:
+            with self._lock:
+                keys = [self._row_keys[row] for row in self._namespace_row_indices(namespace)]
+
+            entries = [self.entries[key] for key in keys]
 
-    def query(
+        return [self._materialize_entry(entry) for entry in entries]
+
+    def try_upsert_vectors(
         self,
-        query: str,
+        vectors: list[list[float]],
+        vector_ids: list[Optional[str]],
+        namespace: Optional[str],
+        metas: list[Optional[dict]],
+        **kwargs,
+    ) -> list[str]:
+        vector_ids = [
+            vector_id if vector_id else utils.str_to_hash(str(vector)) for vector, vector_id in zip(vectors, vector_ids)
+        ]
+        records = []
+
+        with self._lock:
+            for vector, vector_id, meta in zip(vectors, vector_ids, metas):
+                key = self._namespaced_vector_id(vector_id, namespace)
+                row = self._write_row(key, vector, namespace)
+                self._set_entry(key, _MatrixEntry(self, row, id=vector_id, meta=meta, namespace=namespace))
+
+                records.append({"row": row, "id": vector_id, "namespace": namespace, "meta": meta})
+
+            self._append_to_sidecar(*records)
+            self._cluster_written_rows([record["row"] for record in records])
+
+        return vector_ids
+
+    def query_vector(
+        self,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
-        query_embedding = self.embedding_driver.embed_string(query)
+        with self._lock:
+            rows = self._candidate_rows(namespace, filter)
 
-        if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
-        else:
-            entries = self.entries
+            if self.ann_nprobe is not None and self.relatedness_fn is None:
+                rows = self._probe_rows(vector, rows)
 
-        entries_and_relatednesses = [
-            (entry, self.relatedness_fn(query_embedding, entry.vector)) for entry in entries.values()
-        ]
-        entries_and_relatednesses.sort(key=lambda x: x[1], reverse=True)
+            scores = self._score_rows(vector, rows)
+            top_indices = self._top_row_indices(scores, rows, count)
+            keys = [self._row_keys[row] for row in (top_indices if rows is None else rows[top_indices])]
 
-        result = [
-            BaseVectorStoreDriver.QueryResult(id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta)
-            for er in entries_and_relatednesses
-        ][:count]
+        return self._query_results(keys, scores[top_indices], include_vectors)
 
-        if include_vectors:
-            return result
-        else:
-            return [
-                BaseVectorStoreDriver.QueryResult(id=r.id, vector=[], score=r.score, meta=r.meta, namespace=r.namespace)
-                for r in result
-            ]
+    def query_batch(
+        self,
+        queries: list[str],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        filter: Optional[dict] = None,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        """Scores every query against the candidate rows with a single matrix-matrix product.
+
+        Falls back to one query at a time when queries are scored with `relatedness_fn` or the IVF index.
+        """
+        if self.ann_nprobe is not None or self.relatedness_fn is not None:
+            return super().query_batch(
+                queries, count=count, namespace=namespace, include_vectors=include_vectors, filter=filter
+            )
+
+        query_embeddings = [self.embedding_driver.embed_string(query) for query in queries]
+
+        with self._lock:
+            rows = self._candidate_rows(namespace, filter)
+            row_count = len(self._row_keys) if rows is None else len(rows)
+
+            if self._matrix is None or not row_count or not queries:
+                return [[] for _ in queries]
+
+            query_matrix = np.asarray(query_embeddings, dtype=np.float32)
+
+            if rows is None:
+                matrix, norms = self._matrix[:row_count], self._norms[:row_count]
+            else:
+                matrix, norms = self._matrix[rows], self._norms[rows]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = (query_matrix @ matrix.T) / (
+                    np.linalg.norm(query_matrix, axis=1, keepdims=True) * norms[np.newaxis, :]
+                )
+
+            batch = []
+            for query_scores in scores:
+                top_indices = self._top_row_indices(query_scores, rows, count)
+                keys = [self._row_keys[row] for row in (top_indices if rows is None else rows[top_indices])]
+
+                batch.append((keys, query_scores[top_indices]))
+
+        return [self._query_results(keys, query_scores, include_vectors) for keys, query_scores in batch]
+
+    def train_ann_index(self) -> None:
+        """Clusters the stored vectors for the IVF index used when `ann_nprobe` is set.
+
+        Upserts already train the index as the store grows, so this is only needed to retrain it after the vectors
+        of a store that doesn't grow changed, like after deleting and upserting a namespace.
+        """
+        with self._lock:
+            self._train_index()
+
+    def delete_namespace(self, namespace: Optional[str]) -> None:
+        """Deletes all entries in a namespace.
+
+        The namespace's rows are released for reuse by later upserts rather than compacted.
+
+        Args:
+            namespace: The namespace to delete.
+        """
+        with self._lock:
+            self._release_namespace(namespace)
+            self._append_to_sidecar({"delete_namespace": namespace})
 
     def _namespaced_vector_id(self, vector_id: str, namespace: Optional[str]):
         return vector_id if namespace is None else f"{namespace}-{vector_id}"
 
     def delete_vector(self, vector_id: str):
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+
+    def _candidate_rows(self, namespace: Optional[str], filter: Optional[dict] = None) -> Optional[np.ndarray]:
+        """Returns the rows a query has to score, or `None` when it scores every row of the matrix."""
+        if self._matrix is None:
+            return None
+        elif filter:
+            rows = self._filter_rows(filter)
+
+            if namespace:
+                namespace_id = self._namespace_ids.get(namespace)
+                rows = rows[self._row_namespaces[rows] == namespace_id] if namespace_id is not None else rows[:0]
+
+            return rows
+        elif namespace:
+            return self._namespace_row_indices(namespace)
+        else:
+            # Scoring the whole matrix is cheaper than gathering the rows in use, see `_top_row_indices()`.
+            return None
+
+    def _namespace_row_indices(self, namespace: Optional[str]) -> np.ndarray:
+        if self._matrix is None or namespace not in self._namespace_ids:
+            return np.zeros(0, dtype=np.intp)
+        else:
+            return np.flatnonzero(self._row_namespaces[: len(self._row_keys)] == self._namespace_ids[namespace])
+
+    def _filter_rows(self, filter: dict) -> np.ndarray:
+        """Returns the sorted rows whose entry metadata has every value in `filter`.
+
+        Hashable values are looked up in the metadata index, and only the rows found there are checked for the rest.
+        """
+        row_sets = []
+        unindexed_filter = {}
+
+        for key, value in filter.items():
+            try:
+                row_sets.append(self._meta_rows.get((key, value), set()))
+            except TypeError:
+                unindexed_filter[key] = value
+
+        rows = set.intersection(*sorted(row_sets, key=len)) if row_sets else self._key_rows.values()
+
+        if unindexed_filter:
+            rows = [
+                row for row in rows if self._matches_filter(self.entries[self._row_keys[row]].meta, unindexed_filter)
+            ]
+
+        return np.sort(np.fromiter(rows, dtype=np.intp, count=len(rows)))
+
+    def _matches_filter(self, meta: Optional[dict], filter: dict) -> bool:
+        return meta is not None and all(key in meta and meta[key] == value for key, value in filter.items())
+
+    def _set_entry(self, key: str, entry: BaseVectorStoreDriver.Entry) -> None:
+        """Stores an entry and indexes its metadata values in place of the entry it replaces."""
+        row = self._key_rows[key]
+
+        if key in self.entries:
+            self._index_meta(row, self.entries[key].meta, remove=True)
+
+        self.entries[key] = entry
+        self._index_meta(row, entry.meta)
+
+    def _index_meta(self, row: int, meta: Optional[dict], remove: bool = False) -> None:
+        for key, value in (meta or {}).items():
+            try:
+                if remove:
+                    self._meta_rows.get((key, value), set()).discard(row)
+                else:
+                    self._meta_rows.setdefault((key, value), set()).add(row)
+            except TypeError:
+                # Unhashable values aren't indexed, filters on them check the entries instead.
+                pass
+
+    def _query_results(
+        self, keys: list[str], scores: np.ndarray, include_vectors: bool
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        results = []
+        for key, score in zip(keys, scores):
+            entry = self.entries[key]
+
+            results.append(
+                BaseVectorStoreDriver.QueryResult(
+                    id=entry.id,
+                    vector=entry.vector if include_vectors else [],
+                    score=float(score),
+                    meta=entry.meta,
+                    namespace=entry.namespace,
+                )
+            )
+
+        return results
+
+    def _write_row(self, key: str, vector: list[float], namespace: Optional[str]) -> int:
+        """Writes a vector to the row owned by `key`, allocating a new row if the key is not stored yet.
+
+        New rows reuse rows released by `delete_namespace` first. Otherwise the matrix grows geometrically
+        so that appends are amortized O(1).
+
+        Returns:
+            The row the vector was written to.
+        """
+        array = np.asarray(vector, dtype=np.float32)
+
+        if self._matrix is None:
+            self._allocate(self.INITIAL_CAPACITY, len(array))
+        elif array.shape != (self._matrix.shape[1],):
+            raise ValueError(f"Vector must have {self._matrix.shape[1]} dimensions, got {len(array)}.")
+
+        row = self._key_rows.get(key)
+
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = len(self._row_keys)
+
+                if row == len(self._matrix):
+                    self._allocate(2 * len(self._matrix), self._matrix.shape[1])
+
+            self._index_row(key, row, namespace)
+
+        self._matrix[row] = array
+        self._norms[row] = np.linalg.norm(array)
+
+        return row
+
+    def _index_row(self, key: str, row: int, namespace: Optional[str]) -> None:
+        if row < len(self._row_keys):
+            self._row_keys[row] = key
+        else:
+            self._row_keys.extend([None] * (row - len(self._row_keys)))
+            self._row_keys.append(key)
+
+        self._key_rows[key] = row
+        self._row_namespaces[row] = self._namespace_ids.setdefault(namespace, len(self._namespace_ids))
+
+    def _release_namespace(self, namespace: Optional[str]) -> None:
+        rows = self._namespace_row_indices(namespace)
+
+        for row in rows.tolist():
+            key = self._row_keys[row]
+
+            self._index_meta(row, self.entries[key].meta, remove=True)
+
+            del self._key_rows[key]
+            del self.entries[key]
+
+            self._row_keys[row] = None
+
+        self._norms[rows] = 0
+        self._row_namespaces[rows] = -1
+
+        if self._row_clusters is not None:
+            for row, cluster in zip(rows.tolist(), self._row_clusters[rows].tolist()):
+                self._cluster_rows[cluster].discard(row)
+
+            self._row_clusters[rows] = -1
+        self._free_rows.extend(rows.tolist())
+
+    def _allocate(self, capacity: int, dimensions: int) -> None:
+        """Allocates the matrix and norms with room for `capacity` rows, keeping any existing rows.
+
+        Persisted stores extend their backing files and map them again instead of copying in memory.
+        """
+        if self.persist_dir is None:
+            matrix = np.zeros((capacity, dimensions), dtype=np.float32)
+            norms = np.zeros(capacity, dtype=np.float32)
+
+            if self._matrix is not None:
+                matrix[: len(self._matrix)] = self._matrix
+                norms[: len(self._norms)] = self._norms
+
+            self._matrix, self._norms = matrix, norms
+        else:
+            self._matrix = self._map_file(self.VECTORS_FILE, (capacity, dimensions))
+            self._norms = self._map_file(self.NORMS_FILE, (capacity,))
+
+        if self._row_namespaces is None:
+            # Rows that aren't in use have no namespace id.
+            self._row_namespaces = np.full(capacity, -1, dtype=np.int32)
+        else:
+            self._row_namespaces = np.concatenate(
+                [self._row_namespaces, np.full(capacity - len(self._row_namespaces), -1, dtype=np.int32)]
+            )
+
+        if self._row_clusters is not None:
+            self._row_clusters = np.concatenate(
+                [self._row_clusters, np.full(capacity - len(self._row_clusters), -1, dtype=np.int32)]
+            )
+
+    def _map_file(self, file_name: str, shape: tuple[int, ...]) -> np.memmap:
+        path = os.path.join(self.persist_dir, file_name)
+        size = int(np.prod(shape)) * np.dtype(np.float32).itemsize
+
+        with open(path, "ab") as file:
+            if file.tell() < size:
+                file.truncate(size)
+
+        return np.memmap(path, dtype=np.float32, mode="r+", shape=shape)
+
+    def _append_to_sidecar(self, *records: dict) -> None:
+        if self.persist_dir is not None and self._matrix is not None and records:
+            if not os.path.exists(self._sidecar_path()):
+                records = ({"dimensions": self._matrix.shape[1], **records[0]}, *records[1:])
+
+            with open(self._sidecar_path(), "a") as file:
+                file.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+
+    def _load_persisted(self) -> None:
+        """Replays the sidecar file and maps the persisted vector files."""
+        if not os.path.exists(self._sidecar_path()):
+            return
+
+        with open(self._sidecar_path()) as file:
+            records = [json.loads(line) for line in file if line.strip()]
+
+        if not records:
+            return
+
+        dimensions = records[0]["dimensions"]
+        vectors_size = os.path.getsize(os.path.join(self.persist_dir, self.VECTORS_FILE))
+        self._allocate(max(vectors_size // (dimensions * np.dtype(np.float32).itemsize), 1), dimensions)
+
+        for record in records:
+            if "delete_namespace" in record:
+                self._release_namespace(record["delete_namespace"])
+            else:
+                key = self._namespaced_vector_id(record["id"], record["namespace"])
+
+                if key not in self._key_rows:
+                    if record["row"] in self._free_rows:
+                        self._free_rows.remove(record["row"])
+
+                    self._index_row(key, record["row"], record["namespace"])
+
+                self._set_entry(
+                    key,
+                    _MatrixEntry(
+                        self, self._key_rows[key], id=record["id"], meta=record["meta"], namespace=record["namespace"]
+                    ),
+                )
+
+    def _materialize_entry(self, entry: BaseVectorStoreDriver.Entry) -> BaseVectorStoreDriver.Entry:
+        """Returns a copy of an entry with its vector read from the matrix."""
+        return self.Entry(id=entry.id, vector=entry.vector, meta=entry.meta, namespace=entry.namespace)
+
+    def _sidecar_path(self) -> str:
+        return os.path.join(self.persist_dir, self.ENTRIES_FILE)
+
+    def _probe_rows(self, query_vector: list[float], rows: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Narrows the sorted `rows`, or every row when `rows` is `None`, down to the rows in the closest IVF clusters.
+
+        Candidate sets smaller than `ann_min_rows` are returned unchanged so that they are searched exactly, and so is
+        every candidate set until the index is trained.
+        """
+        row_count = len(self._key_rows) if rows is None else len(rows)
+
+        if self._centroids is None or not row_count or row_count < self.ann_min_rows:
+            return rows
+
+        probed_clusters = self._top_indices(
+            self._centroids @ np.asarray(query_vector, dtype=np.float32), self.ann_nprobe
+        ).tolist()
+        probed_rows = np.fromiter(
+            chain.from_iterable(self._cluster_rows[cluster] for cluster in probed_clusters),
+            dtype=np.intp,
+            count=sum(len(self._cluster_rows[cluster]) for cluster in probed_clusters),
+        )
+        probed_rows.sort()
+
+        if rows is None:
+            return probed_rows
+        else:
+            positions = np.minimum(np.searchsorted(rows, probed_rows), len(rows) - 1)
+
+            return probed_rows[rows[positions] == probed_rows]
+
+    def _cluster_written_rows(self, rows: list[int]) -> None:
+        """Moves written rows to their closest IVF cluster.
+
+        Trains the index instead once the store holds `ann_min_rows` entries and again whenever it doubles in size.
+        """
+        if (
+            self.ann_nprobe is not None
+            and self.relatedness_fn is None
+            and len(self._key_rows) >= max(self.ann_min_rows, 2 * self._trained_row_count, 1)
+        ):
+            self._train_index()
+        elif self._centroids is not None and rows:
+            self._assign_rows(np.array(rows, dtype=np.intp))
+
+    def _train_index(self) -> None:
+        """Clusters a sample of the stored vectors with spherical k-means and assigns every row to a cluster."""
+        if not self._key_rows:
+            return
+
+        rows = np.flatnonzero(self._row_namespaces[: len(self._row_keys)] != -1)
+        cluster_count = max(min(self.ann_nlist or int(np.sqrt(len(rows))), len(rows)), 1)
+        rng = np.random.default_rng(0)
+
+        sample_size = min(len(rows), cluster_count * self.ANN_SAMPLES_PER_CLUSTER)
+        sample = self._matrix[np.sort(rng.choice(rows, sample_size, replace=False))]
+        sample = sample / np.maximum(np.linalg.norm(sample, axis=1, keepdims=True), np.finfo(np.float32).tiny)
+        centroids = sample[rng.choice(sample_size, cluster_count, replace=False)]
+
+        for _ in range(self.ANN_TRAINING_ITERATIONS):
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, np.argmax(sample @ centroids.T, axis=1), sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+
+            # Clusters that end up empty keep their previous centroid.
+            centroids = np.where(norms > 0, sums / np.maximum(norms, np.finfo(np.float32).tiny), centroids)
+
+        self._centroids = centroids
+        self._row_clusters = np.full(len(self._matrix), -1, dtype=np.int32)
+        self._trained_row_count = len(rows)
+
+        for start in range(0, len(rows), self.ANN_ASSIGNMENT_BATCH_SIZE):
+            batch = rows[start : start + self.ANN_ASSIGNMENT_BATCH_SIZE]
+            self._row_clusters[batch] = np.argmax(self._matrix[batch] @ centroids.T, axis=1)
+
+        # Group the rows by cluster with a single sort instead of adding them to their cluster one at a time.
+        rows = rows[np.argsort(self._row_clusters[rows], kind="stable")]
+        bounds = np.searchsorted(self._row_clusters[rows], np.arange(cluster_count + 1)).tolist()
+        self._cluster_rows = [set(rows[start:end].tolist()) for start, end in zip(bounds, bounds[1:])]
+
+    def _assign_rows(self, rows: np.ndarray) -> None:
+        """Moves rows to the list of their closest cluster."""
+        clusters = np.argmax(self._matrix[rows] @ self._centroids.T, axis=1)
+
+        for row, previous_cluster, cluster in zip(rows.tolist(), self._row_clusters[rows].tolist(), clusters.tolist()):
+            if previous_cluster != -1:
+                self._cluster_rows[previous_cluster].discard(row)
+
+            self._cluster_rows[cluster].add(row)
+
+        self._row_clusters[rows] = clusters
+
+    def _score_rows(self, query_vector: list[float], rows: Optional[np.ndarray]) -> np.ndarray:
+        """Scores `rows` against the query vector, or every row when `rows` is `None`."""
+        row_count = len(self._row_keys) if rows is None else len(rows)
+
+        if self._matrix is None or not row_count:
+            return np.zeros(0, dtype=np.float32)
+        elif self.relatedness_fn:
+            keys = self._row_keys[:row_count] if rows is None else [self._row_keys[row] for row in rows]
+
+            return np.array(
+                [
+                    -np.inf if key is None else self.relatedness_fn(query_vector, self.entries[key].vector)
+                    for key in keys
+                ],
+                dtype=np.float64,
+            )
+        else:
+            query_array = np.asarray(query_vector, dtype=np.float32)
+
+            if rows is None:
+                matrix, norms = self._matrix[:row_count], self._norms[:row_count]
+            else:
+                matrix, norms = self._matrix[rows], self._norms[rows]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return (matrix @ query_array) / (norms * np.linalg.norm(query_array))
+
+    def _top_row_indices(self, scores: np.ndarray, rows: Optional[np.ndarray], count: Optional[int]) -> np.ndarray:
+        """Returns `_top_indices()` of the scores of `rows`, or of every row when `rows` is `None`.
+
+        When every row is scored, rows released by `delete_namespace` get the lowest score and are left out.
+        """
+        if rows is None and self._free_rows:
+            scores[self._row_namespaces[: len(scores)] == -1] = -np.inf
+            top_indices = self._top_indices(scores, count)
+
+            return top_indices[self._row_namespaces[top_indices] != -1]
+        else:
+            return self._top_indices(scores, count)
+
+    def _top_indices(self, scores: np.ndarray, count: Optional[int]) -> np.ndarray:
+        """Returns indices of the `count` highest scores in descending order.
+
+        Uses `argpartition` to select the top `count` candidates before sorting only those.
+        """
+        if count is not None and count <= 0:
+            return np.zeros(0, dtype=np.intp)
+        elif count is not None and count < len(scores):
+            candidates = np.argpartition(-scores, count - 1)[:count]
+
+            return candidates[np.argsort(-scores[candidates], kind="stable")]
+        else:
+            return np.argsort(-scores, kind="stable")
+
+
+class _MatrixEntry(BaseVectorStoreDriver.Entry):
+    """An entry of a `LocalVectorStoreDriver` that reads its vector from the store's matrix on access.
+
+    This keeps entries from holding a second copy of every vector, which could also drift from the matrix on upsert.
+    """
+
+    def __init__(
+        self,
+        driver: LocalVectorStoreDriver,
+        row: int,
+        id: str,
+        meta: Optional[dict] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        self.id = id
+        self.meta = meta
+        self.namespace = namespace
+        self._driver = driver
+        self._row = row
+
+    @property
+    def vector(self) -> list[float]:
+        return self._driver._matrix[self._row].tolist()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BaseVectorStoreDriver.Entry):
+            return (self.id, self.vector, self.meta, self.namespace) == (
+                other.id,
+                other.vector,
+                other.meta,
+                other.namespace,
+            )
+        else:
+            return NotImplemented
@@ -13,6 +13,11 @@ if TYPE_CHECKING:
 class MarqoVectorStoreDriver(BaseVectorStoreDriver):
     """A Vector Store Driver for Marqo.
 
+    Marqo embeds documents and queries with the index's own model, so `query()` sends the query text to Marqo instead
+    of embedding it with `embedding_driver`. `query_vector()` searches with the vector as a Marqo context vector, so it
+    must come from the same model and have the same dimensions as the index. Upserting precomputed vectors is not
+    supported.
+
     Attributes:
         api_key: The API key for the Marqo API.
         url: The URL to the Marqo API.
@@ -93,6 +98,44 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         else:
             raise ValueError(f"Failed to upsert text: {response}")
 
+    def upsert_text_artifacts_batched(
+        self, artifacts: dict[str, list[TextArtifact]], meta: Optional[dict] = None, **kwargs
+    ) -> dict[str, list[str]]:
+        """Upsert text artifacts into the Marqo index with one `add_documents` call per `batch_size` artifacts.
+
+        Marqo embeds documents itself, so artifacts are not embedded locally.
+
+        Args:
+            artifacts: The text artifacts to be indexed, by namespace.
+            meta: Unused, Marqo documents do not store metadata.
+
+        Returns:
+            The IDs of the artifacts that were added, by namespace.
+        """
+        upserted_ids = {}
+
+        for namespace, artifact_list in artifacts.items():
+            upserted_ids[namespace] = []
+
+            for i in range(0, len(artifact_list), self.batch_size):
+                docs = [
+                    {
+                        "_id": artifact.id,
+                        "Description": artifact.value,
+                        "artifact": str(artifact.to_json()),
+                        "namespace": namespace,
+                    }
+                    for artifact in artifact_list[i : i + self.batch_size]
+                ]
+
+                response = self.mq.index(self.index).add_documents(docs, tensor_fields=["Description", "artifact"])
+                if isinstance(response, dict) and "items" in response and response["items"]:
+                    upserted_ids[namespace].extend(item["_id"] for item in response["items"])
+                else:
+                    raise ValueError(f"Failed to upsert text: {response}")
+
+        return upserted_ids
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a document entry from the Marqo index.
 
@@ -158,6 +201,7 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         include_metadata: bool = True,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
@@ -168,16 +212,64 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             count: The maximum number of results to return.
             namespace: The namespace to filter results by.
             include_vectors: Whether to include vector data in the results.
+            filter: Document fields and the values results must have.
+            include_metadata: Whether to include metadata in the results.
+
+        Returns:
+            The list of query results.
+        """
+        return self._search(query, count, namespace, include_vectors, filter, include_metadata, **kwargs)
+
+    def query_vector(
+        self,
+        vector: list[float],
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        filter: Optional[dict] = None,
+        include_metadata: bool = True,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        """Query the Marqo index with a vector, passed to Marqo as a context vector.
+
+        Args:
+            vector: The query vector. Must have the dimensions of the index's model.
+            count: The maximum number of results to return.
+            namespace: The namespace to filter results by.
+            include_vectors: Whether to include vector data in the results.
+            filter: Document fields and the values results must have.
             include_metadata: Whether to include metadata in the results.
 
         Returns:
             The list of query results.
         """
+        return self._search(
+            None,
+            count,
+            namespace,
+            include_vectors,
+            filter,
+            include_metadata,
+            context={"tensor": [{"vector": vector, "weight": 1}]},
+            **kwargs,
+        )
+
+    def _search(
+        self,
+        query: Optional[str],
+        count: Optional[int],
+        namespace: Optional[str],
+        include_vectors: bool,
+        filter: Optional[dict],
+        include_metadata: bool,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        filters = ({"namespace": namespace} if namespace else {}) | (filter or {})
 
         params = {
             "limit": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
             "attributes_to_retrieve": ["*"] if include_metadata else ["_id"],
-            "filter_string": f"namespace:{namespace}" if namespace else None,
+            "filter_string": " AND ".join(f"{key}:{value}" for key, value in filters.items()) if filters else None,
         } | kwargs
 
         results = self.mq.index(self.index).search(query, **params)
@@ -65,6 +65,34 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             )
         return vector_id
 
+    def try_upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        vector_ids: list[Optional[str]],
+        namespace: Optional[str],
+        metas: list[Optional[dict]],
+        **kwargs,
+    ) -> list[str]:
+        """Writes the batch of vectors with a single unordered MongoDB bulk write."""
+        pymongo = import_optional_dependency("pymongo")
+        documents = [
+            {self.vector_path: vector, "namespace": namespace, "meta": meta} for vector, meta in zip(vectors, metas)
+        ]
+        operations = [
+            pymongo.InsertOne(document)
+            if vector_id is None
+            else pymongo.ReplaceOne({"_id": vector_id}, document, upsert=True)
+            for vector_id, document in zip(vector_ids, documents)
+        ]
+
+        self.get_collection().bulk_write(operations, ordered=False)
+
+        # pymongo sets the generated `_id` on inserted documents.
+        return [
+            vector_id if vector_id is not None else str(document["_id"])
+            for vector_id, document in zip(vector_ids, documents)
+        ]
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Loads a document entry from the MongoDB collection based on the vector ID.
 
@@ -102,24 +130,23 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             for doc in cursor
         ]
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         offset: Optional[int] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
-        """Queries the MongoDB collection for documents that match the provided query string.
+        """Queries the MongoDB collection for documents with vectors similar to the provided vector.
 
-        Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
+        Results can be customized based on parameters like count, namespace, metadata filter, inclusion of vectors,
+        offset, and index. Filtered metadata fields must be indexed as filter fields of the vector search index.
         """
         collection = self.get_collection()
 
-        # Using the embedding driver to convert the query string into a vector
-        vector = self.embedding_driver.embed_string(query)
-
         count = count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
         offset = offset if offset else 0
 
@@ -144,8 +171,8 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             },
         ]
 
-        if namespace:
-            pipeline[0]["$vectorSearch"]["filter"] = {"namespace": namespace}
+        if namespace or filter:
+            pipeline[0]["$vectorSearch"]["filter"] = self._match_filter(namespace, filter)
 
         results = [
             BaseVectorStoreDriver.QueryResult(
@@ -160,6 +187,15 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
 
         return results
 
+    def _match_filter(self, namespace: Optional[str], filter: Optional[dict]) -> dict:
+        """Builds a MongoDB filter document matching the namespace and metadata filter."""
+        match = {f"meta.{key}": value for key, value in (filter or {}).items()}
+
+        if namespace:
+            match["namespace"] = namespace
+
+        return match
+
     def delete_vector(self, vector_id: str):
         """Deletes the vector from the collection."""
         collection = self.get_collection()
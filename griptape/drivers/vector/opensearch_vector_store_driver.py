@@ -64,6 +64,31 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
 
         return response["_id"]
 
+    def try_upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        vector_ids: list[Optional[str]],
+        namespace: Optional[str],
+        metas: list[Optional[dict]],
+        **kwargs,
+    ) -> list[str]:
+        """Indexes the batch of vectors with a single OpenSearch bulk request."""
+        vector_ids = [
+            vector_id if vector_id else utils.str_to_hash(str(vector)) for vector, vector_id in zip(vectors, vector_ids)
+        ]
+        body = []
+
+        for vector, vector_id, meta in zip(vectors, vector_ids, metas):
+            body.append({"index": {"_index": self.index_name, "_id": vector_id}})
+            body.append({"vector": vector, "namespace": namespace, "metadata": meta} | kwargs)
+
+        response = self.client.bulk(body=body)
+
+        if response.get("errors"):
+            raise ValueError(f"Failed to upsert vectors: {response}")
+
+        return [item["index"]["_id"] for item in response["items"]]
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from OpenSearch based on its identifier and optional namespace.
 
@@ -118,34 +143,33 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
         ]
         return entries
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         include_metadata=True,
         field_name: str = "vector",
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
-        """Performs a nearest neighbor search on OpenSearch to find vectors similar to the provided query string.
+        """Performs a nearest neighbor search on OpenSearch to find vectors similar to the provided vector.
 
-        Results can be limited using the count parameter and optionally filtered by a namespace.
+        Results can be limited using the count parameter and optionally filtered by a namespace and metadata.
 
         Returns:
             A list of BaseVectorStoreDriver.QueryResult objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
         count = count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
-        vector = self.embedding_driver.embed_string(query)
         # Base k-NN query
         query_body = {"size": count, "query": {"knn": {field_name: {"vector": vector, "k": count}}}}
 
-        if namespace:
-            query_body["query"] = {
-                "bool": {
-                    "must": [{"match": {"namespace": namespace}}, {"knn": {field_name: {"vector": vector, "k": count}}}]
-                }
-            }
+        if namespace or filter:
+            must = [{"match": {"namespace": namespace}}] if namespace else []
+            must.extend({"match": {f"metadata.{key}": value}} for key, value in (filter or {}).items())
+
+            query_body["query"] = {"bool": {"must": [*must, {"knn": {field_name: {"vector": vector, "k": count}}}]}}
 
         response = self.client.search(index=self.index_name, body=query_body)
 
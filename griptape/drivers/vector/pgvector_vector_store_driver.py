@@ -6,9 +6,9 @@ from dataclasses import dataclass
 from griptape.drivers import BaseVectorStoreDriver
 from griptape.utils import import_optional_dependency
 from sqlalchemy.engine import Engine
-from sqlalchemy import create_engine, Column, String, JSON
+from sqlalchemy import create_engine, literal, Column, String, JSON
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Session
 
 
@@ -89,6 +89,24 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
             return str(getattr(obj, "id"))
 
+    def try_upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        vector_ids: list[Optional[str]],
+        namespace: Optional[str],
+        metas: list[Optional[dict]],
+        **kwargs,
+    ) -> list[str]:
+        """Merges the batch of vectors in a single session and commits them in one transaction."""
+        with Session(self.engine) as session:
+            objs = [
+                session.merge(self._model(id=vector_id, vector=vector, namespace=namespace, meta=meta))
+                for vector, vector_id, meta in zip(vectors, vector_ids, metas)
+            ]
+            session.commit()
+
+            return [str(getattr(obj, "id")) for obj in objs]
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> BaseVectorStoreDriver.Entry:
         """Retrieves a specific vector entry from the collection based on its identifier and optional namespace."""
         with Session(self.engine) as session:
@@ -119,17 +137,18 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
                 for result in results
             ]
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         distance_metric: str = "cosine_distance",
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
         """Performs a search on the collection to find vectors similar to the provided input vector,
-        optionally filtering to only those that match the provided namespace.
+        optionally filtering to only those that match the provided namespace and metadata.
         """
         distance_metrics = {
             "cosine_distance": self._model.vector.cosine_distance,
@@ -143,14 +162,16 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         op = distance_metrics[distance_metric]
 
         with Session(self.engine) as session:
-            vector = self.embedding_driver.embed_string(query)
-
             # The query should return both the vector and the distance metric score.
             query_result = session.query(self._model, op(vector).label("score")).order_by(op(vector))  # pyright: ignore
 
             if namespace:
                 query_result = query_result.filter_by(namespace=namespace)
 
+            # Values are compared as JSON so that booleans, numbers, and nested values match their stored type.
+            for key, value in (filter or {}).items():
+                query_result = query_result.filter(self._model.meta[key].cast(JSONB) == literal(value, JSONB))
+
             results = query_result.limit(count).all()
 
             return [
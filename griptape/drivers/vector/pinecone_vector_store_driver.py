@@ -38,6 +38,24 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
 
         return vector_id
 
+    def try_upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        vector_ids: list[Optional[str]],
+        namespace: Optional[str],
+        metas: list[Optional[dict]],
+        **kwargs,
+    ) -> list[str]:
+        vector_ids = [
+            vector_id if vector_id else str_to_hash(str(vector)) for vector, vector_id in zip(vectors, vector_ids)
+        ]
+
+        params: dict[str, Any] = {"namespace": namespace} | kwargs
+
+        self.index.upsert(list(zip(vector_ids, vectors, metas)), **params)
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         result = self.index.fetch(ids=[vector_id], namespace=namespace).to_dict()
         vectors = list(result["vectors"].values())
@@ -67,18 +85,17 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
             for r in results["matches"]
         ]
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         # PineconeVectorStorageDriver-specific params:
         include_metadata=True,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
-        vector = self.embedding_driver.embed_string(query)
-
         params = {
             "top_k": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
             "namespace": namespace,
@@ -86,6 +103,9 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
             "include_metadata": include_metadata,
         } | kwargs
 
+        if filter:
+            params["filter"] = filter
+
         results = self.index.query(vector, **params)
 
         return [
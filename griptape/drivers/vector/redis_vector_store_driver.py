@@ -57,19 +57,31 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Metadata associated with the vector can also be provided.
         """
         vector_id = vector_id if vector_id else str_to_hash(str(vector))
-        key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(self._generate_key(vector_id, namespace), mapping=self._generate_mapping(vector, meta))
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+        return vector_id
+
+    def try_upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        vector_ids: list[Optional[str]],
+        namespace: Optional[str],
+        metas: list[Optional[dict]],
+        **kwargs,
+    ) -> list[str]:
+        """Writes the batch of vectors through a single non-transactional Redis pipeline."""
+        vector_ids = [
+            vector_id if vector_id else str_to_hash(str(vector)) for vector, vector_id in zip(vectors, vector_ids)
+        ]
+        pipeline = self.client.pipeline(transaction=False)
 
-        self.client.hset(key, mapping=mapping)
+        for vector, vector_id, meta in zip(vectors, vector_ids, metas):
+            pipeline.hset(self._generate_key(vector_id, namespace), mapping=self._generate_mapping(vector, meta))
 
-        return vector_id
+        pipeline.execute()
+
+        return vector_ids
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
@@ -101,25 +113,26 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
 
         return entries
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.QueryResult]:
         """Performs a nearest neighbor search on Redis to find vectors similar to the provided input vector.
 
         Results can be limited using the count parameter and optionally filtered by a namespace.
+        Metadata is not indexed by RediSearch, so `filter` is applied to the nearest neighbors after the search
+        and may return fewer than `count` results.
 
         Returns:
             A list of BaseVectorStoreDriver.QueryResult objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
         Query = import_optional_dependency("redis.commands.search.query").Query
 
-        vector = self.embedding_driver.embed_string(query)
-
         query_expression = (
             Query(f"*=>[KNN {count or 10} @vector $vector as score]")
             .sort_by("score")
@@ -135,6 +148,10 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         query_results = []
         for document in results:
             metadata = getattr(document, "metadata", None)
+
+            if filter and not self._matches_filter(metadata, filter):
+                continue
+
             namespace = document.id.split(":")[0] if ":" in document.id else None
             vector_id = document.id.split(":")[1] if ":" in document.id else document.id
             vector_float_list = json.loads(document["vec_string"]) if include_vectors else None
@@ -153,6 +170,23 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
 
+    def _generate_mapping(self, vector: list[float], meta: Optional[dict] = None) -> dict[str, Any]:
+        """Generates the Redis hash fields storing the vector and its optional metadata."""
+        mapping: dict[str, Any] = {
+            "vector": np.array(vector, dtype=np.float32).tobytes(),
+            "vec_string": json.dumps(vector).encode("utf-8"),
+        }
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
+    def _matches_filter(self, metadata: Optional[str | dict], filter: dict) -> bool:
+        meta = json.loads(metadata) if isinstance(metadata, (str, bytes)) else metadata
+
+        return meta is not None and all(key in meta and meta[key] == value for key, value in filter.items())
+
     def _get_doc_prefix(self, namespace: Optional[str] = None) -> str:
         """Get the document prefix based on the provided namespace."""
         return f"{namespace}:" if namespace else ""
@@ -26,42 +26,48 @@ class VectorQueryEngine(BaseQueryEngine):
         rulesets: Optional[list[Ruleset]] = None,
         metadata: Optional[str] = None,
         top_n: Optional[int] = None,
+        vector: Optional[list[float]] = None,
     ) -> TextArtifact:
         tokenizer = self.prompt_driver.tokenizer
-        result = self.vector_store_driver.query(query, top_n, namespace)
+
+        # Callers querying several engines or namespaces can embed the query once and pass its vector.
+        if vector is None:
+            result = self.vector_store_driver.query(query, top_n, namespace)
+        else:
+            result = self.vector_store_driver.query_vector(vector, top_n, namespace)
         artifacts = [
             artifact
             for artifact in [BaseArtifact.from_json(r.meta["artifact"]) for r in result if r.meta]
             if isinstance(artifact, TextArtifact)
         ]
-        text_segments = []
-        message = ""
-
-        for artifact in artifacts:
-            text_segments.append(artifact.value)
+        rulesets_message = J2("rulesets/rulesets.j2").render(rulesets=rulesets)
 
-            message = self.template_generator.render(
-                metadata=metadata,
-                query=query,
-                text_segments=text_segments,
-                rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
+        def render(text_segments: list[str]) -> str:
+            return self.template_generator.render(
+                metadata=metadata, query=query, text_segments=text_segments, rulesets=rulesets_message
             )
-            message_token_count = self.prompt_driver.token_count(
+
+        def message_token_count(message: str) -> int:
+            return self.prompt_driver.token_count(
                 PromptStack(inputs=[PromptStack.Input(message, role=PromptStack.USER_ROLE)])
             )
 
-            if message_token_count + self.answer_token_offset >= tokenizer.max_tokens:
-                text_segments.pop()
+        # Measure the template once instead of rendering and counting the whole message for every segment: the
+        # message without segments, and the tokens the template adds around each segment.
+        token_count = message_token_count(render([]))
+        segment_token_overhead = message_token_count(render(["x"])) - token_count - tokenizer.count_tokens("x")
+        text_segments = []
 
-                message = self.template_generator.render(
-                    metadata=metadata,
-                    query=query,
-                    text_segments=text_segments,
-                    rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
-                )
+        for artifact in artifacts:
+            token_count += artifact.token_count(tokenizer) + segment_token_overhead
 
+            if token_count + self.answer_token_offset >= tokenizer.max_tokens:
                 break
 
+            text_segments.append(artifact.value)
+
+        message = render(text_segments)
+
         return self.prompt_driver.run(PromptStack(inputs=[PromptStack.Input(message, role=PromptStack.USER_ROLE)]))
 
     def upsert_text_artifact(self, artifact: TextArtifact, namespace: Optional[str] = None) -> str:
@@ -70,7 +76,7 @@ class VectorQueryEngine(BaseQueryEngine):
         return result
 
     def upsert_text_artifacts(self, artifacts: list[TextArtifact], namespace: str) -> None:
-        self.vector_store_driver.upsert_text_artifacts({namespace: artifacts})
+        self.vector_store_driver.upsert_text_artifacts_batched({namespace: artifacts})
 
     def load_artifacts(self, namespace: str) -> ListArtifact:
         result = self.vector_store_driver.load_entries(namespace)
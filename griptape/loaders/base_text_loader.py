@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Optional
+from concurrent import futures
+from typing import IO, Optional
+from collections.abc import Iterable, Iterator
 
 from attrs import define, field, Factory
 from pathlib import Path
@@ -32,6 +34,7 @@ class BaseTextLoader(BaseLoader, ABC):
     )
     embedding_driver: Optional[BaseEmbeddingDriver] = field(default=None, kw_only=True)
     encoding: str = field(default="utf-8", kw_only=True)
+    chunking_executor: Optional[futures.Executor] = field(default=None, kw_only=True)
 
     def _text_to_artifacts(self, text: str | Path) -> list[TextArtifact]:
         artifacts = []
@@ -42,17 +45,44 @@ class BaseTextLoader(BaseLoader, ABC):
         else:
             body = text
 
-        if self.chunker:
+        if self.chunker is None:
+            chunks = [TextArtifact(body)]
+        elif self.chunking_executor is None:
             chunks = self.chunker.chunk(body)
         else:
-            chunks = [TextArtifact(body)]
+            # Chunking is CPU-bound, so a process pool executor sidesteps the GIL. The chunker is pickled per call.
+            chunks = self.chunking_executor.submit(self.chunker.chunk, body).result()
 
         if self.embedding_driver:
-            for chunk in chunks:
-                chunk.generate_embedding(self.embedding_driver)
+            TextArtifact.generate_embeddings(chunks, self.embedding_driver)
 
         for chunk in chunks:
             chunk.encoding = self.encoding
             artifacts.append(chunk)
 
         return artifacts
+
+    def _stream_to_artifacts(self, stream: Iterable[str] | IO) -> Iterator[TextArtifact]:
+        if self.chunker:
+            chunks = self.chunker.chunk_stream(stream)
+        else:
+            chunks = iter([TextArtifact(stream.read() if hasattr(stream, "read") else "".join(stream))])
+
+        batch = []
+
+        for chunk in chunks:
+            chunk.encoding = self.encoding
+            batch.append(chunk)
+
+            if self.embedding_driver is None or len(batch) >= self.embedding_driver.batch_size:
+                yield from self._embed_batch(batch)
+
+                batch = []
+
+        yield from self._embed_batch(batch)
+
+    def _embed_batch(self, artifacts: list[TextArtifact]) -> list[TextArtifact]:
+        if self.embedding_driver and artifacts:
+            TextArtifact.generate_embeddings(artifacts, self.embedding_driver)
+
+        return artifacts
@@ -35,8 +35,7 @@ class DataFrameLoader(BaseLoader):
         chunks = [CsvRowArtifact(row) for row in dataframe.to_dict(orient="records")]
 
         if self.embedding_driver:
-            for chunk in chunks:
-                chunk.generate_embedding(self.embedding_driver)
+            CsvRowArtifact.generate_embeddings(chunks, self.embedding_driver)
 
         for chunk in chunks:
             artifacts.append(chunk)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from attr import define, field, Factory
 from typing import IO, Optional
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 from pathlib import Path
 
@@ -22,6 +22,18 @@ class PdfLoader(BaseTextLoader):
     def load(self, source: str | IO | Path, password: Optional[str] = None, *args, **kwargs) -> list[TextArtifact]:
         return self._load_pdf(source, password)
 
+    def iter_load(
+        self, source: str | IO | Path, password: Optional[str] = None, *args, **kwargs
+    ) -> Iterator[TextArtifact]:
+        """Lazily loads artifacts, extracting the text of one page at a time."""
+        PdfReader = import_optional_dependency("pypdf").PdfReader
+
+        reader = PdfReader(source, strict=True, password=password)
+
+        yield from self._stream_to_artifacts(
+            ("\n" if i > 0 else "") + page.extract_text() for i, page in enumerate(reader.pages)
+        )
+
     def load_collection(
         self, sources: Sequence[str | IO | Path], password: Optional[str] = None, *args, **kwargs
     ) -> dict[str, list[TextArtifact]]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Optional
+from collections.abc import Iterator
 
 from attr import field, define, Factory
 from pathlib import Path
@@ -36,6 +37,14 @@ class TextLoader(BaseTextLoader):
     def load(self, source: str | Path, *args, **kwargs) -> list[TextArtifact]:
         return self._text_to_artifacts(source)
 
+    def iter_load(self, source: str | Path, *args, **kwargs) -> Iterator[TextArtifact]:
+        """Lazily loads artifacts, reading files incrementally instead of all at once."""
+        if isinstance(source, Path):
+            with open(source, encoding=self.encoding) as file:
+                yield from self._stream_to_artifacts(file)
+        else:
+            yield from self._stream_to_artifacts([source])
+
     def load_collection(self, sources: list[str | Path], *args, **kwargs) -> dict[str, list[TextArtifact]]:
         return utils.execute_futures_dict(
             {
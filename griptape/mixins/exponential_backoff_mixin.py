@@ -1,7 +1,7 @@
 import logging
 from abc import ABC
 from attr import define, field
-from tenacity import Retrying, wait_exponential, stop_after_attempt, retry_if_not_exception_type
+from tenacity import AsyncRetrying, Retrying, wait_exponential, stop_after_attempt, retry_if_not_exception_type
 from typing import Tuple, Type, Callable
 
 
@@ -21,3 +21,12 @@ class ExponentialBackoffMixin(ABC):
             reraise=True,
             after=self.after_hook,
         )
+
+    def aretrying(self) -> AsyncRetrying:
+        return AsyncRetrying(
+            wait=wait_exponential(min=self.min_retry_delay, max=self.max_retry_delay),
+            retry=retry_if_not_exception_type(self.ignored_exception_types),
+            stop=stop_after_attempt(self.max_attempts),
+            reraise=True,
+            after=self.after_hook,
+        )
@@ -8,7 +8,9 @@ from abc import ABC
 
 from marshmallow import Schema
 from griptape.schemas.base_schema import BaseSchema
+from griptape.schemas.fast_serializer import FastSerializer
 from importlib import import_module
+from functools import lru_cache
 
 T = TypeVar("T", bound="SerializableMixin")
 
@@ -23,7 +25,7 @@ class SerializableMixin(Generic[T]):
 
     @classmethod
     def get_schema(cls: type[T], subclass_name: Optional[str] = None) -> Schema:
-        """Generates a Marshmallow schema for the class.
+        """Gets the Marshmallow schema for the class. Schemas are generated once and shared.
 
         Args:
             subclass_name: An optional subclass name. Required if the class is abstract.
@@ -34,36 +36,90 @@ class SerializableMixin(Generic[T]):
 
             subclass_cls = cls._import_cls_rec(cls.__module__, subclass_name)
 
-            schema_class = BaseSchema.from_attrs_cls(subclass_cls)
+            return BaseSchema.schema_from_attrs_cls(subclass_cls)
         else:
-            schema_class = BaseSchema.from_attrs_cls(cls)
-
-        return schema_class()
+            return BaseSchema.schema_from_attrs_cls(cls)
 
     @classmethod
     def from_dict(cls: type[T], data: dict) -> T:
-        return cast(T, cls.get_schema(subclass_name=data["type"] if "type" in data else None).load(data))
+        subclass_name = data.get("type") if isinstance(data, dict) else None
+
+        if ABC not in cls.__bases__ or subclass_name is not None:
+            data_cls = cls._import_cls_rec(cls.__module__, subclass_name) if ABC in cls.__bases__ else cls
+            serializer = FastSerializer.from_attrs_cls(data_cls)
+            obj = None if serializer is None else serializer.load(data)
+
+            if obj is not None:
+                return cast(T, obj)
+
+        return cast(T, cls.get_schema(subclass_name=subclass_name).load(data))
 
     @classmethod
     def from_json(cls: type[T], data: str) -> T:
-        return cls.from_dict(json.loads(data))
+        """Deserializes a JSON string, parsing it with orjson when installed.
+
+        orjson parses integers that don't fit in 64 bits as floats. Input orjson rejects, such as NaN, is parsed with
+        the json module instead.
+        """
+        from griptape.utils import import_optional_dependency
+
+        try:
+            orjson = import_optional_dependency("orjson")
+        except ImportError:
+            return cls.from_dict(json.loads(data))
+
+        try:
+            data_dict = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            data_dict = json.loads(data)
+
+        return cls.from_dict(data_dict)
 
     def __str__(self) -> str:
         return json.dumps(self.to_dict())
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+    def to_json(self, compact: bool = False) -> str:
+        """Serializes to a JSON string.
+
+        Args:
+            compact: Whether to leave out whitespace and escape only what JSON requires. Uses orjson when installed,
+                which writes NaN and infinity as null. Data orjson can't encode, such as integers that don't fit in 64
+                bits, is written with the json module instead.
+        """
+        from griptape.utils import import_optional_dependency
+
+        data = self.to_dict()
+
+        if not compact:
+            return json.dumps(data)
+
+        try:
+            orjson = import_optional_dependency("orjson")
+        except ImportError:
+            orjson = None
+
+        if orjson is not None:
+            try:
+                return orjson.dumps(data).decode()
+            except orjson.JSONEncodeError:
+                pass
+
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
     def to_dict(self) -> dict:
-        schema = BaseSchema.from_attrs_cls(self.__class__)
+        serializer = FastSerializer.from_attrs_cls(self.__class__)
+        data = None if serializer is None else serializer.dump(self)
 
-        return dict(schema().dump(self))
+        if data is None:
+            return dict(BaseSchema.schema_from_attrs_cls(self.__class__).dump(self))
+        else:
+            return data
 
     @classmethod
     def _import_cls_rec(cls, module_name: str, class_name: str) -> type:
         """Imports a class given a module name and class name.
         Will recursively traverse up the module's path until it finds a
-        package that it can import `class_name` from.
+        package that it can import `class_name` from. Resolved classes are cached.
 
         Args:
             module_name: The module name.
@@ -72,18 +128,23 @@ class SerializableMixin(Generic[T]):
         Returns:
             The imported class if found. Raises `ValueError` if not found.
         """
-        try:
-            module = import_module(module_name)
-            test = getattr(module, class_name, None)
-        except ModuleNotFoundError:
-            test = None
-
-        if test is None:
-            module_dirs = module_name.split(".")[:-1]
-            module_name = ".".join(module_dirs)
-
-            if not len(module_dirs):
-                raise ValueError(f"Unable to import class: {class_name}")
-            return cls._import_cls_rec(module_name, class_name)
-        else:
-            return test
+        return _import_cls_rec(module_name, class_name)
+
+
+@lru_cache(maxsize=None)
+def _import_cls_rec(module_name: str, class_name: str) -> type:
+    try:
+        module = import_module(module_name)
+        test = getattr(module, class_name, None)
+    except ModuleNotFoundError:
+        test = None
+
+    if test is None:
+        module_dirs = module_name.split(".")[:-1]
+        module_name = ".".join(module_dirs)
+
+        if not len(module_dirs):
+            raise ValueError(f"Unable to import class: {class_name}")
+        return _import_cls_rec(module_name, class_name)
+    else:
+        return test
@@ -4,5 +4,7 @@ from .polymorphic_schema import PolymorphicSchema
 
 from .bytes_field import Bytes
 
+from .fast_serializer import FastSerializer
 
-__all__ = ["BaseSchema", "PolymorphicSchema", "Bytes"]
+
+__all__ = ["BaseSchema", "PolymorphicSchema", "Bytes", "FastSerializer"]
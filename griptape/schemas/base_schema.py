@@ -13,13 +13,47 @@ from griptape.schemas.bytes_field import Bytes
 class BaseSchema(Schema):
     DATACLASS_TYPE_MAPPING = {**Schema.TYPE_MAPPING, dict: fields.Dict, bytes: Bytes}
 
+    _schema_classes: dict[tuple[type, type], type] = {}
+    _schemas: dict[type, BaseSchema] = {}
+
     @classmethod
     def from_attrs_cls(cls, attrs_cls: type) -> type:
         """Generate a Schema from an attrs class.
 
+        Generated Schemas are cached per Schema class and attrs class.
+
         Args:
             attrs_cls: An attrs class.
         """
+        key = (cls, attrs_cls)
+        schema_class = BaseSchema._schema_classes.get(key)
+
+        if schema_class is None:
+            schema_class = cls._generate_schema_class(attrs_cls)
+            BaseSchema._schema_classes[key] = schema_class
+
+        return schema_class
+
+    @classmethod
+    def schema_from_attrs_cls(cls, attrs_cls: type) -> BaseSchema:
+        """Get a shared Schema instance for an attrs class.
+
+        Schema instances are stateless during `dump()` and `load()`, so one instance is reused per generated Schema.
+
+        Args:
+            attrs_cls: An attrs class.
+        """
+        schema_class = cls.from_attrs_cls(attrs_cls)
+        schema = BaseSchema._schemas.get(schema_class)
+
+        if schema is None:
+            schema = schema_class()
+            BaseSchema._schemas[schema_class] = schema
+
+        return schema
+
+    @classmethod
+    def _generate_schema_class(cls, attrs_cls: type) -> type:
         from marshmallow import post_load
         from griptape.mixins import SerializableMixin
 
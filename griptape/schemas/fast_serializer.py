@@ -0,0 +1,184 @@
+from __future__ import annotations
+from abc import ABC
+from typing import Any, Callable, ClassVar, Optional
+import attrs
+from attr import define, field
+
+
+class _UnsupportedValue(Exception):
+    pass
+
+
+@define(frozen=True)
+class FastSerializer:
+    """Serializes attrs classes with simple fields without going through Marshmallow.
+
+    Supports classes whose serializable fields are `str`, `int`, `float`, `bool`, `dict`, lists of those, or nested
+    non-abstract classes supported themselves. The output is the same as the output of the class's Marshmallow
+    schema. Values that the schema would coerce or reject are not handled, `dump()` and `load()` return `None` for
+    them and the caller falls back to the schema.
+
+    Attributes:
+        attrs_cls: The serialized attrs class.
+        fields: Name, dump function, and load function of each serializable field, in schema order.
+    """
+
+    PRIMITIVE_TYPES = (str, int, float, bool)
+
+    _serializers: ClassVar[dict[type, Optional[FastSerializer]]] = {}
+
+    attrs_cls: type = field()
+    fields: list[tuple[str, Callable[[Any], Any], Callable[[Any], Any]]] = field()
+
+    @classmethod
+    def from_attrs_cls(cls, attrs_cls: type) -> Optional[FastSerializer]:
+        """Returns the cached serializer of an attrs class or `None` if one of its fields isn't supported.
+
+        Args:
+            attrs_cls: An attrs class implementing `SerializableMixin`.
+        """
+        if attrs_cls not in FastSerializer._serializers:
+            FastSerializer._serializers[attrs_cls] = cls._generate(attrs_cls)
+
+        return FastSerializer._serializers[attrs_cls]
+
+    def dump(self, obj: Any) -> Optional[dict]:
+        try:
+            return {name: dump_field(getattr(obj, name)) for name, dump_field, _ in self.fields}
+        except _UnsupportedValue:
+            return None
+
+    def load(self, data: dict) -> Optional[Any]:
+        try:
+            return self.attrs_cls(**self._load_fields(data))
+        except _UnsupportedValue:
+            return None
+
+    def _load_fields(self, data: dict) -> dict:
+        if not isinstance(data, dict) or len(data) > len(self.fields):
+            raise _UnsupportedValue()
+
+        kwargs = {name: load_field(data[name]) for name, _, load_field in self.fields if name in data}
+
+        if len(kwargs) != len(data):
+            raise _UnsupportedValue()
+
+        return kwargs
+
+    @classmethod
+    def _generate(cls, attrs_cls: type) -> Optional[FastSerializer]:
+        from griptape.schemas import BaseSchema
+
+        # Resolves string annotations and validates the class like the Marshmallow path would.
+        BaseSchema.from_attrs_cls(attrs_cls)
+
+        fields = []
+
+        for a in attrs.fields(attrs_cls):
+            if a.metadata.get("serializable"):
+                functions = cls._functions_for_type(a.type)
+
+                if functions is None:
+                    return None
+
+                fields.append((a.name, *functions))
+
+        return FastSerializer(attrs_cls, fields)
+
+    @classmethod
+    def _functions_for_type(cls, field_type: Any) -> Optional[tuple[Callable[[Any], Any], Callable[[Any], Any]]]:
+        from griptape.schemas import BaseSchema
+
+        try:
+            field_class, args, optional = BaseSchema._get_field_type_info(field_type)
+        except TypeError:
+            return None
+
+        if not isinstance(field_class, type):
+            return None
+        elif field_class in cls.PRIMITIVE_TYPES:
+            return cls._primitive_functions(field_class, optional)
+        elif field_class is dict:
+            return cls._dict_functions(optional)
+        elif field_class is list and args:
+            item_functions = cls._functions_for_type(args[0])
+
+            return None if item_functions is None else cls._list_functions(*item_functions, optional)
+        elif attrs.has(field_class) and ABC not in field_class.__bases__:
+            serializer = cls.from_attrs_cls(field_class)
+
+            return None if serializer is None else cls._nested_functions(serializer, optional)
+        else:
+            return None
+
+    @staticmethod
+    def _primitive_functions(field_class: type, optional: bool) -> tuple[Callable, Callable]:
+        def dump(value: Any) -> Any:
+            if value is None or type(value) is field_class:
+                return value
+            else:
+                raise _UnsupportedValue()
+
+        def load(value: Any) -> Any:
+            if type(value) is field_class or (value is None and optional):
+                return value
+            else:
+                raise _UnsupportedValue()
+
+        return dump, load
+
+    @staticmethod
+    def _dict_functions(optional: bool) -> tuple[Callable, Callable]:
+        def dump(value: Any) -> Any:
+            if value is None:
+                return None
+            elif type(value) is dict:
+                return dict(value)
+            else:
+                raise _UnsupportedValue()
+
+        def load(value: Any) -> Any:
+            if type(value) is dict:
+                return dict(value)
+            elif value is None and optional:
+                return None
+            else:
+                raise _UnsupportedValue()
+
+        return dump, load
+
+    @staticmethod
+    def _list_functions(item_dump: Callable, item_load: Callable, optional: bool) -> tuple[Callable, Callable]:
+        def dump(value: Any) -> Any:
+            if value is None:
+                return None
+            elif type(value) is list:
+                return [item_dump(item) for item in value]
+            else:
+                raise _UnsupportedValue()
+
+        def load(value: Any) -> Any:
+            if type(value) is list:
+                return [item_load(item) for item in value]
+            elif value is None and optional:
+                return None
+            else:
+                raise _UnsupportedValue()
+
+        return dump, load
+
+    @staticmethod
+    def _nested_functions(serializer: FastSerializer, optional: bool) -> tuple[Callable, Callable]:
+        def dump(value: Any) -> Any:
+            if value is None:
+                return None
+            else:
+                return {name: dump_field(getattr(value, name)) for name, dump_field, _ in serializer.fields}
+
+        def load(value: Any) -> Any:
+            if value is None and optional:
+                return None
+            else:
+                return serializer.attrs_cls(**serializer._load_fields(value))
+
+        return dump, load
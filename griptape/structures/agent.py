@@ -1,8 +1,8 @@
 from __future__ import annotations
+import asyncio
 from typing import TYPE_CHECKING, Optional
 from attr import define, field
 from griptape.tools import BaseTool
-from griptape.memory.structure import Run
 from griptape.structures import Structure
 from griptape.tasks import PromptTask, ToolkitTask
 
@@ -38,6 +38,7 @@ class Agent(Structure):
         task.preprocess(self)
 
         self.tasks.append(task)
+        self._task_positions = {task.id: 0}
 
         return task
 
@@ -53,14 +54,17 @@ class Agent(Structure):
 
         self.task.execute()
 
-        if self.conversation_memory:
-            if isinstance(self.task.input, tuple):
-                input_text = self.task.input[0].to_text()
-            else:
-                input_text = self.task.input.to_text()
+        self._add_run_to_conversation_memory()
+
+        return self
+
+    async def try_arun(self, *args) -> Agent:
+        self._execution_args = args
+
+        self.task.reset()
 
-            run = Run(input=input_text, output=self.task.output.to_text())
+        await self.task.aexecute()
 
-            self.conversation_memory.add_run(run)
+        await asyncio.to_thread(self._add_run_to_conversation_memory)
 
         return self
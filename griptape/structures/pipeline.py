@@ -1,8 +1,8 @@
 from __future__ import annotations
+import asyncio
 from typing import TYPE_CHECKING, Optional, Any
 from attr import define
 from griptape.artifacts import ErrorArtifact
-from griptape.memory.structure import Run
 from griptape.structures import Structure
 
 if TYPE_CHECKING:
@@ -19,6 +19,7 @@ class Pipeline(Structure):
             task.parent_ids.append(self.output_task.id)
 
         self.tasks.append(task)
+        self._task_positions.setdefault(task.id, len(self.tasks) - 1)
 
         return task
 
@@ -39,6 +40,7 @@ class Pipeline(Structure):
 
         parent_index = self.tasks.index(parent_task)
         self.tasks.insert(parent_index + 1, task)
+        self._index_tasks()
 
         return task
 
@@ -49,15 +51,21 @@ class Pipeline(Structure):
 
         self.__run_from_task(self.input_task)
 
-        if self.conversation_memory:
-            if isinstance(self.input_task.input, tuple):
-                input_text = self.input_task.input[0].to_text()
-            else:
-                input_text = self.input_task.input.to_text()
+        self._add_run_to_conversation_memory()
+
+        return self
+
+    async def try_arun(self, *args) -> Pipeline:
+        self._execution_args = args
+
+        [task.reset() for task in self.tasks]
+
+        task = self.input_task
 
-            run = Run(input=input_text, output=self.output_task.output.to_text())
+        while task is not None and not isinstance(await task.aexecute(), ErrorArtifact):
+            task = next(iter(task.children), None)
 
-            self.conversation_memory.add_run(run)
+        await asyncio.to_thread(self._add_run_to_conversation_memory)
 
         return self
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures as futures
 import logging
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from logging import Logger
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -26,10 +29,11 @@ from griptape.events.finish_structure_run_event import FinishStructureRunEvent
 from griptape.events.start_structure_run_event import StartStructureRunEvent
 from griptape.memory import TaskMemory
 from griptape.memory.meta import MetaMemory
-from griptape.memory.structure import ConversationMemory
+from griptape.memory.structure import ConversationMemory, Run
 from griptape.memory.task.storage import BlobArtifactStorage, TextArtifactStorage
 from griptape.rules import Rule, Ruleset
 from griptape.tasks import BaseTask
+from griptape.utils import BatchRunner
 from griptape.utils.decorators import deprecated
 
 if TYPE_CHECKING:
@@ -66,6 +70,7 @@ class Structure(ABC):
     meta_memory: MetaMemory = field(default=Factory(lambda: MetaMemory()), kw_only=True)
     _execution_args: tuple = ()
     _logger: Optional[Logger] = None
+    _task_positions: dict[str, int] = field(factory=dict, init=False, eq=False)
 
     @rulesets.validator  # pyright: ignore
     def validate_rulesets(self, _, rulesets: list[Ruleset]) -> None:
@@ -248,10 +253,21 @@ class Structure(ABC):
         return any(s for s in self.tasks if s.is_executing())
 
     def find_task(self, task_id: str) -> BaseTask:
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        raise ValueError(f"Task with id {task_id} doesn't exist.")
+        """Finds a task by id.
+
+        `add_task()` and `insert_task()` index the position of each task in `tasks`, so finding them takes constant
+        time. Tasks added to or replaced in `tasks` directly are found by scanning `tasks`, which reindexes them.
+        """
+        position = self._task_positions.get(task_id)
+
+        if position is not None and position < len(self.tasks) and self.tasks[position].id == task_id:
+            return self.tasks[position]
+        elif any(task.id == task_id for task in self.tasks):
+            self._index_tasks()
+
+            return self.tasks[self._task_positions[task_id]]
+        else:
+            raise ValueError(f"Task with id {task_id} doesn't exist.")
 
     def add_tasks(self, *tasks: BaseTask) -> list[BaseTask]:
         return [self.add_task(s) for s in tasks]
@@ -301,3 +317,53 @@ class Structure(ABC):
     @abstractmethod
     def try_run(self, *args) -> Structure:
         ...
+
+    def run_many(self, inputs: Iterable[Any], max_concurrency: int = 8) -> Iterator[BatchRunner.Result]:
+        """Runs copies of the structure over the inputs concurrently, yielding results as they complete.
+
+        Use `BatchRunner` directly for throughput and latency stats or a custom executor.
+
+        Args:
+            inputs: Inputs to run the structure with. Tuples are unpacked into multiple args.
+            max_concurrency: Maximum number of inputs running at once.
+        """
+        executor = futures.ThreadPoolExecutor(max_workers=max_concurrency)
+
+        try:
+            yield from BatchRunner(structure=self, max_concurrency=max_concurrency, futures_executor=executor).run(
+                inputs
+            )
+        finally:
+            # Doesn't wait for the runs in flight when the caller stops iterating early.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def arun(self, *args) -> Structure:
+        """Runs the structure like `run()` without blocking the event loop."""
+        self.before_run()
+
+        result = await self.try_arun(*args)
+
+        self.after_run()
+
+        return result
+
+    async def try_arun(self, *args) -> Structure:
+        """Runs `try_run()` in a thread. Structures that can await their tasks override it."""
+        return await asyncio.to_thread(self.try_run, *args)
+
+    def _index_tasks(self) -> None:
+        self._task_positions = {}
+
+        for position, task in enumerate(self.tasks):
+            self._task_positions.setdefault(task.id, position)
+
+    def _add_run_to_conversation_memory(self) -> None:
+        if self.conversation_memory:
+            if isinstance(self.input_task.input, tuple):
+                input_text = self.input_task.input[0].to_text()
+            else:
+                input_text = self.input_task.input.to_text()
+
+            run = Run(input=input_text, output=self.output_task.output.to_text())
+
+            self.conversation_memory.add_run(run)
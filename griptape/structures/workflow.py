@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 import concurrent.futures as futures
 from graphlib import TopologicalSorter
 from typing import Any
@@ -6,7 +7,6 @@ from attr import define, field, Factory
 from griptape.artifacts import ErrorArtifact
 from griptape.structures import Structure
 from griptape.tasks import BaseTask
-from griptape.memory.structure import Run
 
 
 @define
@@ -21,6 +21,7 @@ class Workflow(Structure):
             task.parent_ids.append(self.output_task.id)
 
         self.tasks.append(task)
+        self._task_positions.setdefault(task.id, len(self.tasks) - 1)
 
         return task
 
@@ -87,49 +88,93 @@ class Workflow(Structure):
             parent_index = self.tasks.index(parent_task)
             self.tasks.insert(parent_index + 1, task)
 
+        self._index_tasks()
+
         return task
 
     def try_run(self, *args) -> Workflow:
+        """Executes the tasks as soon as all of their parents are finished.
+
+        Each task tracks the number of parents left to finish. When a task finishes, the counts of its children are
+        decremented and the children without unfinished parents are submitted right away, without waiting for other
+        executing tasks. Stops submitting tasks after a task outputs an `ErrorArtifact`.
+        """
         self._execution_args = args
-        ordered_tasks = self.order_tasks()
-        exit_loop = False
+        tasks, unfinished_parent_counts, child_ids = self._task_dependencies()
+
+        futures_list = {
+            self.futures_executor.submit(task.execute): task
+            for task in tasks.values()
+            if task.is_pending() and unfinished_parent_counts[task.id] == 0
+        }
 
-        while not self.is_finished() and not exit_loop:
-            futures_list = {}
+        while futures_list:
+            done, _ = futures.wait(futures_list, return_when=futures.FIRST_COMPLETED)
 
-            for task in ordered_tasks:
-                if task.can_execute():
-                    future = self.futures_executor.submit(task.execute)
-                    futures_list[future] = task
+            for future in done:
+                task = futures_list.pop(future)
 
-            # Wait for all tasks to complete
-            for future in futures.as_completed(futures_list):
                 if isinstance(future.result(), ErrorArtifact):
-                    exit_loop = True
+                    futures_list.clear()
 
                     break
 
-        if self.conversation_memory:
-            if isinstance(self.input_task.input, tuple):
-                input_text = self.input_task.input[0].to_text()
-            else:
-                input_text = self.input_task.input.to_text()
+                for child_id in child_ids[task.id]:
+                    unfinished_parent_counts[child_id] -= 1
 
-            run = Run(input=input_text, output=self.output_task.output.to_text())
+                    if unfinished_parent_counts[child_id] == 0 and tasks[child_id].is_pending():
+                        futures_list[self.futures_executor.submit(tasks[child_id].execute)] = tasks[child_id]
 
-            self.conversation_memory.add_run(run)
+        self._add_run_to_conversation_memory()
+
+        return self
+
+    async def try_arun(self, *args) -> Workflow:
+        """Executes the tasks like `try_run()`, as coroutines on the running event loop.
+
+        Tasks still executing when a task outputs an `ErrorArtifact` are awaited before returning.
+        """
+        self._execution_args = args
+        tasks, unfinished_parent_counts, child_ids = self._task_dependencies()
+
+        pending = {
+            asyncio.ensure_future(task.aexecute()): task
+            for task in tasks.values()
+            if task.is_pending() and unfinished_parent_counts[task.id] == 0
+        }
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                task = pending.pop(future)
+
+                if isinstance(future.result(), ErrorArtifact):
+                    if pending:
+                        await asyncio.wait(pending)
+
+                    pending.clear()
+
+                    break
+
+                for child_id in child_ids[task.id]:
+                    unfinished_parent_counts[child_id] -= 1
+
+                    if unfinished_parent_counts[child_id] == 0 and tasks[child_id].is_pending():
+                        pending[asyncio.ensure_future(tasks[child_id].aexecute())] = tasks[child_id]
+
+        await asyncio.to_thread(self._add_run_to_conversation_memory)
 
         return self
 
     def context(self, task: BaseTask) -> dict[str, Any]:
         context = super().context(task)
+        parents = task.parents
 
         context.update(
             {
-                "parent_outputs": {
-                    parent.id: parent.output.to_text() if parent.output else "" for parent in task.parents
-                },
-                "parents": {parent.id: parent for parent in task.parents},
+                "parent_outputs": {parent.id: parent.output.to_text() if parent.output else "" for parent in parents},
+                "parents": {parent.id: parent for parent in parents},
                 "children": {child.id: child for child in task.children},
             }
         )
@@ -137,16 +182,37 @@ class Workflow(Structure):
         return context
 
     def to_graph(self) -> dict[str, set[str]]:
-        graph: dict[str, set[str]] = {}
-
-        for key_task in self.tasks:
-            graph[key_task.id] = set()
+        graph: dict[str, set[str]] = {task.id: set() for task in self.tasks}
 
-            for value_task in self.tasks:
-                if key_task.id in value_task.child_ids:
-                    graph[key_task.id].add(value_task.id)
+        for task in self.tasks:
+            for child_id in task.child_ids:
+                if child_id in graph:
+                    graph[child_id].add(task.id)
 
         return graph
 
     def order_tasks(self) -> list[BaseTask]:
         return [self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()]
+
+    def _task_dependencies(self) -> tuple[dict[str, BaseTask], dict[str, int], dict[str, list[str]]]:
+        """Returns the tasks by id, the number of unfinished parents of each task, and the children of each task.
+
+        Only children that wait on their parent are listed. Raises `CycleError` if the tasks contain a cycle.
+        """
+        tasks = {task.id: task for task in self.tasks}
+        unfinished_parent_counts = {}
+        child_ids: dict[str, list[str]] = {task_id: [] for task_id in tasks}
+
+        TopologicalSorter({task_id: task.parent_ids for task_id, task in tasks.items()}).prepare()
+
+        for task in tasks.values():
+            unfinished_parent_counts[task.id] = 0
+
+            for parent_id in task.parent_ids:
+                if parent_id not in tasks:
+                    raise ValueError(f"Task with id {parent_id} doesn't exist.")
+                elif not tasks[parent_id].is_finished():
+                    unfinished_parent_counts[task.id] += 1
+                    child_ids[parent_id].append(task.id)
+
+        return tasks, unfinished_parent_counts, child_ids
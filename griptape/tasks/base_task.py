@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import copy
 import uuid
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
 from collections.abc import Sequence
 
+import attrs
 from attr import define, field, Factory
 
 from griptape.events import StartTaskEvent, FinishTaskEvent
@@ -117,6 +120,25 @@ class BaseTask(ABC):
 
             return self.output
 
+    async def aexecute(self) -> Optional[BaseArtifact]:
+        """Executes the task like `execute()` but awaits `arun()`."""
+        try:
+            self.state = BaseTask.State.EXECUTING
+
+            self.before_run()
+
+            self.output = await self.arun()
+
+            self.after_run()
+        except Exception as e:
+            self.structure.logger.error(f"{self.__class__.__name__} {self.id}\n{e}", exc_info=True)
+
+            self.output = ErrorArtifact(str(e))
+        finally:
+            self.state = BaseTask.State.FINISHED
+
+            return self.output
+
     def can_execute(self) -> bool:
         return self.state == BaseTask.State.PENDING and all(parent.is_finished() for parent in self.parents)
 
@@ -126,10 +148,31 @@ class BaseTask(ABC):
 
         return self
 
+    def copy(self) -> BaseTask:
+        """Returns a pending copy of the task that isn't added to a Structure.
+
+        Drivers, engines, and tools are shared with the copy. Lists and dicts, such as `parent_ids` and `context`, are
+        copied so running the copy leaves the task unchanged.
+        """
+        task = attrs.evolve(self, state=BaseTask.State.PENDING)
+        task.structure = None
+
+        for a in attrs.fields(type(task)):
+            value = getattr(task, a.name)
+
+            if isinstance(value, (list, dict)):
+                setattr(task, a.name, copy.copy(value))
+
+        return task
+
     @abstractmethod
     def run(self) -> BaseArtifact:
         ...
 
+    async def arun(self) -> BaseArtifact:
+        """Runs `run()` in a thread. Tasks that can await their drivers override it."""
+        return await asyncio.to_thread(self.run)
+
     @property
     def full_context(self) -> dict[str, Any]:
         if self.structure:
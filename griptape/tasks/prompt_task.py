@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 from typing import TYPE_CHECKING, Optional, Callable
 from attr import define, field, Factory
 from griptape.utils import PromptStack
@@ -63,3 +64,12 @@ class PromptTask(BaseTextInputTask):
         self.output = self.prompt_driver.run(self.prompt_stack)
 
         return self.output
+
+    async def arun(self) -> BaseArtifact:
+        self.output = await self.prompt_driver.arun(await self._aprompt_stack())
+
+        return self.output
+
+    async def _aprompt_stack(self) -> PromptStack:
+        """Builds `prompt_stack` in a thread, since pruning Conversation Memory counts tokens."""
+        return await asyncio.to_thread(lambda: self.prompt_stack)
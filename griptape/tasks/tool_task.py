@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 import json
 from typing import Optional, TYPE_CHECKING
 from attr import define, field
@@ -64,6 +65,22 @@ class ToolTask(PromptTask, ActionSubtaskOriginMixin):
 
         return self.output
 
+    async def arun(self) -> BaseArtifact:
+        prompt_output = (await self.prompt_driver.arun(prompt_stack=await self._aprompt_stack())).to_text()
+
+        subtask = self.add_subtask(ActionSubtask(f"Action: {prompt_output}"))
+
+        subtask.before_run()
+        await asyncio.to_thread(subtask.run)
+        subtask.after_run()
+
+        if subtask.output:
+            self.output = subtask.output
+        else:
+            self.output = InfoArtifact("No tool output")
+
+        return self.output
+
     def find_tool(self, tool_name: str) -> BaseTool:
         if self.tool.name == tool_name:
             return self.tool
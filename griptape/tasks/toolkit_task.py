@@ -1,5 +1,8 @@
 from __future__ import annotations
+import asyncio
+import concurrent.futures as futures
 import json
+import re
 from typing import TYPE_CHECKING, Callable, Optional
 from attr import define, field, Factory
 from griptape import utils
@@ -19,6 +22,7 @@ if TYPE_CHECKING:
 @define
 class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
     DEFAULT_MAX_STEPS = 20
+    ACTION_START_PATTERN = r"(?m)^(?=Action:)"
 
     tools: list[BaseTool] = field(factory=list, kw_only=True)
     max_subtasks: int = field(default=DEFAULT_MAX_STEPS, kw_only=True)
@@ -30,6 +34,8 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
     generate_user_subtask_template: Callable[[ActionSubtask], str] = field(
         default=Factory(lambda self: self.default_user_subtask_template_generator, takes_self=True), kw_only=True
     )
+    futures_executor: futures.Executor = field(default=Factory(lambda: futures.ThreadPoolExecutor()), kw_only=True)
+    _prompt_stack: Optional[PromptStack] = field(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
         if self.task_memory:
@@ -75,6 +81,12 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
             # inserting at index 1 to place memory right after system prompt
             stack.add_conversation_memory(memory, 1)
 
+        # The stack is rebuilt for every subtask, so only inputs added since the previous subtask are tokenized again.
+        if self._prompt_stack is not None:
+            stack.reuse_token_counts(self._prompt_stack)
+
+        self._prompt_stack = stack
+
         return stack
 
     def preprocess(self, structure: Structure) -> ToolkitTask:
@@ -125,34 +137,73 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
                     tool.output_memory = {getattr(a, "name"): [self.task_memory] for a in tool.activities()}
 
     def run(self) -> BaseArtifact:
-        from griptape.tasks import ActionSubtask
+        """Runs actions until the Prompt Driver answers.
 
+        Several actions in one Prompt Driver response are parsed into separate subtasks and run concurrently on
+        `futures_executor`. Their outputs are added to the next prompt in the order of the actions.
+        """
         self.subtasks.clear()
 
-        subtask = self.add_subtask(ActionSubtask(self.prompt_driver.run(prompt_stack=self.prompt_stack).to_text()))
+        subtasks = self.add_subtasks(*self.subtasks_from_prompt(self.prompt_driver.run(prompt_stack=self.prompt_stack)))
 
         while True:
-            if subtask.output is None:
-                if len(self.subtasks) >= self.max_subtasks:
-                    subtask.output = ErrorArtifact(f"Exceeded tool limit of {self.max_subtasks} subtasks per task")
-                elif subtask.action_name is None:
-                    # handle case when the LLM failed to follow the ReAct prompt and didn't return a proper action
-                    subtask.output = subtask.input
-                else:
-                    subtask.before_run()
-                    subtask.run()
-                    subtask.after_run()
-
-                    subtask = self.add_subtask(
-                        ActionSubtask(self.prompt_driver.run(prompt_stack=self.prompt_stack).to_text())
-                    )
+            pending_subtasks, output = self._prepare_subtasks(subtasks)
+
+            if len(pending_subtasks) == 1:
+                self._execute_subtask(pending_subtasks[0])
+            elif pending_subtasks:
+                utils.execute_futures_list(
+                    [self.futures_executor.submit(self._execute_subtask, s) for s in pending_subtasks]
+                )
+
+            if output is None:
+                subtasks = self.add_subtasks(
+                    *self.subtasks_from_prompt(self.prompt_driver.run(prompt_stack=self.prompt_stack))
+                )
+            else:
+                break
+
+        self.output = output
+
+        return self.output
+
+    async def arun(self) -> BaseArtifact:
+        """Runs the task like `run()`, awaiting the Prompt Driver and running the actions in threads."""
+        self.subtasks.clear()
+
+        subtasks = self.add_subtasks(
+            *self.subtasks_from_prompt(await self.prompt_driver.arun(prompt_stack=await self._aprompt_stack()))
+        )
+
+        while True:
+            pending_subtasks, output = self._prepare_subtasks(subtasks)
+
+            await asyncio.gather(*(asyncio.to_thread(self._execute_subtask, s) for s in pending_subtasks))
+
+            if output is None:
+                subtasks = self.add_subtasks(
+                    *self.subtasks_from_prompt(await self.prompt_driver.arun(prompt_stack=await self._aprompt_stack()))
+                )
             else:
                 break
 
-        self.output = subtask.output
+        self.output = output
 
         return self.output
 
+    def subtasks_from_prompt(self, prompt_output: BaseArtifact) -> list[ActionSubtask]:
+        """Returns one subtask per action in a Prompt Driver response.
+
+        The text before the first action, such as the thought, goes to the first subtask.
+        """
+        value = prompt_output.to_text()
+        chunks = re.split(self.ACTION_START_PATTERN, value)
+
+        if len(chunks) > 2:
+            return [ActionSubtask(chunks[0] + chunks[1]), *(ActionSubtask(chunk) for chunk in chunks[2:])]
+        else:
+            return [ActionSubtask(value)]
+
     def find_subtask(self, subtask_id: str) -> ActionSubtask:
         for subtask in self.subtasks:
             if subtask.id == subtask_id:
@@ -160,14 +211,68 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
         raise ValueError(f"Subtask with id {subtask_id} not found.")
 
     def add_subtask(self, subtask: ActionSubtask) -> ActionSubtask:
-        subtask.attach_to(self)
+        return self.add_subtasks(subtask)[0]
+
+    def add_subtasks(self, *subtasks: ActionSubtask) -> list[ActionSubtask]:
+        """Adds subtasks from one Prompt Driver response as children of the subtasks from the previous response."""
+        parents = [subtask for subtask in self.subtasks if not subtask.child_ids]
+
+        for subtask in subtasks:
+            subtask.attach_to(self)
+
+            for parent in parents:
+                parent.add_child(subtask)
+
+            self.subtasks.append(subtask)
+
+        return list(subtasks)
+
+    def _prepare_subtasks(self, subtasks: list[ActionSubtask]) -> tuple[list[ActionSubtask], Optional[BaseArtifact]]:
+        """Decides what to do with the subtasks from one Prompt Driver response.
+
+        A single subtask without an action answers the task. Otherwise, every subtask with an action is run. Subtasks
+        without an action and subtasks over `max_subtasks` get an `ErrorArtifact` output instead, so that the Prompt
+        Driver sees which actions didn't run.
+
+        Returns:
+            The subtasks to run and the task output, which is `None` while the Prompt Driver should be called again.
+        """
+        if len(subtasks) == 1 and subtasks[0].action_name is None:
+            subtask = subtasks[0]
+
+            if subtask.output is None:
+                # handle case when the LLM failed to follow the ReAct prompt and didn't return a proper action
+                subtask.output = subtask.input
+
+            return [], subtask.output
+
+        pending_subtasks = []
+        output = None
+        position = len(self.subtasks) - len(subtasks)
+
+        for subtask in subtasks:
+            position += 1
+
+            if subtask.output is not None:
+                continue
+            elif position >= self.max_subtasks:
+                subtask.output = ErrorArtifact(f"Exceeded tool limit of {self.max_subtasks} subtasks per task")
+
+                if output is None:
+                    output = subtask.output
+            elif subtask.action_name is None:
+                subtask.output = ErrorArtifact("Action is malformed and wasn't run")
+            else:
+                pending_subtasks.append(subtask)
 
-        if len(self.subtasks) > 0:
-            self.subtasks[-1].add_child(subtask)
+        return pending_subtasks, output
 
-        self.subtasks.append(subtask)
+    def _execute_subtask(self, subtask: ActionSubtask) -> BaseArtifact:
+        subtask.before_run()
+        subtask.run()
+        subtask.after_run()
 
-        return subtask
+        return subtask.output
 
     def find_tool(self, tool_name: str) -> BaseTool:
         for tool in self.tools:
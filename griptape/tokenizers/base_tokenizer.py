@@ -20,3 +20,10 @@ class BaseTokenizer(ABC):
     @abstractmethod
     def count_tokens(self, text: str | list[dict]) -> int:
         ...
+
+    def token_offsets(self, text: str) -> list[int]:
+        """Returns the character offset at which each token of the text starts.
+
+        Tokenizers that can't map tokens back to characters raise `NotImplementedError`.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support token offsets.")
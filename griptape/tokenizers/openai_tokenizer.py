@@ -1,11 +1,23 @@
 from __future__ import annotations
+import bisect
 import logging
+from functools import lru_cache
+from itertools import accumulate
 from attr import define, field, Factory
 import tiktoken
 from griptape.tokenizers import BaseTokenizer
 from typing import Optional
 
 
+@lru_cache(maxsize=None)
+def _encoding_for_model(model: str) -> Optional[tiktoken.Encoding]:
+    """Resolves the tiktoken encoding of a model once per process. Returns `None` for unknown models."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return None
+
+
 @define(frozen=True)
 class OpenAiTokenizer(BaseTokenizer):
     DEFAULT_OPENAI_GPT_3_COMPLETION_MODEL = "text-davinci-003"
@@ -45,10 +57,9 @@ class OpenAiTokenizer(BaseTokenizer):
 
     @property
     def encoding(self) -> tiktoken.Encoding:
-        try:
-            return tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            return tiktoken.get_encoding(self.DEFAULT_ENCODING)
+        encoding = _encoding_for_model(self.model)
+
+        return tiktoken.get_encoding(self.DEFAULT_ENCODING) if encoding is None else encoding
 
     def default_max_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_TOKENS.items() if self.model.startswith(k)), None)
@@ -64,9 +75,9 @@ class OpenAiTokenizer(BaseTokenizer):
         if isinstance(text, list):
             model = model if model else self.model
 
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
+            encoding = _encoding_for_model(model)
+
+            if encoding is None:
                 logging.warning("model not found. Using cl100k_base encoding.")
 
                 encoding = tiktoken.get_encoding("cl100k_base")
@@ -114,3 +125,16 @@ class OpenAiTokenizer(BaseTokenizer):
             return num_tokens
         else:
             return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+
+    def token_offsets(self, text: str) -> list[int]:
+        tokens = self.encoding.encode(text, allowed_special=set(self.stop_sequences))
+        # Cheaper than tiktoken's decode_with_offsets(), which walks the bytes of every token in Python.
+        byte_offsets = list(accumulate((len(b) for b in self.encoding.decode_tokens_bytes(tokens[:-1])), initial=0))
+
+        if text.isascii():
+            return byte_offsets[: len(tokens)]
+        else:
+            # Tokens can start in the middle of a multibyte character, map them to the character they start in.
+            char_byte_offsets = [i for i, b in enumerate(text.encode("utf-8")) if b & 0xC0 != 0x80]
+
+            return [bisect.bisect_right(char_byte_offsets, offset) - 1 for offset in byte_offsets[: len(tokens)]]
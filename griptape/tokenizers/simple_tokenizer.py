@@ -14,3 +14,6 @@ class SimpleTokenizer(BaseTokenizer):
             return num_tokens
         else:
             raise ValueError("Text must be a string.")
+
+    def token_offsets(self, text: str) -> list[int]:
+        return list(range(0, len(text), self.characters_per_token))
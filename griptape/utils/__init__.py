@@ -5,7 +5,7 @@ from .manifest_validator import ManifestValidator
 from .python_runner import PythonRunner
 from .command_runner import CommandRunner
 from .chat import Chat
-from .futures import execute_futures_dict
+from .futures import execute_futures_dict, execute_futures_list
 from .token_counter import TokenCounter
 from .prompt_stack import PromptStack
 from .dict_utils import remove_null_values_in_dict_recursively
@@ -16,6 +16,7 @@ from .stream import Stream
 from .constants import Constants as constants
 from .load_artifact_from_memory import load_artifact_from_memory
 from .xml_utils import schema_to_xml
+from .batch_runner import BatchRunner
 
 
 def minify_json(value: str) -> str:
@@ -33,6 +34,7 @@ __all__ = [
     "str_to_hash",
     "import_optional_dependency",
     "execute_futures_dict",
+    "execute_futures_list",
     "TokenCounter",
     "PromptStack",
     "remove_null_values_in_dict_recursively",
@@ -41,4 +43,5 @@ __all__ = [
     "constants",
     "load_artifact_from_memory",
     "schema_to_xml",
+    "BatchRunner",
 ]
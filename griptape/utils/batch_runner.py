@@ -0,0 +1,174 @@
+from __future__ import annotations
+import concurrent.futures as futures
+import copy
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional
+from attr import define, field, Factory
+from griptape.artifacts import ErrorArtifact
+
+if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
+    from griptape.structures import Structure
+
+
+@define
+class BatchRunner:
+    """Runs a Structure over many inputs with bounded concurrency, yielding results as they complete.
+
+    Each input runs on a copy of the Structure with its own id, tasks, and execution args, so runs don't interfere with
+    each other or with the Structure. Copies share the Structure's config, drivers, Task Memory, and Event Listeners, and
+    have no Conversation Memory. Inputs are consumed lazily, so they can be a generator over a large dataset.
+
+    Attributes:
+        structure: The Structure to run.
+        max_concurrency: Maximum number of inputs running at once.
+        futures_executor: Executor that runs the Structure copies.
+        stats: Throughput and latency of the current or last `run()`.
+    """
+
+    @define
+    class Result:
+        """The outcome of running the Structure over one input.
+
+        Attributes:
+            index: Position of the input.
+            args: Arguments the Structure copy was run with.
+            structure: The Structure copy, with the tasks of the run.
+            latency: Seconds the run took.
+            error: Exception raised by the run, if any.
+        """
+
+        index: int = field(kw_only=True)
+        args: tuple = field(kw_only=True)
+        structure: Structure = field(kw_only=True)
+        latency: float = field(kw_only=True)
+        error: Optional[Exception] = field(default=None, kw_only=True)
+
+        @property
+        def output(self) -> Optional[BaseArtifact]:
+            if self.error is None and self.structure.output_task is not None:
+                return self.structure.output_task.output
+            else:
+                return None
+
+        def is_error(self) -> bool:
+            return self.error is not None or isinstance(self.output, ErrorArtifact)
+
+    @define
+    class Stats:
+        """Throughput and latency of a batch.
+
+        Attributes:
+            completed: Number of finished runs, including failed ones.
+            failed: Number of runs that raised or output an `ErrorArtifact`.
+            elapsed: Seconds since the batch started.
+            latencies: Seconds each finished run took, in completion order.
+        """
+
+        completed: int = field(default=0, kw_only=True)
+        failed: int = field(default=0, kw_only=True)
+        elapsed: float = field(default=0.0, kw_only=True)
+        latencies: list[float] = field(factory=list, kw_only=True)
+
+        @property
+        def throughput(self) -> float:
+            return self.completed / self.elapsed if self.elapsed else 0.0
+
+        @property
+        def mean_latency(self) -> float:
+            return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+        def latency_percentile(self, percentile: float) -> float:
+            if self.latencies:
+                latencies = sorted(self.latencies)
+
+                return latencies[min(int(len(latencies) * percentile / 100), len(latencies) - 1)]
+            else:
+                return 0.0
+
+    structure: Structure = field(kw_only=True)
+    max_concurrency: int = field(default=8, kw_only=True)
+    futures_executor: futures.Executor = field(
+        default=Factory(lambda self: futures.ThreadPoolExecutor(max_workers=self.max_concurrency), takes_self=True),
+        kw_only=True,
+    )
+    stats: BatchRunner.Stats = field(factory=lambda: BatchRunner.Stats(), init=False)
+
+    def run(self, inputs: Iterable[Any]) -> Iterator[BatchRunner.Result]:
+        """Runs the Structure over the inputs and yields results in completion order.
+
+        Runs that haven't started are cancelled if iteration stops early.
+
+        Args:
+            inputs: Inputs to run the Structure with. Tuples are unpacked into multiple args.
+        """
+        self.stats = BatchRunner.Stats()
+        start = time.perf_counter()
+        indexed_inputs = enumerate(inputs)
+        futures_list: set[futures.Future] = set()
+
+        def submit_next() -> None:
+            for index, value in indexed_inputs:
+                args = value if isinstance(value, tuple) else (value,)
+
+                futures_list.add(self.futures_executor.submit(self._run_copy, index, args))
+
+                break
+
+        for _ in range(self.max_concurrency):
+            submit_next()
+
+        try:
+            while futures_list:
+                done, _ = futures.wait(futures_list, return_when=futures.FIRST_COMPLETED)
+
+                for future in done:
+                    futures_list.remove(future)
+                    result = future.result()
+
+                    self.stats.completed += 1
+                    self.stats.failed += int(result.is_error())
+                    self.stats.latencies.append(result.latency)
+                    self.stats.elapsed = time.perf_counter() - start
+
+                    submit_next()
+
+                    yield result
+        finally:
+            for future in futures_list:
+                future.cancel()
+
+    def _run_copy(self, index: int, args: tuple) -> BatchRunner.Result:
+        structure = self._copy_structure()
+        start = time.perf_counter()
+
+        try:
+            structure.run(*args)
+
+            return BatchRunner.Result(index=index, args=args, structure=structure, latency=time.perf_counter() - start)
+        except Exception as e:
+            structure.logger.error(f"{structure.__class__.__name__} {structure.id} input {index}\n{e}", exc_info=True)
+
+            return BatchRunner.Result(
+                index=index, args=args, structure=structure, latency=time.perf_counter() - start, error=e
+            )
+
+    def _copy_structure(self) -> Structure:
+        from griptape.memory.meta import MetaMemory
+
+        structure = copy.copy(self.structure)
+        tasks = [task.copy() for task in self.structure.tasks]
+
+        structure.id = uuid.uuid4().hex
+        structure.tasks = tasks
+        structure._index_tasks()
+        structure._execution_args = ()
+        structure.conversation_memory = None
+        structure.meta_memory = MetaMemory()
+
+        for task in tasks:
+            task.preprocess(structure)
+
+        return structure
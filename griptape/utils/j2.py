@@ -1,19 +1,37 @@
+from functools import lru_cache
 from typing import Optional
 from attr import define, field, Factory
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from .paths import abs_path
 
+TEMPLATES_DIR = abs_path("templates")
+
+
+@lru_cache(maxsize=None)
+def _environment(templates_dir: str) -> Environment:
+    """Creates one Jinja environment per templates directory so compiled templates are shared by all `J2` instances.
+
+    Bundled templates don't change at runtime, so their environment skips the modification time check on every lookup.
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=templates_dir != TEMPLATES_DIR,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _template_from_string(environment: Environment, value: str) -> Template:
+    return environment.from_string(value)
+
 
 @define(frozen=True)
 class J2:
     template_name: Optional[str] = field(default=None)
-    templates_dir: str = field(default=abs_path("templates"), kw_only=True)
+    templates_dir: str = field(default=TEMPLATES_DIR, kw_only=True)
     environment: Environment = field(
-        default=Factory(
-            lambda self: Environment(loader=FileSystemLoader(self.templates_dir), trim_blocks=True, lstrip_blocks=True),
-            takes_self=True,
-        ),
-        kw_only=True,
+        default=Factory(lambda self: _environment(self.templates_dir), takes_self=True), kw_only=True
     )
 
     def render(self, **kwargs) -> str:
@@ -23,4 +41,4 @@ class J2:
             return self.environment.get_template(self.template_name).render(kwargs).rstrip()
 
     def render_from_string(self, value: str, **kwargs) -> str:
-        return self.environment.from_string(value).render(kwargs)
+        return _template_from_string(self.environment, value).render(kwargs)
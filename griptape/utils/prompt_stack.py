@@ -1,11 +1,14 @@
 from __future__ import annotations
+from bisect import bisect_left
 from typing import TYPE_CHECKING, Optional
 from attr import define, field
 
 from griptape.mixins import SerializableMixin
 
 if TYPE_CHECKING:
+    from griptape.drivers import BasePromptDriver
     from griptape.memory.structure import BaseConversationMemory
+    from griptape.tokenizers import BaseTokenizer
 
 
 @define
@@ -19,6 +22,19 @@ class PromptStack(SerializableMixin):
     class Input(SerializableMixin):
         content: str = field(metadata={"serializable": True})
         role: str = field(metadata={"serializable": True})
+        _token_counts: dict[int, tuple[BaseTokenizer, str, int]] = field(factory=dict, init=False, eq=False)
+
+        def token_count(self, tokenizer: BaseTokenizer) -> int:
+            """Returns the number of tokens in the content, tokenizing it only once per tokenizer and content."""
+            cached = self._token_counts.get(id(tokenizer))
+
+            if cached is not None and cached[0] is tokenizer and cached[1] == self.content:
+                return cached[2]
+            else:
+                token_count = tokenizer.count_tokens(self.content)
+                self._token_counts[id(tokenizer)] = (tokenizer, self.content, token_count)
+
+                return token_count
 
         def is_generic(self) -> bool:
             return self.role == PromptStack.GENERIC_ROLE
@@ -34,6 +50,23 @@ class PromptStack(SerializableMixin):
 
     inputs: list[Input] = field(factory=list, kw_only=True, metadata={"serializable": True})
 
+    def token_count(self, tokenizer: BaseTokenizer) -> int:
+        """Returns the total number of tokens in the contents of the inputs, using their memoized token counts."""
+        return sum(i.token_count(tokenizer) for i in self.inputs)
+
+    def reuse_token_counts(self, prompt_stack: PromptStack) -> None:
+        """Reuses the memoized token counts of the inputs of another Prompt Stack with the same role and content.
+
+        Useful when a Prompt Stack is rebuilt from scratch and most of its inputs didn't change.
+        """
+        inputs = {(i.role, i.content): i for i in prompt_stack.inputs}
+
+        for i in self.inputs:
+            previous_input = inputs.get((i.role, i.content))
+
+            if previous_input is not None:
+                i._token_counts.update(previous_input._token_counts)
+
     def add_input(self, content: str, role: str) -> Input:
         self.inputs.append(self.Input(content=content, role=role))
 
@@ -63,37 +96,101 @@ class PromptStack(SerializableMixin):
                    Defaults to appending to the end of the Prompt Stack.
         """
         num_runs_to_fit_in_prompt = len(memory.runs)
+        memory_stack = None
 
-        if memory.autoprune and hasattr(memory, "structure"):
-            should_prune = True
+        if memory.autoprune and hasattr(memory, "structure") and num_runs_to_fit_in_prompt > 0:
             prompt_driver = memory.structure.config.global_drivers.prompt_driver
-            temp_stack = PromptStack()
-
-            # Try to determine how many Conversation Memory runs we can
-            # fit into the Prompt Stack without exceeding the token limit.
-            while should_prune and num_runs_to_fit_in_prompt > 0:
-                temp_stack.inputs = self.inputs.copy()
-
-                # Add n runs from Conversation Memory.
-                # Where we insert into the Prompt Stack doesn't matter here
-                # since we only care about the total token count.
-                memory_inputs = memory.to_prompt_stack(num_runs_to_fit_in_prompt).inputs
-                temp_stack.inputs.extend(memory_inputs)
-
-                # Convert the prompt stack into tokens left.
-                prompt_string = prompt_driver.prompt_stack_to_string(temp_stack)
-                tokens_left = prompt_driver.tokenizer.count_tokens_left(prompt_string)
-                if tokens_left > 0:
-                    # There are still tokens left, no need to prune.
-                    should_prune = False
-                else:
-                    # There were not any tokens left, prune one run and try again.
-                    num_runs_to_fit_in_prompt -= 1
+            memory_stack = memory.to_prompt_stack()
+            input_token_counts = prompt_driver.input_token_counts(memory_stack)
+
+            if input_token_counts is None:
+                num_runs_to_fit_in_prompt = self._prune_conversation_memory(memory, prompt_driver)
+            else:
+                num_runs_to_fit_in_prompt = self._fit_conversation_memory(
+                    memory, memory_stack, input_token_counts, prompt_driver
+                )
 
         if num_runs_to_fit_in_prompt:
             memory_inputs = memory.to_prompt_stack(num_runs_to_fit_in_prompt).inputs
+            if memory_stack is not None:
+                PromptStack(inputs=memory_inputs).reuse_token_counts(memory_stack)
             if index:
                 self.inputs[index:index] = memory_inputs
             else:
                 self.inputs.extend(memory_inputs)
         return self.inputs
+
+    def _fit_conversation_memory(
+        self,
+        memory: BaseConversationMemory,
+        memory_stack: PromptStack,
+        input_token_counts: list[int],
+        prompt_driver: BasePromptDriver,
+    ) -> int:
+        """Returns the most Conversation Memory runs that fit in the prompt, using prefix sums of run token counts.
+
+        `memory_stack` ends with a user and an assistant input for each of the latest runs that aren't summarized,
+        after any inputs that don't belong to a run, like a summary. Those are added whenever a run is.
+        """
+        num_inputs = len(memory_stack.inputs)
+        num_runs = 0
+
+        while num_runs < len(memory.runs) and num_inputs >= 2:
+            run = memory.runs[-1 - num_runs]
+            user_input, assistant_input = memory_stack.inputs[num_inputs - 2 : num_inputs]
+
+            if user_input.content == run.input and assistant_input.content == run.output:
+                num_runs += 1
+                num_inputs -= 2
+            else:
+                break
+
+        # run_token_counts[n] is the number of tokens in the latest n runs.
+        run_token_counts = [0]
+        for i in range(len(input_token_counts) - 2, num_inputs - 1, -2):
+            run_token_counts.append(run_token_counts[-1] + input_token_counts[i] + input_token_counts[i + 1])
+
+        tokens_left = (
+            prompt_driver.tokenizer.max_tokens
+            - prompt_driver.token_count(PromptStack(inputs=self.inputs))
+            - sum(input_token_counts[:num_inputs])
+        )
+
+        if run_token_counts[-1] < tokens_left:
+            # Runs past the latest unsummarized ones don't add any inputs.
+            return len(memory.runs)
+        else:
+            return bisect_left(run_token_counts, tokens_left, lo=1) - 1
+
+    def _prune_conversation_memory(self, memory: BaseConversationMemory, prompt_driver: BasePromptDriver) -> int:
+        """Returns the most Conversation Memory runs that fit in the prompt, dropping the oldest run at a time.
+
+        Used with Prompt Drivers that count the tokens of the whole prompt, since the tokens of a run then
+        depend on the rest of the prompt.
+        """
+        num_runs_to_fit_in_prompt = len(memory.runs)
+        should_prune = True
+        temp_stack = PromptStack()
+
+        # Try to determine how many Conversation Memory runs we can
+        # fit into the Prompt Stack without exceeding the token limit.
+        while should_prune and num_runs_to_fit_in_prompt > 0:
+            temp_stack.inputs = self.inputs.copy()
+
+            # Add n runs from Conversation Memory.
+            # Where we insert into the Prompt Stack doesn't matter here
+            # since we only care about the total token count.
+            memory_inputs = memory.to_prompt_stack(num_runs_to_fit_in_prompt).inputs
+            temp_stack.inputs.extend(memory_inputs)
+
+            # Convert the prompt stack into tokens left.
+            prompt_string = prompt_driver.prompt_stack_to_string(temp_stack)
+            tokens_left = prompt_driver.tokenizer.count_tokens_left(prompt_string)
+            if tokens_left > 0:
+                # There are still tokens left, no need to prune.
+                should_prune = False
+            else:
+                # There were not any tokens left, prune one run and try again.
+                num_runs_to_fit_in_prompt -= 1
+
+        return num_runs_to_fit_in_prompt
@@ -16,6 +16,12 @@ class TestTextArtifact:
     def test_generate_embedding(self):
         assert TextArtifact("foobar").generate_embedding(MockEmbeddingDriver()) == [0, 1]
 
+    def test_generate_embeddings(self):
+        artifacts = [TextArtifact("foo"), TextArtifact("bar")]
+
+        assert TextArtifact.generate_embeddings(artifacts, MockEmbeddingDriver()) == [[0, 1], [0, 1]]
+        assert [artifact.embedding for artifact in artifacts] == [[0, 1], [0, 1]]
+
     def test_embedding(self):
         artifact = TextArtifact("foobar")
 
@@ -61,3 +67,11 @@ class TestTextArtifact:
 
         assert artifact.name == artifact.id
         assert TextArtifact("foo", name="bar").name == "bar"
+
+    def test_offsets(self):
+        artifact = BaseArtifact.from_dict(
+            TextArtifact("foo", start_char=3, end_char=6, start_token=1, end_token=2).to_dict()
+        )
+
+        assert (artifact.start_char, artifact.end_char, artifact.start_token, artifact.end_token) == (3, 6, 1, 2)
+        assert TextArtifact("foo").start_char is None
@@ -41,3 +41,27 @@ class TestTextChunker:
         assert chunks[3].value.endswith(". foo-8.")
         assert chunks[4].value.endswith(". foo-14.")
         assert chunks[5].value.endswith(". foo-24.")
+
+    def test_linear_chunk(self):
+        chunker = MarkdownChunker(max_tokens=MAX_TOKENS, linear=True)
+        text = [
+            "## Header 1\n",
+            gen_paragraph(MAX_TOKENS // 2, chunker.tokenizer, ". "),
+            "\n" "## Header 2\n",
+            gen_paragraph(MAX_TOKENS // 2, chunker.tokenizer, ". "),
+            "\n\n",
+            gen_paragraph(MAX_TOKENS // 2, chunker.tokenizer, ". "),
+            "\n" "### Header 3\n",
+            gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ". "),
+        ]
+        chunks = chunker.chunk("".join(text))
+
+        assert len(chunks) == 6
+
+        for chunk in chunks:
+            assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+
+        assert chunks[0].value.startswith("## Header 1\nfoo-0")
+        assert chunks[1].value.startswith("## Header 2\nfoo-0")
+        assert chunks[2].value.startswith("foo-0.")
+        assert chunks[3].value.startswith("### Header 3\nfoo-0")
@@ -24,3 +24,18 @@ class TestPdfChunker:
             assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
 
         assert chunks[0].value.startswith("Bitcoin: A Peer-to-Peer")
+
+    def test_linear_chunk(self):
+        chunker = PdfChunker(max_tokens=MAX_TOKENS, linear=True)
+        path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "../../resources/bitcoin.pdf")
+
+        reader = PdfReader(path)
+        text = "".join([p.extract_text() for p in reader.pages])
+        chunks = chunker.chunk(text)
+
+        assert len(chunks) == 12
+
+        for chunk in chunks:
+            assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+
+        assert chunks[0].value.startswith("Bitcoin: A Peer-to-Peer")
@@ -1,6 +1,10 @@
+import io
+import pickle
+import random
 import pytest
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import TextChunker
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -106,3 +110,197 @@ class TestTextChunker:
         assert chunks[5].value.endswith("? foo-12?")
         assert chunks[6].value.endswith(" foo-5")
         assert chunks[7].value.endswith(" foo-16")
+
+    def test_linear_separators(self):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, linear=True)
+        text = [
+            gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, "! "),
+            "\n\n",
+            gen_paragraph(MAX_TOKENS, chunker.tokenizer, ". "),
+            "\n",
+            gen_paragraph(MAX_TOKENS + 1, chunker.tokenizer, "? "),
+            "\n\n",
+            gen_paragraph(MAX_TOKENS + 1, chunker.tokenizer, " "),
+        ]
+        chunks = chunker.chunk("".join(text))
+
+        assert len(chunks) == 8
+
+        for chunk in chunks:
+            assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+
+        assert chunks[0].value.startswith("foo-0!")
+        assert chunks[1].value.startswith("foo-12!")
+        assert chunks[2].value.startswith("foo-24!")
+        assert chunks[3].value.startswith("foo-0.")
+        assert chunks[4].value.startswith("foo-0?")
+        assert chunks[5].value.startswith("foo-12?")
+        assert chunks[6].value.startswith("foo-0")
+        assert chunks[7].value.startswith("foo-16")
+
+        assert chunks[0].value.endswith("! foo-11!")
+        assert chunks[1].value.endswith("! foo-23!")
+        assert chunks[3].value.endswith(". foo-11.")
+        assert chunks[4].value.endswith("? foo-11?")
+        assert chunks[6].value.endswith(" foo-15")
+
+    def test_linear_contiguous_chunks(self):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, linear=True)
+        text = "".join(
+            [gen_paragraph(MAX_TOKENS, chunker.tokenizer, ""), gen_paragraph(MAX_TOKENS, chunker.tokenizer, "")]
+        )
+        chunks = chunker.chunk(text)
+
+        assert len(chunks) == 2
+        assert "".join(chunk.value for chunk in chunks) == text
+
+        for chunk in chunks:
+            assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+
+    def test_linear_without_token_offsets(self):
+        tokenizer = MockTokenizer(model="foo", max_tokens=MAX_TOKENS)
+        text = gen_paragraph(MAX_TOKENS * 2, tokenizer, ". ")
+
+        linear_chunks = TextChunker(tokenizer=tokenizer, linear=True).chunk(text)
+        recursive_chunks = TextChunker(tokenizer=tokenizer).chunk(text)
+
+        assert [chunk.value for chunk in linear_chunks] == [chunk.value for chunk in recursive_chunks]
+
+    @pytest.mark.parametrize("linear", [True, False])
+    def test_chunk_stream(self, linear):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, linear=linear, stream_buffer_size=1000)
+        text = "\n\n".join(gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ". ") for _ in range(20))
+        stream = (text[i : i + 100] for i in range(0, len(text), 100))
+
+        chunks = list(chunker.chunk_stream(stream))
+
+        assert [chunk.value for chunk in chunks] == [chunk.value for chunk in chunker.chunk(text)]
+
+    def test_chunk_stream_with_file(self):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, linear=True, stream_buffer_size=1000)
+        text = gen_paragraph(MAX_TOKENS * 40, chunker.tokenizer, " ")
+
+        chunks = list(chunker.chunk_stream(io.StringIO(text)))
+
+        assert [chunk.value for chunk in chunks] == [chunk.value for chunk in chunker.chunk(text)]
+
+    @pytest.mark.parametrize("seed", range(10))
+    @pytest.mark.parametrize("overlap_tokens", [0, 10])
+    def test_chunk_stream_random_text(self, seed, overlap_tokens):
+        rng = random.Random(seed)
+        words = [
+            "foo",
+            "bar",
+            "Baz",
+            "1234",
+            "42.5",
+            "hello,",
+            "world!",
+            "ünïcödé",
+            "tab\tbed",
+            "x" * rng.randint(1, 40),
+        ]
+        separators = [" ", " ", "  ", ". ", "! ", "? ", "\n", "\n\n", " \n ", "\t"]
+        text = "".join(rng.choice(words) + rng.choice(separators) for _ in range(rng.randint(200, 2000)))
+        chunker = TextChunker(
+            max_tokens=MAX_TOKENS,
+            linear=True,
+            overlap_tokens=overlap_tokens,
+            stream_buffer_size=rng.choice([64, 200, 1000, 4096]),
+        )
+        step = rng.randint(1, 300)
+
+        chunks = list(chunker.chunk_stream(io.StringIO(text)))
+        iterable_chunks = list(chunker.chunk_stream(text[i : i + step] for i in range(0, len(text), step)))
+        expected_chunks = [(c.value, c.start_char, c.end_char, c.start_token, c.end_token) for c in chunker.chunk(text)]
+
+        assert [(c.value, c.start_char, c.end_char, c.start_token, c.end_token) for c in chunks] == expected_chunks
+        assert [
+            (c.value, c.start_char, c.end_char, c.start_token, c.end_token) for c in iterable_chunks
+        ] == expected_chunks
+
+    def test_chunk_stream_is_lazy(self):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, stream_buffer_size=1000)
+        paragraph = gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ". ")
+        read = []
+
+        def stream():
+            for i in range(100):
+                read.append(i)
+
+                yield paragraph + "\n\n"
+
+        next(chunker.chunk_stream(stream()))
+
+        assert len(read) < 100
+
+    def test_chunk_stream_empty(self, chunker):
+        assert list(chunker.chunk_stream([])) == []
+
+    def test_linear_offsets(self):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, linear=True)
+        text = "\n\n".join(gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ". ") for _ in range(3))
+        tokens = chunker.tokenizer.encoding.encode(text)
+
+        chunks = chunker.chunk(text)
+
+        assert chunks[0].start_char == 0
+        assert chunks[0].start_token == 0
+        assert chunks[-1].end_char == len(text.rstrip())
+
+        for chunk in chunks:
+            assert text[chunk.start_char : chunk.end_char] == chunk.value
+            assert chunker.tokenizer.encoding.decode(tokens[chunk.start_token : chunk.end_token]).strip() == chunk.value
+
+    def test_recursive_offsets(self, chunker):
+        chunks = chunker.chunk(gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, " "))
+
+        assert all(chunk.start_char is None and chunk.end_token is None for chunk in chunks)
+
+    def test_overlap(self):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, overlap_tokens=10)
+        text = "\n\n".join(gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ". ") for _ in range(3))
+
+        chunks = chunker.chunk(text)
+
+        assert chunks[0].value.endswith("foo-10. foo-11.")
+        assert chunks[1].value.startswith("foo-10. foo-11.")
+
+        for previous, chunk in zip(chunks, chunks[1:]):
+            assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+            assert text[chunk.start_char : chunk.end_char] == chunk.value
+            assert previous.start_char < chunk.start_char < previous.end_char < chunk.end_char
+            assert previous.end_token - chunk.start_token <= 10
+
+    def test_overlap_stream(self):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, overlap_tokens=10, stream_buffer_size=500)
+        text = "\n\n".join(gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ". ") for _ in range(10))
+
+        chunks = list(chunker.chunk_stream(io.StringIO(text)))
+        expected_chunks = chunker.chunk(text)
+
+        assert [(c.value, c.start_char, c.end_char, c.start_token, c.end_token) for c in chunks] == [
+            (c.value, c.start_char, c.end_char, c.start_token, c.end_token) for c in expected_chunks
+        ]
+
+    def test_overlap_validation(self):
+        with pytest.raises(ValueError):
+            TextChunker(max_tokens=MAX_TOKENS, overlap_tokens=MAX_TOKENS)
+
+        with pytest.raises(ValueError):
+            TextChunker(max_tokens=MAX_TOKENS, overlap_tokens=-1)
+
+    def test_overlap_without_token_offsets(self):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo", max_tokens=MAX_TOKENS), overlap_tokens=10)
+
+        with pytest.raises(ValueError):
+            chunker.chunk("foo bar")
+
+    def test_pickle(self):
+        chunker = TextChunker(max_tokens=MAX_TOKENS, overlap_tokens=10)
+        text = gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, " ")
+
+        unpickled_chunker = pickle.loads(pickle.dumps(chunker))
+
+        assert unpickled_chunker == chunker
+        assert [c.value for c in unpickled_chunker.chunk(text)] == [c.value for c in chunker.chunk(text)]
@@ -49,6 +49,10 @@ class TestAmazonBedrockStructureConfig:
                         "type": "AmazonBedrockTitanEmbeddingDriver",
                     },
                     "type": "LocalVectorStoreDriver",
+                    "persist_dir": None,
+                    "ann_nprobe": None,
+                    "ann_nlist": None,
+                    "ann_min_rows": 10000,
                 },
             },
             "type": "AmazonBedrockStructureConfig",
@@ -66,6 +70,10 @@ class TestAmazonBedrockStructureConfig:
                     },
                     "vector_store_driver": {
                         "type": "LocalVectorStoreDriver",
+                        "persist_dir": None,
+                        "ann_nprobe": None,
+                        "ann_nlist": None,
+                        "ann_min_rows": 10000,
                         "embedding_driver": {
                             "type": "AmazonBedrockTitanEmbeddingDriver",
                             "model": "amazon.titan-embed-text-v1",
@@ -67,6 +67,10 @@ class TestOpenAiStructureConfig:
                         "type": "OpenAiEmbeddingDriver",
                     },
                     "type": "LocalVectorStoreDriver",
+                    "persist_dir": None,
+                    "ann_nprobe": None,
+                    "ann_nlist": None,
+                    "ann_min_rows": 10000,
                 },
             },
             "task_memory": {
@@ -88,6 +92,10 @@ class TestOpenAiStructureConfig:
                     },
                     "vector_store_driver": {
                         "type": "LocalVectorStoreDriver",
+                        "persist_dir": None,
+                        "ann_nprobe": None,
+                        "ann_nlist": None,
+                        "ann_min_rows": 10000,
                         "embedding_driver": {
                             "type": "OpenAiEmbeddingDriver",
                             "api_key": None,
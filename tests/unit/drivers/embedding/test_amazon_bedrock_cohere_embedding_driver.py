@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest import mock
 from griptape.drivers import AmazonBedrockCohereEmbeddingDriver
@@ -6,7 +7,7 @@ from griptape.drivers import AmazonBedrockCohereEmbeddingDriver
 class TestAmazonBedrockCohereEmbeddingDriver:
     @pytest.fixture(autouse=True)
     def mock_session(self, mocker):
-        fake_embeddings = '{"embeddings": [[0, 1, 0]] }'
+        fake_embeddings = '{"embeddings": [[0, 1, 0], [1, 0, 0]] }'
 
         mock_session_class = mocker.patch("boto3.Session")
 
@@ -24,3 +25,9 @@ class TestAmazonBedrockCohereEmbeddingDriver:
 
     def test_try_embed_chunk(self):
         assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self):
+        driver = AmazonBedrockCohereEmbeddingDriver()
+
+        assert driver.try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert json.loads(driver.bedrock_client.invoke_model.call_args.kwargs["body"])["texts"] == ["foo", "bar"]
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from griptape.artifacts import TextArtifact
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from unittest.mock import patch
@@ -24,6 +25,25 @@ class TestBaseEmbeddingDriver:
 
         assert embedding == [0, 1]
 
+    def test_embed_long_string_weighted_average(self, driver, mocker):
+        mocker.patch.object(
+            driver, "try_embed_chunk", side_effect=lambda chunk: [1.0, 0.0] if "a" in chunk else [0.0, 1.0]
+        )
+        try_embed_chunks = mocker.spy(driver, "try_embed_chunks")
+        chunks = driver.chunker.chunk("a" * 1500 + " " + "b" * 500)
+
+        expected = np.average(
+            [[1.0, 0.0] if "a" in c.value else [0.0, 1.0] for c in chunks], axis=0, weights=[len(c) for c in chunks]
+        )
+
+        assert driver.embed_string("a" * 1500 + " " + "b" * 500) == (expected / np.linalg.norm(expected)).tolist()
+        try_embed_chunks.assert_called_once()
+
+    def test_try_embed_chunks(self, driver, mocker):
+        mocker.patch.object(driver, "try_embed_chunk", side_effect=lambda chunk: [float(len(chunk)), 1.0])
+
+        assert driver.try_embed_chunks(["a", "bbb", "cc"]) == [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+
     def test_no_tokenizer(self, driver):
         driver.tokenizer = None
 
@@ -39,3 +59,53 @@ class TestBaseEmbeddingDriver:
             driver.embed_string("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_strings(self, driver, mocker):
+        try_embed_chunks = mocker.spy(driver, "try_embed_chunks")
+
+        assert driver.embed_strings(["foo", "bar", "baz"]) == [[0, 1], [0, 1], [0, 1]]
+        try_embed_chunks.assert_called_once_with(["foo", "bar", "baz"])
+
+    def test_embed_strings_empty(self, driver):
+        assert driver.embed_strings([]) == []
+
+    def test_embed_strings_batch_size(self, driver, mocker):
+        driver.batch_size = 2
+        try_embed_chunks = mocker.spy(driver, "try_embed_chunks")
+
+        assert len(driver.embed_strings(["foo", "bar", "baz"])) == 3
+        assert [c.args[0] for c in try_embed_chunks.call_args_list] == [["foo", "bar"], ["baz"]]
+
+    def test_embed_strings_max_batch_tokens(self, driver, mocker):
+        driver.max_batch_tokens = 7
+        try_embed_chunks = mocker.spy(driver, "try_embed_chunks")
+
+        assert len(driver.embed_strings(["foo", "bar", "bazbaz", "qux"])) == 4
+        assert [c.args[0] for c in try_embed_chunks.call_args_list] == [["foo", "bar"], ["bazbaz"], ["qux"]]
+
+    def test_embed_strings_preserves_order(self, driver, mocker):
+        mocker.patch.object(driver, "try_embed_chunk", side_effect=lambda chunk: [float(len(chunk)), 1.0])
+
+        assert driver.embed_strings(["a", "bbb", "cc"]) == [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+
+    def test_embed_strings_long_string(self, driver, mocker):
+        mocker.patch.object(
+            driver, "try_embed_chunk", side_effect=lambda chunk: [1.0, 0.0] if "a" in chunk else [0.0, 1.0]
+        )
+        long_string = "a" * 1500 + " " + "b" * 500
+
+        assert driver.embed_strings(["foo", long_string]) == [[0.0, 1.0], driver.embed_string(long_string)]
+
+    def test_embed_strings_no_tokenizer(self, driver):
+        driver.tokenizer = None
+
+        assert driver.embed_strings(["foo"]) == [[0, 1]]
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunks")
+    def test_embed_strings_throws_when_retries_exhausted(self, try_embed_chunks, driver):
+        try_embed_chunks.side_effect = Exception("nope")
+
+        with pytest.raises(Exception) as e:
+            driver.embed_strings(["foobar"])
+
+        assert e.value.args[0] == "nope"
@@ -0,0 +1,74 @@
+import pytest
+from griptape.drivers import CachedEmbeddingDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestCachedEmbeddingDriver:
+    @pytest.fixture
+    def embedding_driver(self, mocker):
+        embedding_driver = MockEmbeddingDriver()
+        mocker.patch.object(embedding_driver, "try_embed_chunk", side_effect=lambda chunk: [float(len(chunk)), 1.0])
+
+        return embedding_driver
+
+    @pytest.fixture
+    def driver(self, embedding_driver):
+        return CachedEmbeddingDriver(embedding_driver=embedding_driver)
+
+    def test_init(self, driver):
+        assert driver.model == "foo"
+
+    def test_embed_string(self, driver, embedding_driver):
+        assert driver.embed_string("foo") == [3.0, 1.0]
+        assert driver.embed_string("foo") == [3.0, 1.0]
+        assert embedding_driver.try_embed_chunk.call_count == 1
+        assert driver.hits == 1
+        assert driver.misses == 1
+
+    def test_embed_strings(self, driver, embedding_driver, mocker):
+        embed_strings = mocker.spy(embedding_driver, "embed_strings")
+        driver.embed_string("foo")
+
+        assert driver.embed_strings(["foo", "barbaz", "foo", "qux"]) == [[3.0, 1.0], [6.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+        embed_strings.assert_called_with(["barbaz", "qux"])
+        assert driver.hits == 2
+        assert driver.misses == 3
+
+    def test_cache_key_includes_model(self, embedding_driver):
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver)
+        other_driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, model="bar")
+
+        assert driver._cache_key("foo") != other_driver._cache_key("foo")
+
+    def test_max_cache_size(self, embedding_driver):
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, max_cache_size=2)
+        driver.embed_strings(["a", "b"])
+        driver.embed_string("a")
+        driver.embed_string("c")
+
+        assert len(driver._cache) == 2
+        assert driver._cache_key("b") not in driver._cache
+        assert driver._cache_key("a") in driver._cache
+
+    def test_persist_path(self, embedding_driver, tmp_path):
+        persist_path = str(tmp_path / "cache" / "embeddings.sqlite3")
+        CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_path=persist_path).embed_string("foo")
+
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_path=persist_path, max_cache_size=0)
+
+        assert driver.embed_string("foo") == [3.0, 1.0]
+        assert driver.hits == 1
+        assert embedding_driver.try_embed_chunk.call_count == 1
+
+    def test_clear(self, embedding_driver, tmp_path):
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_path=str(tmp_path / "cache.sqlite3"))
+        driver.embed_string("foo")
+        driver.clear()
+
+        assert driver.hits == 0
+        assert driver.misses == 0
+        driver.embed_string("foo")
+        assert driver.misses == 1
+
+    def test_try_embed_chunk(self, driver):
+        assert driver.try_embed_chunk("foo") == [3.0, 1.0]
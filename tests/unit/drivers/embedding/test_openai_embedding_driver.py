@@ -28,3 +28,32 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
         assert mock_openai.call_args.kwargs["input"] == "foo bar" if model.endswith("001") else "foo\nbar"
+
+    def test_try_embed_chunks(self, mock_openai):
+        mock_openai.return_value = Mock(data=[Mock(index=1, embedding=[1, 0]), Mock(index=0, embedding=[0, 1])])
+
+        assert OpenAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1], [1, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
+
+    def test_embed_strings(self, mock_openai):
+        mock_openai.side_effect = lambda input, **kwargs: Mock(
+            data=[Mock(index=i, embedding=[0, 1, 0]) for i in range(len(input))]
+        )
+
+        assert OpenAiEmbeddingDriver().embed_strings(["foo", "bar", "baz"]) == [[0, 1, 0]] * 3
+        assert mock_openai.call_count == 1
+
+    def test_embed_strings_splits_batches_by_tokens(self, mock_openai):
+        mock_openai.side_effect = lambda input, **kwargs: Mock(
+            data=[Mock(index=i, embedding=[0, 1, 0]) for i in range(len(input))]
+        )
+        driver = OpenAiEmbeddingDriver()
+        strings = ["foo " * 8000] * 80
+
+        assert driver.embed_strings(strings) == [[0, 1, 0]] * 80
+        assert mock_openai.call_count == 3
+        assert all(
+            sum(driver.tokenizer.count_tokens(chunk) for chunk in call.kwargs["input"])
+            <= OpenAiEmbeddingDriver.DEFAULT_MAX_BATCH_TOKENS
+            for call in mock_openai.call_args_list
+        )
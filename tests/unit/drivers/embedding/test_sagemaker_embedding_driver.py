@@ -6,7 +6,7 @@ from griptape.tokenizers.openai_tokenizer import OpenAiTokenizer
 
 class TestAmazonSagemakerEmbeddingDriver:
     @pytest.fixture(autouse=True)
-    def mock_session(self, mocker):
+    def mock_client(self, mocker):
         fake_embeddings = b'{"embedding": [[0, 1, 0]]}'
         mock_session_class = mocker.patch("boto3.Session")
         mock_session_object = mock.Mock()
@@ -18,6 +18,8 @@ class TestAmazonSagemakerEmbeddingDriver:
         mock_session_object.client.return_value = mock_client
         mock_session_class.return_value = mock_session_object
 
+        return mock_client
+
     def test_init(self):
         assert AmazonSageMakerEmbeddingDriver(
             model="test-endpoint",
@@ -31,3 +33,28 @@ class TestAmazonSagemakerEmbeddingDriver:
             tokenizer=OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL),
             embedding_model_driver=SageMakerHuggingFaceEmbeddingModelDriver(),
         ).try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self, mock_client):
+        mock_client.invoke_endpoint.return_value.get().read.return_value = b'{"embedding": [[0, 1, 0], [1, 0, 0]]}'
+        driver = AmazonSageMakerEmbeddingDriver(
+            model="test-endpoint",
+            tokenizer=OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL),
+            embedding_model_driver=SageMakerHuggingFaceEmbeddingModelDriver(),
+        )
+
+        assert driver.try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_client.invoke_endpoint.call_count == 1
+
+    def test_try_embed_chunks_without_batch_support(self, mock_client):
+        class EmbeddingModelDriver(SageMakerHuggingFaceEmbeddingModelDriver):
+            def chunks_to_model_params(self, chunks: list[str]) -> dict:
+                raise NotImplementedError()
+
+        driver = AmazonSageMakerEmbeddingDriver(
+            model="test-endpoint",
+            tokenizer=OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL),
+            embedding_model_driver=EmbeddingModelDriver(),
+        )
+
+        assert driver.try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [0, 1, 0]]
+        assert mock_client.invoke_endpoint.call_count == 2
@@ -19,3 +19,9 @@ class TestSageMakerHuggingFaceEmbeddingModelDriver:
 
     def test_process_output(self, driver):
         assert driver.process_output({"embedding": [["foobar"]]}) == ["foobar"]
+
+    def test_chunks_to_model_params(self, driver):
+        assert driver.chunks_to_model_params(["foo", "bar"])["text_inputs"] == ["foo", "bar"]
+
+    def test_process_batch_output(self, driver):
+        assert driver.process_batch_output({"embedding": [["foo"], ["bar"]]}) == [["foo"], ["bar"]]
@@ -1,7 +1,8 @@
+import asyncio
 from griptape.drivers import AnthropicPromptDriver
 from griptape.utils import PromptStack
 from griptape.tokenizers import AnthropicTokenizer
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, AsyncMock, Mock
 import pytest
 
 
@@ -24,6 +25,28 @@ class TestAnthropicPromptDriver:
 
         return mock_stream_client
 
+    @pytest.fixture
+    def mock_async_client(self, mocker):
+        mock_async_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_response = Mock()
+        mock_response.completion = "model-output"
+        mock_async_client.return_value.completions.create = AsyncMock(return_value=mock_response)
+
+        return mock_async_client
+
+    @pytest.fixture
+    def mock_async_stream_client(self, mocker):
+        mock_async_stream_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_chunk = Mock()
+        mock_chunk.completion = "model-output"
+
+        async def chunks():
+            yield mock_chunk
+
+        mock_async_stream_client.return_value.completions.create = AsyncMock(return_value=chunks())
+
+        return mock_async_stream_client
+
     @pytest.mark.parametrize("model", [("claude-2.1"), ("claude-2.0")])
     def test_init(self, model):
         assert AnthropicPromptDriver(model=model, api_key="1234")
@@ -125,6 +148,49 @@ class TestAnthropicPromptDriver:
         )
         assert text_artifact.value == "model-output"
 
+    def test_try_arun(self, mock_async_client):
+        # Given
+        prompt_stack = PromptStack()
+        prompt_stack.add_user_input("user-input")
+        driver = AnthropicPromptDriver(model=AnthropicTokenizer.DEFAULT_MODEL, api_key="api-key")
+
+        # When
+        text_artifact = asyncio.run(driver.try_arun(prompt_stack))
+
+        # Then
+        mock_async_client.assert_called_once_with(api_key="api-key")
+        mock_async_client.return_value.completions.create.assert_awaited_once_with(
+            prompt="\n\nHuman: user-input\n\nAssistant:",
+            stop_sequences=ANY,
+            model=driver.model,
+            max_tokens_to_sample=ANY,
+            temperature=ANY,
+        )
+        assert text_artifact.value == "model-output"
+
+    def test_try_astream(self, mock_async_stream_client):
+        # Given
+        prompt_stack = PromptStack()
+        prompt_stack.add_user_input("user-input")
+        driver = AnthropicPromptDriver(model=AnthropicTokenizer.DEFAULT_MODEL, api_key="api-key", stream=True)
+
+        async def collect():
+            return [artifact async for artifact in driver.try_astream(prompt_stack)]
+
+        # When
+        text_artifacts = asyncio.run(collect())
+
+        # Then
+        mock_async_stream_client.return_value.completions.create.assert_awaited_once_with(
+            prompt="\n\nHuman: user-input\n\nAssistant:",
+            stop_sequences=ANY,
+            model=driver.model,
+            max_tokens_to_sample=ANY,
+            temperature=ANY,
+            stream=True,
+        )
+        assert [text_artifact.value for text_artifact in text_artifacts] == ["model-output"]
+
     def test_try_run_throws_when_prompt_stack_is_string(self):
         # Given
         prompt_stack = "prompt-stack"
@@ -1,4 +1,7 @@
-from griptape.events import FinishPromptEvent, StartPromptEvent
+import asyncio
+import threading
+import pytest
+from griptape.events import CompletionChunkEvent, FinishPromptEvent, StartPromptEvent
 from griptape.utils import PromptStack
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
@@ -39,6 +42,57 @@ class TestBasePromptDriver:
     def test_run(self):
         assert isinstance(MockPromptDriver().run(PromptStack(inputs=[])), TextArtifact)
 
+    def test_arun(self):
+        assert asyncio.run(MockPromptDriver().arun(PromptStack(inputs=[]))).value == "mock output"
+
+    def test_arun_retries(self):
+        driver = MockFailingPromptDriver(max_failures=2, max_attempts=3, min_retry_delay=0, max_retry_delay=0)
+
+        assert asyncio.run(driver.arun(PromptStack(inputs=[]))).value == "success"
+        assert driver.current_attempt == 2
+
+    def test_arun_stream_via_pipeline_publishes_events(self, mocker):
+        mock_publish_event = mocker.patch.object(Pipeline, "publish_event")
+        driver = MockPromptDriver(stream=True)
+        pipeline = Pipeline(prompt_driver=driver)
+        pipeline.add_task(PromptTask("test"))
+
+        asyncio.run(pipeline.arun())
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert instance_count(events, StartPromptEvent) == 1
+        assert instance_count(events, CompletionChunkEvent) == 1
+        assert instance_count(events, FinishPromptEvent) == 1
+        assert pipeline.output_task.output.value == "mock output"
+
+    def test_astream(self):
+        async def collect():
+            return [chunk.value async for chunk in MockPromptDriver().astream(PromptStack(inputs=[]))]
+
+        assert asyncio.run(collect()) == ["mock output"]
+
+    @pytest.mark.parametrize("use_astream", [False, True])
+    def test_arun_runs_hooks_off_the_event_loop(self, mocker, use_astream):
+        threads = []
+        mocker.patch.object(
+            MockPromptDriver, "before_run", side_effect=lambda *args: threads.append(threading.current_thread())
+        )
+        mocker.patch.object(
+            MockPromptDriver, "after_run", side_effect=lambda *args: threads.append(threading.current_thread())
+        )
+        driver = MockPromptDriver()
+
+        async def run():
+            if use_astream:
+                return [chunk async for chunk in driver.astream(PromptStack(inputs=[]))]
+            else:
+                return await driver.arun(PromptStack(inputs=[]))
+
+        asyncio.run(run())
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
     def test_token_count(self):
         assert (
             MockPromptDriver().token_count(
@@ -47,6 +101,17 @@ class TestBasePromptDriver:
             == 7
         )
 
+    def test_token_count_is_exact(self):
+        driver = MockPromptDriver()
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_input("You are a helpful assistant.\n")
+        prompt_stack.add_user_input(" foo\n\nbar ")
+        prompt_stack.add_assistant_input("Answer: 42.")
+
+        assert driver.token_count(prompt_stack) == driver.tokenizer.count_tokens(
+            driver.prompt_stack_to_string(prompt_stack)
+        )
+
     def test_max_output_tokens(self):
         assert MockPromptDriver().max_output_tokens("foobar") == 4087
         assert MockPromptDriver(max_tokens=4088).max_output_tokens("foobar") == 4087
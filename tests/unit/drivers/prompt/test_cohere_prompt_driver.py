@@ -1,7 +1,8 @@
+import asyncio
 from griptape.drivers import CoherePromptDriver
 from griptape.utils import PromptStack
 from griptape.tokenizers import CohereTokenizer
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 import pytest
 
 
@@ -21,6 +22,27 @@ class TestCoherePromptDriver:
         mock_client.generate.return_value = iter([mock_chunk])
         return mock_client
 
+    @pytest.fixture
+    def mock_async_client(self, mocker):
+        mock_async_client = mocker.patch("cohere.AsyncClient").return_value
+        mock_response = Mock()
+        mock_response.generations = [Mock()]
+        mock_response.generations[0].text = "model-output"
+        mock_async_client.generate = AsyncMock(return_value=mock_response)
+        return mock_async_client
+
+    @pytest.fixture
+    def mock_async_stream_client(self, mocker):
+        mock_async_client = mocker.patch("cohere.AsyncClient").return_value
+        mock_chunk = Mock()
+        mock_chunk.text = "model-output"
+
+        async def chunks():
+            yield mock_chunk
+
+        mock_async_client.generate = AsyncMock(return_value=chunks())
+        return mock_async_client
+
     @pytest.fixture(autouse=True)
     def mock_tokenizer(self, mocker):
         return mocker.patch("griptape.tokenizers.CohereTokenizer").return_value
@@ -57,6 +79,30 @@ class TestCoherePromptDriver:
         # Then
         assert text_artifact.value == "model-output"
 
+    def test_try_arun(self, mock_client, mock_async_client, prompt_stack):  # pyright: ignore
+        # Given
+        driver = CoherePromptDriver(model=CohereTokenizer.DEFAULT_MODEL, api_key="api-key")
+
+        # When
+        text_artifact = asyncio.run(driver.try_arun(prompt_stack))
+
+        # Then
+        mock_async_client.generate.assert_awaited_once()
+        assert text_artifact.value == "model-output"
+
+    def test_try_astream(self, mock_client, mock_async_stream_client, prompt_stack):  # pyright: ignore
+        # Given
+        driver = CoherePromptDriver(model=CohereTokenizer.DEFAULT_MODEL, api_key="api-key", stream=True)
+
+        async def collect():
+            return [artifact async for artifact in driver.try_astream(prompt_stack)]
+
+        # When
+        text_artifacts = asyncio.run(collect())
+
+        # Then
+        assert [text_artifact.value for text_artifact in text_artifacts] == ["model-output"]
+
     @pytest.mark.parametrize("choices", [[], [1, 2]])
     def test_try_run_throws_when_multiple_choices_returned(self, choices, mock_client, prompt_stack):
         # Given
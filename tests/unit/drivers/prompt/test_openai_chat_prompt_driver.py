@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 
 from transformers import AutoTokenizer
@@ -6,7 +7,7 @@ from griptape.drivers import OpenAiChatPromptDriver
 from griptape.tokenizers.huggingface_tokenizer import HuggingFaceTokenizer
 from griptape.utils import PromptStack
 from griptape.tokenizers import OpenAiTokenizer
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 import pytest
 
 
@@ -30,6 +31,31 @@ class TestOpenAiChatPromptDriverFixtureMixin:
         mock_chat_create.return_value = iter([mock_chunk])
         return mock_chat_create
 
+    @pytest.fixture
+    def mock_async_chat_completion_create(self, mocker):
+        mock_chat_create = mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.with_raw_response.create
+        mock_response = Mock()
+        mock_choice = Mock()
+        mock_choice.message.content = "model-output"
+        mock_response.headers = {}
+        mock_response.parse.return_value.choices = [mock_choice]
+        mock_chat_create.side_effect = AsyncMock(return_value=mock_response)
+        return mock_chat_create
+
+    @pytest.fixture
+    def mock_async_chat_completion_stream_create(self, mocker):
+        mock_chat_create = mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create
+        mock_chunk = Mock()
+        mock_choice = Mock()
+        mock_choice.delta.content = "model-output"
+        mock_chunk.choices = [mock_choice]
+
+        async def chunks():
+            yield mock_chunk
+
+        mock_chat_create.side_effect = AsyncMock(return_value=chunks())
+        return mock_chat_create
+
     @pytest.fixture
     def prompt_stack(self):
         prompt_stack = PromptStack()
@@ -144,6 +170,46 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
         )
         assert text_artifact.value == "model-output"
 
+    def test_try_arun(self, mock_async_chat_completion_create, prompt_stack, messages):
+        # Given
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+
+        # When
+        text_artifact = asyncio.run(driver.try_arun(prompt_stack))
+
+        # Then
+        mock_async_chat_completion_create.assert_called_once_with(
+            model=driver.model,
+            temperature=driver.temperature,
+            stop=driver.tokenizer.stop_sequences,
+            user=driver.user,
+            messages=messages,
+            seed=driver.seed,
+        )
+        assert text_artifact.value == "model-output"
+
+    def test_try_astream(self, mock_async_chat_completion_stream_create, prompt_stack, messages):
+        # Given
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, stream=True)
+
+        async def collect():
+            return [artifact async for artifact in driver.try_astream(prompt_stack)]
+
+        # When
+        text_artifacts = asyncio.run(collect())
+
+        # Then
+        mock_async_chat_completion_stream_create.assert_called_once_with(
+            model=driver.model,
+            temperature=driver.temperature,
+            stop=driver.tokenizer.stop_sequences,
+            user=driver.user,
+            stream=True,
+            messages=messages,
+            seed=driver.seed,
+        )
+        assert [text_artifact.value for text_artifact in text_artifacts] == ["model-output"]
+
     def test_try_run_with_max_tokens(self, mock_chat_completion_create, prompt_stack, messages):
         # Given
         driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, max_tokens=1)
@@ -213,16 +279,14 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
 
     def test_token_count(self, prompt_stack, messages):
         # Given
-        mock_tokenizer = Mock(spec=OpenAiTokenizer)
-        mock_tokenizer.count_tokens.return_value = 42
-        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, tokenizer=mock_tokenizer)
+        tokenizer = OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, tokenizer=tokenizer)
 
         # When
         token_count = driver.token_count(prompt_stack)
 
         # Then
-        mock_tokenizer.count_tokens.assert_called_once_with(messages)
-        assert token_count == 42
+        assert token_count == tokenizer.count_tokens(messages)
 
         # Given
         mock_tokenizer = Mock()
@@ -236,6 +300,53 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
         mock_tokenizer.count_tokens.assert_called_once_with(driver.prompt_stack_to_string(prompt_stack))
         assert token_count == 42
 
+    @pytest.mark.parametrize(
+        "contents", [["foo"], [" foo\n\nbar ", "", "Answer: 42."], ['{"a": 1}', "\u00e9\u00e9\u00e9 \U0001f600"]]
+    )
+    def test_token_count_is_exact(self, contents):
+        # Given
+        tokenizer = OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, tokenizer=tokenizer)
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_input("You are a helpful assistant.")
+        for i, content in enumerate(contents):
+            prompt_stack.add_user_input(content) if i % 2 == 0 else prompt_stack.add_assistant_input(content)
+
+        # When
+        token_count = driver.token_count(prompt_stack)
+
+        # Then
+        assert token_count >= tokenizer.count_tokens(driver._prompt_stack_to_messages(prompt_stack))
+        assert token_count == tokenizer.count_tokens(driver._prompt_stack_to_messages(prompt_stack))
+
+    def test_input_token_counts(self, prompt_stack):
+        # Given
+        tokenizer = OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, tokenizer=tokenizer)
+
+        # When
+        input_token_counts = driver.input_token_counts(prompt_stack)
+
+        # Then
+        assert len(input_token_counts) == len(prompt_stack.inputs)
+        assert tokenizer.count_tokens([]) + sum(input_token_counts) == driver.token_count(prompt_stack)
+        assert OpenAiChatPromptDriver(model="foo", tokenizer=Mock()).input_token_counts(prompt_stack) is None
+
+    def test_token_count_memoizes_contents(self, prompt_stack, mocker):
+        # Given
+        tokenizer = OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, tokenizer=tokenizer)
+        driver.token_count(prompt_stack)
+        prompt_stack.add_user_input("new-input")
+        count_tokens = mocker.spy(OpenAiTokenizer, "count_tokens")
+
+        # When
+        driver.token_count(prompt_stack)
+
+        # Then
+        string_calls = [c for c in count_tokens.call_args_list if isinstance(c.args[1], str)]
+        assert [c.args[1] for c in string_calls] == ["new-input"]
+
     def test_max_output_tokens(self, messages):
         # Given
         mock_tokenizer = Mock()
@@ -27,3 +27,7 @@ class TestDummyVectorStoreDriver:
     def test_query(self, vector_store_driver):
         with pytest.raises(DummyException):
             vector_store_driver.query("foo bar huzzah")
+
+    def test_query_vector(self, vector_store_driver):
+        with pytest.raises(DummyException):
+            vector_store_driver.query_vector([0, 1])
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from griptape.artifacts import TextArtifact, BaseArtifact
 from griptape.drivers import LocalVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
@@ -53,3 +54,352 @@ class TestLocalVectorStoreDriver:
         assert len(driver.load_entries()) == 3
         assert len(driver.load_entries("test-namespace-1")) == 2
         assert len(driver.load_entries("test-namespace-2")) == 1
+
+    def test_query_scores_match_cosine_similarity(self, driver):
+        vectors = {"a": [1.0, 0.0], "b": [1.0, 1.0], "c": [0.0, 1.0], "d": [-1.0, 0.5]}
+        for vector_id, vector in vectors.items():
+            driver.upsert_vector(vector, vector_id=vector_id)
+
+        results = driver.query("foobar", include_vectors=True)
+
+        assert [r.id for r in results] == ["c", "b", "d", "a"]
+        for result in results:
+            expected = np.dot([0, 1], result.vector) / (np.linalg.norm([0, 1]) * np.linalg.norm(result.vector))
+
+            assert result.score == pytest.approx(expected, abs=1e-6)
+
+    def test_query_count(self, driver):
+        for i in range(10):
+            driver.upsert_vector([float(i), 10.0 - i], vector_id=str(i))
+
+        assert [r.id for r in driver.query("foobar", count=3)] == ["0", "1", "2"]
+        assert len(driver.query("foobar", count=0)) == 0
+        assert len(driver.query("foobar", count=100)) == 10
+
+    def test_query_with_relatedness_fn(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), relatedness_fn=lambda x, y: -y[1])
+        driver.upsert_vector([0.0, 1.0], vector_id="a")
+        driver.upsert_vector([0.0, 2.0], vector_id="b")
+
+        assert [r.id for r in driver.query("foobar")] == ["a", "b"]
+
+    def test_upsert_existing_vector_overwrites_row(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="a")
+
+        results = driver.query("foobar")
+
+        assert len(results) == 1
+        assert results[0].score == pytest.approx(1.0)
+
+    def test_upsert_grows_matrix(self, driver):
+        for i in range(LocalVectorStoreDriver.INITIAL_CAPACITY + 1):
+            driver.upsert_vector([float(i), 1.0], vector_id=str(i))
+
+        assert len(driver.query("foobar")) == LocalVectorStoreDriver.INITIAL_CAPACITY + 1
+        assert driver.query("foobar", count=1)[0].id == "0"
+
+    def test_upsert_mismatched_dimensions(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+
+        with pytest.raises(ValueError):
+            driver.upsert_vector([1.0, 0.0, 0.0], vector_id="b")
+
+    def test_init_with_entries(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            entries={"a": LocalVectorStoreDriver.Entry(id="a", vector=[0.0, 1.0])},
+        )
+
+        assert driver.query("foobar")[0].id == "a"
+
+    def test_query_namespace_does_not_match_prefix(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="a", namespace="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="b", namespace="foo-bar")
+
+        assert [r.id for r in driver.query("foobar", namespace="foo")] == ["a"]
+        assert [r.id for r in driver.query("foobar", namespace="foo-bar")] == ["b"]
+        assert [e.id for e in driver.load_entries("foo")] == ["a"]
+
+    def test_delete_namespace(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="a", namespace="foo")
+        driver.upsert_vector([1.0, 1.0], vector_id="b", namespace="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="c", namespace="bar")
+
+        driver.delete_namespace("foo")
+
+        assert len(driver.entries) == 1
+        assert driver.load_entries("foo") == []
+        assert driver.query("foobar", namespace="foo") == []
+        assert [r.id for r in driver.query("foobar")] == ["c"]
+
+        driver.upsert_vector([0.0, 1.0], vector_id="d", namespace="baz")
+
+        assert [r.id for r in driver.query("foobar")] == ["d", "c"]
+        assert [r.id for r in driver.query("foobar", namespace="baz")] == ["d"]
+
+    @pytest.mark.parametrize("relatedness_fn", [None, lambda x, y: y[1]])
+    def test_query_after_delete_namespace_skips_released_rows(self, relatedness_fn):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), relatedness_fn=relatedness_fn)
+        driver.upsert_vector([0.0, 1.0], vector_id="a", namespace="foo")
+        driver.upsert_vector([1.0, 1.0], vector_id="b", namespace="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="c", namespace="bar")
+        driver.upsert_vector([1.0, 0.5], vector_id="d", namespace="bar")
+
+        driver.delete_namespace("foo")
+
+        assert [r.id for r in driver.query("foobar", count=3)] == ["d", "c"]
+        assert [[r.id for r in results] for results in driver.query_batch(["foo"], count=1)] == [["d"]]
+
+    def test_persist_dir(self, tmp_path):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+        driver.upsert_vector([0.0, 1.0], vector_id="a", namespace="foo", meta={"foo": "bar"})
+        driver.upsert_vector([1.0, 0.0], vector_id="b", namespace="foo")
+        driver.upsert_vector([1.0, 1.0], vector_id="c", namespace="bar")
+        driver.upsert_vector([0.5, 1.0], vector_id="b", namespace="foo")
+        driver.delete_namespace("bar")
+
+        reopened = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+
+        assert isinstance(reopened._matrix, np.memmap)
+        assert len(reopened.entries) == 2
+        assert reopened.load_entry("a", namespace="foo").meta == {"foo": "bar"}
+        assert reopened.load_entry("b", namespace="foo").vector == [0.5, 1.0]
+        assert reopened.load_entries("bar") == []
+        assert [(r.id, r.vector) for r in reopened.query("foobar", include_vectors=True)] == [
+            ("a", [0.0, 1.0]),
+            ("b", [0.5, 1.0]),
+        ]
+
+        reopened.upsert_vector([1.0, 0.0], vector_id="d", namespace="baz")
+
+        assert [
+            r.id
+            for r in LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path)).query(
+                "foobar"
+            )
+        ] == ["a", "b", "d"]
+
+    def test_entries_read_vectors_from_matrix(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="a", meta={"foo": "bar"})
+        driver.upsert_vector([0.5, 1.0], vector_id="a", meta={"foo": "bar"})
+
+        assert "vector" not in vars(driver.entries["a"])
+        assert driver.entries["a"].vector == [0.5, 1.0]
+        assert driver.load_entry("a") == LocalVectorStoreDriver.Entry(id="a", vector=[0.5, 1.0], meta={"foo": "bar"})
+        assert [(r.id, r.vector) for r in driver.query("foobar", include_vectors=True)] == [("a", [0.5, 1.0])]
+
+    def test_persist_dir_entries_have_vectors(self, tmp_path):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+        driver.upsert_vector([0.0, 1.0], vector_id="a", namespace="foo", meta={"foo": "bar"})
+        in_memory = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        in_memory.upsert_vector([0.0, 1.0], vector_id="a", namespace="foo", meta={"foo": "bar"})
+
+        assert driver.entries["foo-a"].vector == [0.0, 1.0]
+        assert driver.load_entry("a", namespace="foo") == in_memory.load_entry("a", namespace="foo")
+
+        driver.upsert_vector([0.5, 1.0], vector_id="a", namespace="foo")
+        reopened = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+
+        assert reopened.entries["foo-a"].vector == [0.5, 1.0]
+        assert reopened.load_entry("a", namespace="foo").vector == [0.5, 1.0]
+        assert [entry.vector for entry in reopened.load_entries("foo")] == [[0.5, 1.0]]
+
+    def test_persist_dir_grows_files(self, tmp_path):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+
+        for i in range(LocalVectorStoreDriver.INITIAL_CAPACITY + 1):
+            driver.upsert_vector([float(i), 1.0], vector_id=str(i))
+
+        reopened = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+
+        assert len(reopened.query("foobar")) == LocalVectorStoreDriver.INITIAL_CAPACITY + 1
+        assert reopened.load_entry(str(LocalVectorStoreDriver.INITIAL_CAPACITY)).vector == [
+            float(LocalVectorStoreDriver.INITIAL_CAPACITY),
+            1.0,
+        ]
+
+    def test_query_with_ann_index(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), ann_nprobe=1, ann_nlist=2, ann_min_rows=100
+        )
+        rng = np.random.default_rng(0)
+
+        for i, vector in enumerate(rng.normal([0.0, 10.0], 1.0, size=(100, 2))):
+            driver.upsert_vector(vector.tolist(), vector_id=f"near-{i}")
+        for i, vector in enumerate(rng.normal([10.0, -10.0], 1.0, size=(100, 2))):
+            driver.upsert_vector(vector.tolist(), vector_id=f"far-{i}")
+
+        results = driver.query("foobar")
+
+        assert driver._centroids is not None
+        assert len(results) == 100
+        assert all(r.id.startswith("near-") for r in results)
+
+        driver.upsert_vector([0.0, 1.0], vector_id="new")
+
+        assert driver.query("foobar", count=1)[0].id == "new"
+
+    def test_query_with_ann_index_matches_exact_search_when_probing_all_clusters(self):
+        exact_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        ann_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), ann_nprobe=4, ann_nlist=4, ann_min_rows=10
+        )
+
+        for i, vector in enumerate(np.random.default_rng(0).normal(size=(50, 2))):
+            exact_driver.upsert_vector(vector.tolist(), vector_id=str(i))
+            ann_driver.upsert_vector(vector.tolist(), vector_id=str(i))
+
+        assert [r.id for r in ann_driver.query("foobar", count=10)] == [
+            r.id for r in exact_driver.query("foobar", count=10)
+        ]
+
+    def test_query_with_ann_index_after_delete_namespace(self):
+        exact_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        ann_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), ann_nprobe=4, ann_nlist=4, ann_min_rows=10
+        )
+
+        for driver in [exact_driver, ann_driver]:
+            for i, vector in enumerate(np.random.default_rng(0).normal(size=(60, 2))):
+                driver.upsert_vector(
+                    vector.tolist(), vector_id=str(i), namespace="foo" if i % 3 else "bar", meta={"even": i % 2 == 0}
+                )
+
+            driver.delete_namespace("bar")
+
+        ann_driver.train_ann_index()
+
+        assert sum(len(rows) for rows in ann_driver._cluster_rows) == len(ann_driver.entries)
+        for kwargs in [
+            {},
+            {"namespace": "foo"},
+            {"filter": {"even": True}},
+            {"namespace": "foo", "filter": {"even": True}},
+        ]:
+            assert [r.id for r in ann_driver.query("foobar", count=10, **kwargs)] == [
+                r.id for r in exact_driver.query("foobar", count=10, **kwargs)
+            ]
+
+    def test_ann_index_is_trained_on_upsert(self, mocker):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), ann_nprobe=1, ann_nlist=2, ann_min_rows=10
+        )
+        train_index = mocker.spy(LocalVectorStoreDriver, "_train_index")
+
+        for i in range(9):
+            driver.upsert_vector([float(i), 1.0], vector_id=str(i))
+
+        assert driver._centroids is None
+
+        driver.upsert_vector([1.0, 0.0], vector_id="9")
+        driver.query("foobar")
+
+        assert driver._centroids is not None
+        assert train_index.call_count == 1
+
+        driver.upsert_vectors([[float(i), -1.0] for i in range(10)], vector_ids=[str(i) for i in range(10, 20)])
+
+        assert train_index.call_count == 2
+
+    def test_query_with_ann_index_below_min_rows(self, driver):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), ann_nprobe=1, ann_min_rows=100)
+        driver.upsert_vector([0.0, 1.0], vector_id="a")
+
+        assert [r.id for r in driver.query("foobar")] == ["a"]
+        assert driver._centroids is None
+
+    def test_upsert_vectors(self, driver):
+        driver.batch_size = 2
+
+        vector_ids = driver.upsert_vectors(
+            [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+            vector_ids=["a", None, "c"],
+            namespace="foo",
+            metas=[{"a": 1}, None, None],
+        )
+
+        assert vector_ids[0] == "a"
+        assert vector_ids[2] == "c"
+        assert len(driver.load_entries("foo")) == 3
+        assert driver.load_entry("a", namespace="foo").meta == {"a": 1}
+        assert driver.load_entry(vector_ids[1], namespace="foo").vector == [0.0, 1.0]
+
+    def test_upsert_vectors_mismatched_lengths(self, driver):
+        with pytest.raises(ValueError):
+            driver.upsert_vectors([[1.0, 0.0], [0.0, 1.0]], vector_ids=["a"])
+
+    def test_upsert_vectors_persist_dir(self, tmp_path):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+        driver.upsert_vectors([[1.0, 0.0], [0.0, 1.0]], vector_ids=["a", "b"], metas=[{"foo": "bar"}, None])
+
+        reopened = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=str(tmp_path))
+
+        assert reopened.load_entry("a").meta == {"foo": "bar"}
+        assert reopened.load_entry("b").vector == [0.0, 1.0]
+
+    def test_upsert_text_artifacts_batched(self, driver):
+        foo = TextArtifact("foo")
+        bar = TextArtifact("bar")
+
+        assert driver.upsert_text_artifacts_batched({"foo": [foo], "bar": [bar]}, meta={"baz": 1}) == {
+            "foo": [foo.id],
+            "bar": [bar.id],
+        }
+        assert BaseArtifact.from_json(driver.load_entry(foo.id, namespace="foo").meta["artifact"]).value == "foo"
+        assert driver.load_entry(bar.id, namespace="bar").meta["baz"] == 1
+        assert driver.load_entry(bar.id, namespace="bar").vector == [0, 1]
+
+    def test_query_batch(self, driver):
+        for i in range(5):
+            driver.upsert_vector([float(i), 1.0], vector_id=str(i), namespace="foo" if i % 2 else "bar")
+
+        for namespace in [None, "foo"]:
+            batch = driver.query_batch(["foo", "bar"], count=2, namespace=namespace, include_vectors=True)
+
+            assert len(batch) == 2
+            for results in batch:
+                assert results == driver.query("foo", count=2, namespace=namespace, include_vectors=True)
+
+        assert driver.query_batch(["foo"], namespace="bad-namespace") == [[]]
+        assert driver.query_batch([]) == []
+
+    def test_query_batch_with_relatedness_fn(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), relatedness_fn=lambda x, y: y[0])
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([2.0, 0.0], vector_id="b")
+
+        assert [[r.id for r in results] for results in driver.query_batch(["foo", "bar"])] == [["b", "a"], ["b", "a"]]
+
+    def test_query_vector(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="a", meta={"foo": "bar"})
+        driver.upsert_vector([0.0, 1.0], vector_id="b", meta={"foo": "baz"})
+        driver.upsert_vector([1.0, 1.0], vector_id="c", namespace="ns", meta={"foo": "bar"})
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0])] == ["a", "c", "b"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0], filter={"foo": "bar"})] == ["a", "c"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0], namespace="ns", filter={"foo": "bar"})] == ["c"]
+        assert driver.query_vector([1.0, 0.0], filter={"foo": "qux"}) == []
+        assert [[r.id for r in results] for results in driver.query_batch(["foo"], filter={"foo": "baz"})] == [["b"]]
+
+    def test_query_vector_filter_after_updates(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="a", namespace="foo", meta={"foo": "bar", "tags": ["x"]})
+        driver.upsert_vector([0.0, 1.0], vector_id="b", namespace="foo", meta={"foo": "bar", "tags": ["y"]})
+        driver.upsert_vector([1.0, 1.0], vector_id="c", namespace="baz", meta={"foo": "bar"})
+        driver.upsert_vector([0.0, 1.0], vector_id="b", namespace="foo", meta={"foo": "baz", "tags": ["y"]})
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0], filter={"foo": "bar"})] == ["a", "c"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0], filter={"foo": "baz", "tags": ["y"]})] == ["b"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0], filter={"tags": ["x"]})] == ["a"]
+        assert driver.query_vector([1.0, 0.0], namespace="bad-namespace", filter={"foo": "bar"}) == []
+
+        driver.delete_namespace("foo")
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0], filter={"foo": "bar"})] == ["c"]
+        assert driver.query_vector([1.0, 0.0], filter={"foo": "baz"}) == []
+        assert driver.query_vector([1.0, 0.0], namespace="foo") == []
+
+        driver.upsert_vector([1.0, 0.0], vector_id="d", namespace="foo", meta={"foo": "bar"})
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0], namespace="foo", filter={"foo": "bar"})] == ["d"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0])] == ["d", "c"]
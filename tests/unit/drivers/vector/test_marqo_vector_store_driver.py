@@ -116,6 +116,17 @@ class TestMarqoVectorStorageDriver:
         }
         assert result == expected_return_value["items"][0]["_id"]
 
+    def test_upsert_text_artifacts_batched(self, driver, mock_marqo):
+        driver.batch_size = 1
+        mock_marqo.index().add_documents.side_effect = lambda docs, **kwargs: {
+            "errors": False,
+            "items": [{"_id": doc["_id"], "result": "created", "status": 201} for doc in docs],
+        }
+        artifacts = [TextArtifact("foo"), TextArtifact("bar")]
+
+        assert driver.upsert_text_artifacts_batched({"foo": artifacts}) == {"foo": [a.id for a in artifacts]}
+        assert mock_marqo.index().add_documents.call_count == 2
+
     def test_search(self, driver, mock_marqo):
         results = driver.query("Test query")
         mock_marqo.index().search.assert_called()
@@ -147,6 +158,26 @@ class TestMarqoVectorStorageDriver:
         assert results[0].vector == [-0.10393160581588745, 0.0465407557785511, -0.01760256476700306]  # The vector
         # values should match the "_embedding" values of title in mock response
 
+    def test_search_with_filter(self, driver, mock_marqo):
+        driver.query("Test query", namespace="foo", filter={"Title": "bar"})
+
+        mock_marqo.index().search.assert_called_once_with(
+            "Test query", limit=5, attributes_to_retrieve=["*"], filter_string="namespace:foo AND Title:bar"
+        )
+
+    def test_query_vector(self, driver, mock_marqo):
+        results = driver.query_vector([0.1, 0.2, 0.3], namespace="foo")
+
+        mock_marqo.index().search.assert_called_once_with(
+            None,
+            limit=5,
+            attributes_to_retrieve=["*"],
+            filter_string="namespace:foo",
+            context={"tensor": [{"vector": [0.1, 0.2, 0.3], "weight": 1}]},
+        )
+        assert results[0].id == "5aed93eb-3878-4f12-bc92-0fda01c7d23d"
+        assert results[0].score == 0.6047464
+
     def test_load_entry(self, driver, mock_marqo):
         # Mock 'get_document' method to return a dictionary
         entry = driver.load_entry("5aed93eb-3878-4f12-bc92-0fda01c7d23d")
@@ -27,6 +27,20 @@ class TestMongoDbAtlasVectorStoreDriver:
         test_id = driver.upsert_vector(vector, vector_id=vector_id_str)
         assert test_id == vector_id_str
 
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors([[0.1, 0.2], [0.3, 0.4]], metas=[{"foo": "bar"}, None])
+
+        assert len(vector_ids) == 2
+        assert driver.get_collection().count_documents({}) == 2
+
+    def test_upsert_vectors_with_ids(self, driver, mocker):
+        bulk_write = mocker.patch("mongomock.collection.Collection.bulk_write")
+
+        assert driver.upsert_vectors([[0.1, 0.2], [0.3, 0.4]], vector_ids=["foo", "bar"]) == ["foo", "bar"]
+
+        operations = bulk_write.call_args.args[0]
+        assert [operation._filter for operation in operations] == [{"_id": "foo"}, {"_id": "bar"}]
+
     def test_upsert_text_artifact(self, driver):
         artifact = TextArtifact("foo")
         test_id = driver.upsert_text_artifact(artifact)
@@ -54,6 +68,20 @@ class TestMongoDbAtlasVectorStoreDriver:
             assert result.vector == expected.vector
             assert isinstance(result, BaseVectorStoreDriver.QueryResult)
 
+    def test_query_vector(self, driver, mocker):
+        aggregate = mocker.patch(
+            "mongomock.collection.Collection.aggregate",
+            return_value=[
+                {"_id": "foo", "vector": [0.5, 0.5], "namespace": "bar", "meta": {"foo": "baz"}, "score": 0.9}
+            ],
+        )
+
+        results = driver.query_vector([0.5, 0.5], namespace="bar", filter={"foo": "baz"})
+
+        assert results[0].id == "foo"
+        assert results[0].score == 0.9
+        assert aggregate.call_args.args[0][0]["$vectorSearch"]["filter"] == {"meta.foo": "baz", "namespace": "bar"}
+
     def test_load_entry(self, driver):
         vector_id_str = "123"
         vector = [0.5, 0.5, 0.5]
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, Mock
 from griptape.drivers import PgVectorVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
 
 
 class TestPgVectorVectorStoreDriver:
@@ -132,3 +133,32 @@ class TestPgVectorVectorStoreDriver:
         assert result[1].namespace == test_namespaces[1]
         assert result[0].meta == test_metas[0]
         assert result[1].meta == test_metas[1]
+
+    def test_query_vector_with_filter(self, mock_session, mock_engine):
+        test_result = [[Mock(id="foo", vector=[0.1, 0.2], namespace=None, meta={"key": "value1"}), 0.1]]
+        mock_session.query().order_by().filter().limit().all.return_value = test_result
+
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        result = driver.query_vector([0.1, 0.2], filter={"key": "value1"})
+
+        assert result[0].id == "foo"
+        assert result[0].meta == {"key": "value1"}
+
+    @pytest.mark.parametrize("value,param", [("value1", '"value1"'), (True, "true"), (1, "1"), (None, "null")])
+    def test_query_vector_filter_compares_json(self, mock_session, mock_engine, value, param):
+        mock_session.query().order_by().filter().limit().all.return_value = []
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        driver.query_vector([0.1, 0.2], filter={"key": value})
+
+        dialect = postgresql.dialect()
+        compiled = mock_session.query().order_by().filter.call_args.args[0].compile(dialect=dialect)
+        bind = compiled.binds["param_1"]
+
+        assert str(compiled) == f"CAST(({self.table_name}.meta -> %(meta_1)s) AS JSONB) = %(param_1)s"
+        assert bind.type.bind_processor(dialect)(bind.value) == param
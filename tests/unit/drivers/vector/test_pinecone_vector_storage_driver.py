@@ -38,6 +38,12 @@ class TestPineconeVectorStorageDriver:
         assert driver.upsert_vector([0, 1, 2], vector_id="foo") == "foo"
         assert isinstance(driver.upsert_vector([0, 1, 2]), str)
 
+    def test_upsert_vectors(self, driver):
+        driver.batch_size = 2
+
+        assert driver.upsert_vectors([[0, 1], [1, 0], [1, 1]], vector_ids=["foo", None, "bar"])[::2] == ["foo", "bar"]
+        assert driver.index.upsert.call_count == 2
+
     def test_upsert_text(self, driver):
         assert driver.upsert_text("foo", vector_id="foo") == "foo"
         assert isinstance(driver.upsert_text("foo"), str)
@@ -47,3 +53,16 @@ class TestPineconeVectorStorageDriver:
 
         assert results[0].vector == [0, 1, 0]
         assert results[0].id == "foo"
+
+    def test_query_batch(self, driver):
+        batch = driver.query_batch(["foo", "bar"])
+
+        assert len(batch) == 2
+        assert batch[0][0].id == "foo"
+        assert batch[1][0].id == "foo"
+
+    def test_query_vector(self, driver):
+        results = driver.query_vector([0, 1, 0], filter={"foo": "bar"})
+
+        assert results[0].id == "foo"
+        assert driver.index.query.call_args.kwargs["filter"] == {"foo": "bar"}
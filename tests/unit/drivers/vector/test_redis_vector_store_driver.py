@@ -32,6 +32,16 @@ class TestRedisVectorStorageDriver:
             == "some_vector_id"
         )
 
+    def test_upsert_vectors(self, driver, mocker):
+        pipeline = mocker.MagicMock()
+        mocker.patch.object(redis.StrictRedis, "pipeline", return_value=pipeline)
+
+        assert driver.upsert_vectors(
+            [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], vector_ids=["foo", "bar"], namespace="some_namespace"
+        ) == ["foo", "bar"]
+        assert pipeline.hset.call_count == 2
+        pipeline.execute.assert_called_once()
+
     def test_load_entry(self, driver):
         entry = driver.load_entry("some_vector_id", namespace="some_namespace")
         assert entry.id == "some_vector_id"
@@ -46,3 +56,12 @@ class TestRedisVectorStorageDriver:
 
     def test_query(self, driver):
         assert driver.query("some_vector_id") == []
+
+    def test_query_vector_with_filter(self, driver, mocker):
+        documents = [
+            mocker.MagicMock(id="foo", metadata='{"foo": "bar"}', __getitem__=lambda _, key: {"score": "0.1"}[key]),
+            mocker.MagicMock(id="bar", metadata='{"foo": "baz"}', __getitem__=lambda _, key: {"score": "0.2"}[key]),
+        ]
+        driver.client.ft().search.return_value = mocker.MagicMock(docs=documents)
+
+        assert [r.id for r in driver.query_vector([1.0, 2.0, 3.0], filter={"foo": "bar"})] == ["foo"]
@@ -3,8 +3,10 @@ from griptape.artifacts import TextArtifact, BaseArtifact
 from griptape.drivers import LocalVectorStoreDriver
 from griptape.engines import VectorQueryEngine
 from griptape.loaders import TextLoader
+from griptape.utils import J2, PromptStack
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -27,6 +29,13 @@ class TestVectorQueryEngine:
 
         assert engine.query("foo").value.startswith("mock output")
 
+    def test_query_with_vector(self, engine, mocker):
+        engine.upsert_text_artifact(TextArtifact("foobar"))
+        embed_string = mocker.spy(engine.vector_store_driver.embedding_driver, "embed_string")
+
+        assert engine.query("foo", vector=[0, 1]).value.startswith("mock output")
+        embed_string.assert_not_called()
+
     def test_upsert_text_artifact(self, engine):
         engine.upsert_text_artifact(TextArtifact("foobar"), namespace="test")
 
@@ -53,3 +62,26 @@ class TestVectorQueryEngine:
 
         assert len(engine.load_artifacts("doesntexist")) == 0
         assert len(engine.load_artifacts("test")) == 2
+
+    def test_query_packs_segments(self, mocker):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_tokens=2000))
+        engine = VectorQueryEngine(
+            vector_store_driver=LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()),
+            prompt_driver=prompt_driver,
+        )
+        engine.upsert_text_artifacts([TextArtifact(f"foobar{i}" * 10) for i in range(100)], namespace="test")
+        run = mocker.spy(prompt_driver, "run")
+
+        engine.query("foo", top_n=100)
+
+        message = run.call_args.args[0].inputs[0].content
+        text_segments = [s for s in message.split('Text segment: """\n') if s.startswith("foobar")]
+        next_message = engine.template_generator.render(
+            query="foo", text_segments=[*text_segments, text_segments[0]], rulesets=J2("rulesets/rulesets.j2").render()
+        )
+
+        assert 0 < len(text_segments) < 100
+        assert len(prompt_driver.prompt_stack_to_string(run.call_args.args[0])) + 400 < 2000
+        assert (
+            prompt_driver.token_count(PromptStack(inputs=[PromptStack.Input(next_message, role="user")])) + 400 >= 2000
+        )
@@ -40,3 +40,14 @@ class TestPdfLoader:
         assert artifacts[key2][-1].value.endswith('its applications," 1957.\n9')
 
         assert artifacts[key1][0].embedding == [0, 1]
+
+    def test_iter_load(self, loader):
+        path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "../../resources/bitcoin.pdf")
+
+        artifacts = list(loader.iter_load(path))
+
+        assert len(artifacts) == 151
+        assert artifacts[0].value.startswith("Bitcoin: A Peer-to-Peer")
+        assert artifacts[-1].value.endswith('its applications," 1957.\n9')
+
+        assert artifacts[0].embedding == [0, 1]
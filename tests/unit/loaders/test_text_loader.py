@@ -1,4 +1,5 @@
 import os
+from concurrent import futures
 from pathlib import Path
 import pytest
 from griptape import utils
@@ -58,3 +59,44 @@ class TestTextLoader:
 
         assert list(artifacts.values())[0][0].embedding == [0, 1]
         assert list(artifacts.values())[0][0].encoding == loader.encoding
+
+    def test_iter_load_with_str(self, loader):
+        text = gen_paragraph(MAX_TOKENS * 2, loader.tokenizer, " ")
+        artifacts = list(loader.iter_load(text))
+
+        assert [a.value for a in artifacts] == [a.value for a in loader.load(text)]
+        assert artifacts[0].encoding == loader.encoding
+        assert artifacts[0].embedding == [0, 1]
+
+    def test_iter_load_with_path(self, loader):
+        path = Path(os.path.join(os.path.abspath(os.path.dirname(__file__)), "../../resources/test.txt"))
+
+        artifacts = list(loader.iter_load(path))
+
+        assert len(artifacts) == 39
+        assert artifacts[0].value.startswith("foobar foobar foobar")
+        assert artifacts[0].encoding == loader.encoding
+        assert all(a.embedding == [0, 1] for a in artifacts)
+
+    def test_load_collection_with_chunking_executor(self, loader):
+        texts = [
+            gen_paragraph(MAX_TOKENS * 2, loader.tokenizer, " "),
+            gen_paragraph(MAX_TOKENS * 3, loader.tokenizer, ". "),
+        ]
+
+        with futures.ProcessPoolExecutor(max_workers=2) as chunking_executor:
+            process_loader = TextLoader(
+                max_tokens=MAX_TOKENS,
+                embedding_driver=MockEmbeddingDriver(),
+                encoding=loader.encoding,
+                chunking_executor=chunking_executor,
+            )
+            artifacts = process_loader.load_collection(texts)
+
+        expected_artifacts = loader.load_collection(texts)
+
+        assert list(artifacts.keys()) == list(expected_artifacts.keys())
+        assert [[a.value for a in v] for v in artifacts.values()] == [
+            [a.value for a in v] for v in expected_artifacts.values()
+        ]
+        assert all(a.embedding == [0, 1] and a.encoding == loader.encoding for v in artifacts.values() for a in v)
@@ -1,18 +1,34 @@
 import json
+import math
 import pytest
+from attrs import define, field
 from griptape.drivers import OpenAiChatPromptDriver
 from griptape.memory.structure import ConversationMemory
 from griptape.memory import TaskMemory
 from tests.mocks.mock_serializable import MockSerializable
 from griptape.schemas import BaseSchema
 from griptape.artifacts import BaseArtifact, TextArtifact
+from griptape.mixins import SerializableMixin
+
+
+@define
+class MockFloatSerializable(SerializableMixin):
+    value: float = field(kw_only=True, metadata={"serializable": True})
 
 
 class TestSerializableMixin:
+    @pytest.fixture
+    def without_orjson(self, mocker):
+        mocker.patch("griptape.utils.import_optional_dependency", side_effect=ImportError())
+
     def test_get_schema(self):
         assert isinstance(BaseArtifact.get_schema("TextArtifact"), BaseSchema)
         assert isinstance(TextArtifact.get_schema(), BaseSchema)
 
+    def test_get_schema_cache(self):
+        assert BaseArtifact.get_schema("TextArtifact") is TextArtifact.get_schema()
+        assert TextArtifact.get_schema() is not MockSerializable.get_schema()
+
     def test_from_dict(self):
         assert isinstance(BaseArtifact.from_dict({"type": "TextArtifact", "value": "foobar"}), TextArtifact)
         assert isinstance(TextArtifact.from_dict({"value": "foobar"}), TextArtifact)
@@ -21,6 +37,18 @@ class TestSerializableMixin:
         assert isinstance(BaseArtifact.from_json('{"type": "TextArtifact", "value": "foobar"}'), TextArtifact)
         assert isinstance(TextArtifact.from_json('{"value": "foobar"}'), TextArtifact)
 
+    def test_from_json_with_orjson(self):
+        pytest.importorskip("orjson")
+
+        assert MockSerializable.from_json('{"foo": "baz", "baz": [1, 2]}').baz == [1, 2]
+        assert MockSerializable.from_json('{"baz": [18446744073709551617]}').baz == [18446744073709551616]
+        assert math.isnan(MockFloatSerializable.from_json('{"value": NaN}').value)
+
+    def test_from_json_without_orjson(self, without_orjson):
+        assert MockSerializable.from_json('{"foo": "baz", "baz": [1, 2]}').baz == [1, 2]
+        assert MockSerializable.from_json('{"baz": [18446744073709551617]}').baz == [18446744073709551617]
+        assert math.isnan(MockFloatSerializable.from_json('{"value": NaN}').value)
+
     def test_str(self):
         assert str(MockSerializable()) == json.dumps(
             {"type": "MockSerializable", "foo": "bar", "bar": None, "baz": None}
@@ -31,6 +59,32 @@ class TestSerializableMixin:
             {"type": "MockSerializable", "foo": "bar", "bar": None, "baz": None}
         )
 
+    def test_to_json_compact_with_orjson(self):
+        pytest.importorskip("orjson")
+
+        assert MockSerializable(foo="bär", baz=[1]).to_json(compact=True) == (
+            '{"type":"MockSerializable","foo":"bär","bar":null,"baz":[1]}'
+        )
+        assert MockSerializable(baz=[2**64]).to_json(compact=True) == (
+            '{"type":"MockSerializable","foo":"bar","bar":null,"baz":[18446744073709551616]}'
+        )
+        assert (
+            MockFloatSerializable(value=math.nan).to_json(compact=True)
+            == '{"type":"MockFloatSerializable","value":null}'
+        )
+
+    def test_to_json_compact_without_orjson(self, without_orjson):
+        assert MockSerializable(foo="bär", baz=[1]).to_json(compact=True) == (
+            '{"type":"MockSerializable","foo":"bär","bar":null,"baz":[1]}'
+        )
+        assert MockSerializable(baz=[2**64]).to_json(compact=True) == (
+            '{"type":"MockSerializable","foo":"bar","bar":null,"baz":[18446744073709551616]}'
+        )
+        assert (
+            MockFloatSerializable(value=math.nan).to_json(compact=True)
+            == '{"type":"MockFloatSerializable","value":NaN}'
+        )
+
     def test_to_dict(self):
         assert MockSerializable().to_dict() == {"type": "MockSerializable", "foo": "bar", "bar": None, "baz": None}
 
@@ -47,3 +101,11 @@ class TestSerializableMixin:
 
         with pytest.raises(ValueError):
             MockSerializable._import_cls_rec("griptape.memory.task", "ConversationMemory")
+
+    def test_round_trip(self):
+        artifact = BaseArtifact.from_dict(TextArtifact("foobar", name="foo").to_dict())
+
+        assert isinstance(artifact, TextArtifact)
+        assert artifact.value == "foobar"
+        assert artifact.name == "foo"
+        assert BaseArtifact.from_json(artifact.to_json()).to_dict() == artifact.to_dict()
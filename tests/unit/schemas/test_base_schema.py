@@ -25,6 +25,16 @@ class TestBaseSchema:
         with pytest.raises(ValueError):
             BaseSchema.from_attrs_cls(TextLoader)
 
+    def test_from_attrs_cls_cache(self):
+        assert BaseSchema.from_attrs_cls(MockSerializable) is BaseSchema.from_attrs_cls(MockSerializable)
+        assert BaseSchema.from_attrs_cls(TextArtifact) is not BaseSchema.from_attrs_cls(MockSerializable)
+
+    def test_schema_from_attrs_cls(self):
+        schema = BaseSchema.schema_from_attrs_cls(MockSerializable)
+
+        assert isinstance(schema, BaseSchema.from_attrs_cls(MockSerializable))
+        assert schema is BaseSchema.schema_from_attrs_cls(MockSerializable)
+
     def test_get_field_for_type(self):
         assert isinstance(BaseSchema._get_field_for_type(BaseArtifact), fields.Nested)
 
@@ -0,0 +1,70 @@
+import json
+import pytest
+from griptape.artifacts import BaseArtifact, TextArtifact, CsvRowArtifact, ListArtifact
+from griptape.memory.structure import Run
+from griptape.schemas import BaseSchema, FastSerializer
+from griptape.utils import PromptStack
+from tests.mocks.mock_serializable import MockSerializable
+
+
+class TestFastSerializer:
+    @pytest.fixture(
+        params=[
+            TextArtifact("foo", name="bar"),
+            TextArtifact("foo", start_char=0, end_char=3, start_token=0, end_token=1),
+            CsvRowArtifact({"foo": "bar", "baz": "qux"}, delimiter=";"),
+            Run(input="foo", output="bar"),
+            PromptStack(inputs=[PromptStack.Input("foo", role="user"), PromptStack.Input("bar", role="assistant")]),
+            MockSerializable(foo="bar", bar=None, baz=[1, 2]),
+        ]
+    )
+    def obj(self, request):
+        return request.param
+
+    def test_from_attrs_cls(self):
+        assert FastSerializer.from_attrs_cls(TextArtifact) is FastSerializer.from_attrs_cls(TextArtifact)
+        assert FastSerializer.from_attrs_cls(PromptStack) is not None
+        assert FastSerializer.from_attrs_cls(ListArtifact) is None
+
+    def test_dump(self, obj):
+        data = FastSerializer.from_attrs_cls(obj.__class__).dump(obj)
+
+        assert data == BaseSchema.schema_from_attrs_cls(obj.__class__).dump(obj)
+        assert json.dumps(data) == json.dumps(BaseSchema.schema_from_attrs_cls(obj.__class__).dump(obj))
+
+    def test_load(self, obj):
+        data = obj.to_dict()
+
+        assert FastSerializer.from_attrs_cls(obj.__class__).load(data) == obj
+        assert BaseSchema.schema_from_attrs_cls(obj.__class__).load(data) == obj
+
+    def test_dump_unsupported_value(self):
+        serializer = FastSerializer.from_attrs_cls(MockSerializable)
+
+        assert serializer.dump(MockSerializable(baz=[1.0, 2.0])) is None
+        assert MockSerializable(baz=[1.0, 2.0]).to_dict()["baz"] == [1, 2]
+
+    def test_load_unsupported_value(self):
+        serializer = FastSerializer.from_attrs_cls(MockSerializable)
+
+        assert serializer.load({"baz": ["1", "2"]}) is None
+        assert serializer.load({"foo": None}) is None
+        assert serializer.load({"qux": "foo"}) is None
+        assert MockSerializable.from_dict({"baz": ["1", "2"]}).baz == [1, 2]
+
+    def test_from_dict(self):
+        artifact = BaseArtifact.from_dict({"type": "CsvRowArtifact", "value": {"foo": "bar"}})
+
+        assert isinstance(artifact, CsvRowArtifact)
+        assert artifact.value == {"foo": "bar"}
+
+        with pytest.raises(ValueError):
+            BaseArtifact.from_dict({"value": "foo"})
+
+        with pytest.raises(Exception):
+            TextArtifact.from_dict({"value": "foo", "qux": "foo"})
+
+    def test_to_json_compact(self, obj):
+        assert json.loads(obj.to_json(compact=True)) == json.loads(obj.to_json())
+        assert obj.to_json(compact=True) == json.dumps(obj.to_dict(), separators=(",", ":"), ensure_ascii=False)
+        assert obj.__class__.from_json(obj.to_json(compact=True)) == obj
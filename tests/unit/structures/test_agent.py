@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from griptape.memory.structure import ConversationMemory
 from griptape.memory import TaskMemory
@@ -150,6 +151,22 @@ class TestAgent:
         except ValueError:
             assert True
 
+    def test_find_task(self):
+        first_task = PromptTask("test1", id="test1")
+        second_task = PromptTask("test2", id="test2")
+        agent = Agent(prompt_driver=MockPromptDriver())
+
+        agent.add_task(first_task)
+
+        assert agent.find_task("test1") is first_task
+
+        agent.add_task(second_task)
+
+        assert agent.find_task("test2") is second_task
+
+        with pytest.raises(ValueError):
+            agent.find_task("test1")
+
     def test_prompt_stack_without_memory(self):
         agent = Agent(prompt_driver=MockPromptDriver(), conversation_memory=None)
 
@@ -196,6 +213,18 @@ class TestAgent:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        task = PromptTask("test")
+        agent = Agent(prompt_driver=MockPromptDriver())
+        agent.add_task(task)
+
+        result = asyncio.run(agent.arun())
+
+        assert result is agent
+        assert "mock output" in result.output_task.output.to_text()
+        assert task.state == BaseTask.State.FINISHED
+        assert len(agent.conversation_memory.runs) == 1
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         agent = Agent(prompt_driver=MockPromptDriver())
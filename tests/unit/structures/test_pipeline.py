@@ -1,10 +1,13 @@
+import asyncio
+import threading
+import time
 import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.memory.task.storage import TextArtifactStorage
 from griptape.rules import Rule, Ruleset
 from griptape.tokenizers import OpenAiTokenizer
-from griptape.tasks import PromptTask, BaseTask, ToolkitTask
+from griptape.tasks import PromptTask, BaseTask, ToolkitTask, CodeExecutionTask
 from griptape.memory.structure import ConversationMemory
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from griptape.structures import Pipeline
@@ -241,6 +244,22 @@ class TestPipeline:
         assert [parent.id for parent in third_task.parents] == ["test2"]
         assert [child.id for child in third_task.children] == []
 
+    def test_find_task(self):
+        first_task = PromptTask("test1", id="test1")
+        second_task = PromptTask("test2", id="test2")
+        third_task = PromptTask("test3", id="test3")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline + [first_task, third_task]
+        pipeline.insert_task(first_task, second_task)
+
+        assert pipeline.find_task("test1") is first_task
+        assert pipeline.find_task("test2") is second_task
+        assert third_task.parents == [second_task]
+
+        with pytest.raises(ValueError):
+            pipeline.find_task("test4")
+
     def test_prompt_stack_without_memory(self):
         pipeline = Pipeline(conversation_memory=None, prompt_driver=MockPromptDriver())
 
@@ -302,6 +321,54 @@ class TestPipeline:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        task1 = PromptTask("test")
+        task2 = PromptTask("test")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+        pipeline + [task1, task2]
+
+        result = asyncio.run(pipeline.arun())
+
+        assert result is pipeline
+        assert task1.state == BaseTask.State.FINISHED
+        assert task2.state == BaseTask.State.FINISHED
+        assert pipeline.output_task.output.to_text() == "mock output"
+        assert len(pipeline.conversation_memory.runs) == 1
+
+    def test_run_many(self):
+        task = PromptTask("{{ args[0] }}")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+        pipeline + task
+
+        results = sorted(pipeline.run_many(["foo", "bar"], max_concurrency=2), key=lambda result: result.index)
+
+        assert [result.structure.input_task.input.to_text() for result in results] == ["foo", "bar"]
+        assert [result.output.to_text() for result in results] == ["mock output", "mock output"]
+        assert task.state == BaseTask.State.PENDING
+
+    def test_run_many_returns_when_closed(self):
+        release = threading.Event()
+
+        def run(task: CodeExecutionTask) -> TextArtifact:
+            if task.structure.execution_args[0]:
+                release.wait(5)
+
+            return TextArtifact("done")
+
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+        pipeline + CodeExecutionTask(run_fn=run)
+        results = pipeline.run_many(range(10), max_concurrency=2)
+
+        try:
+            assert next(results).index == 0
+
+            start = time.perf_counter()
+            results.close()
+
+            assert time.perf_counter() - start < 1
+        finally:
+            release.set()
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         pipeline = Pipeline(prompt_driver=MockPromptDriver())
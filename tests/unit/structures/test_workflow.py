@@ -1,9 +1,13 @@
+import asyncio
+import threading
+from graphlib import CycleError
 import pytest
 
+from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.memory.task.storage import TextArtifactStorage
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from griptape.rules import Rule, Ruleset
-from griptape.tasks import PromptTask, BaseTask, ToolkitTask
+from griptape.tasks import PromptTask, BaseTask, ToolkitTask, CodeExecutionTask
 from griptape.structures import Workflow
 from griptape.memory.structure import ConversationMemory
 from tests.mocks.mock_tool.tool import MockTool
@@ -337,6 +341,99 @@ class TestWorkflow:
         assert set(save_to_disk.child_ids) == {"summarize_to_slack"}
         assert set(publish_website.child_ids) == {"summarize_to_slack"}
 
+    def test_run_submits_children_eagerly(self):
+        child_finished = threading.Event()
+
+        def run_slow(task: CodeExecutionTask) -> TextArtifact:
+            # Only finishes once the child of the fast task finished, which requires no barrier between tasks.
+            if child_finished.wait(timeout=5):
+                return TextArtifact("slow")
+            else:
+                return ErrorArtifact("timeout")
+
+        def run_child(task: CodeExecutionTask) -> TextArtifact:
+            child_finished.set()
+
+            return TextArtifact("child")
+
+        start = CodeExecutionTask(run_fn=lambda task: TextArtifact("start"), id="start")
+        slow = CodeExecutionTask(run_fn=run_slow, id="slow")
+        fast = CodeExecutionTask(run_fn=lambda task: TextArtifact("fast"), id="fast")
+        child = CodeExecutionTask(run_fn=run_child, id="child")
+        end = CodeExecutionTask(run_fn=lambda task: TextArtifact("end"), id="end")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + start
+        workflow + end
+        workflow.insert_tasks(start, [slow, fast], end)
+        workflow.insert_tasks(fast, child, end)
+
+        workflow.run()
+
+        assert slow.output.value == "slow"
+        assert child.output.value == "child"
+        assert end.state == BaseTask.State.FINISHED
+
+    def test_run_stops_after_error(self):
+        task1 = CodeExecutionTask(run_fn=lambda task: TextArtifact("foo"), id="task1")
+        task2 = CodeExecutionTask(run_fn=lambda task: ErrorArtifact("error"), id="task2")
+        task3 = CodeExecutionTask(run_fn=lambda task: TextArtifact("bar"), id="task3")
+        workflow = Workflow(prompt_driver=MockPromptDriver(), conversation_memory=None)
+
+        workflow + task1
+        workflow + task2
+        workflow + task3
+
+        workflow.run()
+
+        assert task1.state == BaseTask.State.FINISHED
+        assert isinstance(task2.output, ErrorArtifact)
+        assert task3.state == BaseTask.State.PENDING
+
+    def test_arun(self):
+        task1 = PromptTask("test")
+        task2 = PromptTask("test")
+        task3 = PromptTask("test")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+        workflow + [task1, task2]
+        workflow.insert_tasks([task1, task2], task3, [])
+
+        result = asyncio.run(workflow.arun())
+
+        assert result is workflow
+        assert all(task.state == BaseTask.State.FINISHED for task in [task1, task2, task3])
+        assert task3.output.to_text() == "mock output"
+        assert len(workflow.conversation_memory.runs) == 1
+
+    def test_arun_stops_after_error(self):
+        task1 = CodeExecutionTask(run_fn=lambda task: TextArtifact("foo"), id="task1")
+        task2 = CodeExecutionTask(run_fn=lambda task: ErrorArtifact("error"), id="task2")
+        task3 = CodeExecutionTask(run_fn=lambda task: TextArtifact("bar"), id="task3")
+        workflow = Workflow(prompt_driver=MockPromptDriver(), conversation_memory=None)
+
+        workflow + task1
+        workflow + task2
+        workflow + task3
+
+        asyncio.run(workflow.arun())
+
+        assert task1.state == BaseTask.State.FINISHED
+        assert isinstance(task2.output, ErrorArtifact)
+        assert task3.state == BaseTask.State.PENDING
+
+    def test_run_with_cycle(self):
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + task1
+        workflow + task2
+        task1.parent_ids.append(task2.id)
+        task2.child_ids.append(task1.id)
+
+        with pytest.raises(CycleError):
+            workflow.run()
+
     def test_input_task(self):
         task1 = PromptTask("prompt1")
         task2 = PromptTask("prompt2")
@@ -380,6 +477,55 @@ class TestWorkflow:
         assert graph["task3"] == {"task1"}
         assert graph["task4"] == {"task2", "task3"}
 
+    def test_find_task(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        task3 = PromptTask("prompt3", id="task3")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + task1
+        workflow + task3
+        workflow.insert_tasks(task1, task2, task3)
+
+        assert workflow.find_task("task1") is task1
+        assert workflow.find_task("task2") is task2
+        assert [parent.id for parent in task3.parents] == ["task2"]
+
+        task4 = PromptTask("prompt4", id="task4")
+        task4.preprocess(workflow)
+        workflow.tasks.append(task4)
+
+        assert workflow.find_task("task4") is task4
+
+        with pytest.raises(ValueError):
+            workflow.find_task("task5")
+
+    def test_find_task_reindexes_when_tasks_change(self):
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+        workflow + [PromptTask("prompt1", id="task1"), PromptTask("prompt2", id="task2")]
+        task_positions = workflow._task_positions
+
+        with pytest.raises(ValueError):
+            workflow.find_task("task3")
+
+        assert workflow._task_positions is task_positions
+
+        task3 = PromptTask("prompt3", id="task3")
+        workflow.tasks[0] = task3
+
+        assert workflow.find_task("task3") is task3
+
+        with pytest.raises(ValueError):
+            workflow.find_task("task1")
+
+        task4 = PromptTask("prompt4", id="task4")
+        workflow.tasks[1] = task4
+
+        with pytest.raises(ValueError):
+            workflow.find_task("task2")
+
+        assert workflow.find_task("task4") is task4
+
     def test_order_tasks(self):
         task1 = PromptTask("prompt1", id="task1")
         task2 = PromptTask("prompt2", id="task2")
@@ -1,8 +1,9 @@
+import asyncio
 import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.structures import Agent
-from griptape.tasks import ActionSubtask
+from griptape.tasks import ActionSubtask, BaseTask
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_task import MockTask
@@ -30,3 +31,25 @@ class TestBaseTask:
         task.structure.task_memory.process_output(MockTool().test, subtask, TextArtifact("foo"))
 
         assert len(task.meta_memories) == 2
+
+    def test_aexecute(self, task):
+        output = asyncio.run(task.aexecute())
+
+        assert output is task.output
+        assert output.to_text() == "foobar"
+        assert task.is_finished()
+
+    def test_copy(self, task):
+        task.execute()
+
+        task_copy = task.copy()
+
+        assert task_copy is not task
+        assert task_copy.id == task.id
+        assert task_copy.state == BaseTask.State.PENDING
+        assert task_copy.output is None
+        assert task_copy.structure is None
+        assert task_copy.parent_ids == task.parent_ids
+        assert task_copy.parent_ids is not task.parent_ids
+        assert task_copy.context is not task.context
+        assert task.is_finished()
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import pytest
 from tests.mocks.mock_structure_config import MockStructureConfig
 from griptape.tasks import PromptTask
@@ -14,6 +16,31 @@ class TestPromptTask:
 
         assert task.run().to_text() == "mock output"
 
+    def test_arun(self):
+        task = PromptTask("test")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline.add_task(task)
+
+        assert asyncio.run(task.arun()).to_text() == "mock output"
+
+    def test_arun_builds_prompt_stack_off_the_event_loop(self, mocker):
+        threads = []
+        prompt_stack = PromptTask.prompt_stack
+        mocker.patch.object(
+            PromptTask,
+            "prompt_stack",
+            new=property(lambda task: threads.append(threading.current_thread()) or prompt_stack.fget(task)),
+        )
+        task = PromptTask("test")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline.add_task(task)
+
+        assert asyncio.run(task.arun()).to_text() == "mock output"
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
+
     def test_to_text(self):
         task = PromptTask("{{ test }}", context={"test": "test value"})
 
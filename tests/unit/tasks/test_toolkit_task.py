@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import pytest
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.drivers import LocalVectorStoreDriver
@@ -55,6 +57,159 @@ class TestToolkitSubtask:
         assert len(task.subtasks) == 3
         assert isinstance(task.output, ErrorArtifact)
 
+    def test_copy(self):
+        output = """Answer: done"""
+
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")])
+        agent = Agent(prompt_driver=MockValuePromptDriver(value=output))
+
+        agent.add_task(task)
+        agent.run()
+
+        task_copy = task.copy()
+
+        assert task_copy.tools == task.tools
+        assert task_copy.tools[0] is task.tools[0]
+        assert task_copy.subtasks is not task.subtasks
+        assert task_copy.output is None
+
+    def test_run_concurrent_actions(self, mocker):
+        outputs = [
+            "Thought: need to test twice\n"
+            'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "foo"}}}\n'
+            'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "bar"}}}',
+            "Answer: done",
+        ]
+        mock_try_run = mocker.patch.object(
+            MockValuePromptDriver, "try_run", side_effect=[TextArtifact(output) for output in outputs]
+        )
+        barrier = threading.Barrier(2, timeout=5)
+        run = ActionSubtask.run
+
+        def run_concurrently(subtask: ActionSubtask) -> TextArtifact:
+            barrier.wait()
+
+            return run(subtask)
+
+        mocker.patch.object(ActionSubtask, "run", autospec=True, side_effect=run_concurrently)
+
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1", off_prompt=False)])
+        agent = Agent(prompt_driver=MockValuePromptDriver(value=""))
+
+        agent.add_task(task)
+
+        result = agent.run()
+
+        assert result.output_task.output.to_text() == "done"
+        assert len(task.subtasks) == 3
+        assert task.subtasks[0].thought == "need to test twice"
+        assert [subtask.output.to_text() for subtask in task.subtasks] == ["ack foo", "ack bar", "done"]
+        assert task.subtasks[2].parent_ids == [task.subtasks[0].id, task.subtasks[1].id]
+
+        prompt = mock_try_run.call_args_list[1].args[0].inputs
+
+        assert "ack foo" in prompt[-3].content
+        assert "ack bar" in prompt[-1].content
+
+    def test_arun_concurrent_actions(self, mocker):
+        outputs = [
+            'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "foo"}}}\n'
+            'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "bar"}}}',
+            "Answer: done",
+        ]
+        mocker.patch.object(MockValuePromptDriver, "try_run", side_effect=[TextArtifact(output) for output in outputs])
+
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1", off_prompt=False)])
+        agent = Agent(prompt_driver=MockValuePromptDriver(value=""))
+
+        agent.add_task(task)
+
+        result = asyncio.run(agent.arun())
+
+        assert result.output_task.output.to_text() == "done"
+        assert [subtask.output.to_text() for subtask in task.subtasks] == ["ack foo", "ack bar", "done"]
+
+    @pytest.mark.parametrize("use_arun", [False, True])
+    def test_run_batch_with_malformed_action(self, mocker, use_arun):
+        outputs = [
+            'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "foo"}}}\n'
+            "Action: test bar\n"
+            'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "baz"}}}',
+            "Answer: done",
+        ]
+        mock_try_run = mocker.patch.object(
+            MockValuePromptDriver, "try_run", side_effect=[TextArtifact(output) for output in outputs]
+        )
+        mocker.patch.object(MockValuePromptDriver, "try_arun", side_effect=[TextArtifact(output) for output in outputs])
+
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1", off_prompt=False)])
+        agent = Agent(prompt_driver=MockValuePromptDriver(value=""))
+
+        agent.add_task(task)
+
+        result = asyncio.run(agent.arun()) if use_arun else agent.run()
+
+        assert result.output_task.output.to_text() == "done"
+        assert [subtask.output.to_text() for subtask in task.subtasks] == [
+            "ack foo",
+            "Action is malformed and wasn't run",
+            "ack baz",
+            "done",
+        ]
+        assert isinstance(task.subtasks[1].output, ErrorArtifact)
+
+        if not use_arun:
+            prompt = mock_try_run.call_args_list[1].args[0].inputs
+
+            assert "Action is malformed and wasn't run" in prompt[-3].content
+
+    @pytest.mark.parametrize("use_arun", [False, True])
+    def test_run_batch_over_max_subtasks(self, mocker, use_arun):
+        output = "\n".join(
+            f'Action: {{"name": "Tool1", "path": "test", "input": {{"values": {{"test": "{value}"}}}}}}'
+            for value in ["foo", "bar", "baz", "qux"]
+        )
+        mock_try_run = mocker.patch.object(MockValuePromptDriver, "try_run", return_value=TextArtifact(output))
+        mock_try_arun = mocker.patch.object(MockValuePromptDriver, "try_arun", return_value=TextArtifact(output))
+
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1", off_prompt=False)], max_subtasks=3)
+        agent = Agent(prompt_driver=MockValuePromptDriver(value=""))
+
+        agent.add_task(task)
+
+        asyncio.run(agent.arun()) if use_arun else agent.run()
+
+        assert (mock_try_arun if use_arun else mock_try_run).call_count == 1
+        assert [subtask.output.to_text() for subtask in task.subtasks[:2]] == ["ack foo", "ack bar"]
+        assert all(isinstance(subtask.output, ErrorArtifact) for subtask in task.subtasks[2:])
+        assert task.output is task.subtasks[2].output
+        assert task.output.to_text() == "Exceeded tool limit of 3 subtasks per task"
+
+    def test_subtasks_from_prompt(self):
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")])
+
+        subtasks = task.subtasks_from_prompt(
+            TextArtifact(
+                "Thought: need to test\n"
+                'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "foo"}}}\n'
+                'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "bar"}}}\n'
+            )
+        )
+
+        assert [subtask.input.to_text() for subtask in subtasks] == [
+            "Thought: need to test\n"
+            'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "foo"}}}\n',
+            'Action: {"name": "Tool1", "path": "test", "input": {"values": {"test": "bar"}}}\n',
+        ]
+
+    def test_subtasks_from_prompt_single_action(self):
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")])
+        value = 'Thought: need to test\nAction: {"name": "Tool1", "path": "test"}\nAnswer: done'
+
+        subtasks = task.subtasks_from_prompt(TextArtifact(value))
+
+        assert [subtask.input.to_text() for subtask in subtasks] == [value]
+
     def test_run_invalid_react_prompt(self):
         output = """foo bar"""
 
@@ -1,5 +1,7 @@
 import pytest
+import tiktoken
 from griptape.tokenizers import OpenAiTokenizer
+from griptape.tokenizers.openai_tokenizer import _encoding_for_model
 
 
 class TestOpenAiTokenizer:
@@ -14,6 +16,20 @@ class TestOpenAiTokenizer:
     def test_token_count_for_text(self, tokenizer):
         assert tokenizer.count_tokens("foo bar huzzah") == 5
 
+    def test_encoding_is_cached(self, mocker):
+        _encoding_for_model.cache_clear()
+        encoding_for_model = mocker.spy(tiktoken, "encoding_for_model")
+        tokenizer = OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_4_MODEL)
+
+        tokenizer.count_tokens("foo bar huzzah")
+        tokenizer.count_tokens("foo bar huzzah")
+        OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_4_MODEL).count_tokens("foo bar huzzah")
+
+        assert encoding_for_model.call_count == 1
+
+    def test_encoding_for_unknown_model(self):
+        assert OpenAiTokenizer(model="not-a-real-model").encoding.name == OpenAiTokenizer.DEFAULT_ENCODING
+
     def test_initialize_with_unknown_model(self):
         tokenizer = OpenAiTokenizer(model="not-a-real-model")
         assert tokenizer.max_tokens == OpenAiTokenizer.DEFAULT_MAX_TOKENS - OpenAiTokenizer.TOKEN_OFFSET
@@ -48,3 +64,9 @@ class TestOpenAiTokenizer:
 
     def test_tokens_left_32k(self, tokenizer_32k):
         assert tokenizer_32k.count_tokens_left("foo bar huzzah") == 32755
+
+    @pytest.mark.parametrize("text", ["foo bar huzzah", "héllo wörld 日本語 🤖🤖", ""])
+    def test_token_offsets(self, tokenizer, text):
+        tokens = tokenizer.encoding.encode(text)
+
+        assert tokenizer.token_offsets(text) == tokenizer.encoding.decode_with_offsets(tokens)[1]
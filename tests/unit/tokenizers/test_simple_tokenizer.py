@@ -12,3 +12,6 @@ class TestSimpleTokenizer:
 
     def test_tokens_left(self, tokenizer):
         assert tokenizer.count_tokens_left("foo bar huzzah") == 1021
+
+    def test_token_offsets(self, tokenizer):
+        assert tokenizer.token_offsets("foo bar huzzah") == [0, 6, 12]
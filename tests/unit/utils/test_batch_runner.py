@@ -0,0 +1,162 @@
+import threading
+from concurrent import futures
+import pytest
+from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.structures import Agent, Pipeline, Workflow
+from griptape.tasks import BaseTask, CodeExecutionTask, PromptTask
+from griptape.utils import BatchRunner
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+class TestBatchRunner:
+    @pytest.fixture
+    def pipeline(self):
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline + [
+            CodeExecutionTask(run_fn=lambda task: TextArtifact(task.structure.execution_args[0] * 2)),
+            CodeExecutionTask(run_fn=lambda task: TextArtifact(f"{task.parents[0].output.value}!")),
+        ]
+
+        return pipeline
+
+    def test_run(self, pipeline):
+        results = sorted(BatchRunner(structure=pipeline).run(["a", "b", "c"]), key=lambda result: result.index)
+
+        assert [result.output.value for result in results] == ["aa!", "bb!", "cc!"]
+        assert [result.args for result in results] == [("a",), ("b",), ("c",)]
+        assert all(task.state == BaseTask.State.PENDING for task in pipeline.tasks)
+        assert all(task.output is None for task in pipeline.tasks)
+
+    def test_run_isolates_tasks(self, pipeline):
+        results = list(BatchRunner(structure=pipeline).run(["a", "b"]))
+
+        assert results[0].structure is not pipeline
+        assert results[0].structure is not results[1].structure
+        assert all(task1 is not task2 for task1, task2 in zip(results[0].structure.tasks, results[1].structure.tasks))
+        assert all(task1 is not task2 for task1, task2 in zip(results[0].structure.tasks, pipeline.tasks))
+        assert results[0].structure.config is pipeline.config
+        assert results[0].structure.task_memory is pipeline.task_memory
+        assert results[0].structure.conversation_memory is None
+        assert [task.id for task in results[0].structure.tasks] == [task.id for task in pipeline.tasks]
+
+    def test_run_gives_copies_fresh_ids(self, pipeline):
+        results = list(BatchRunner(structure=pipeline).run(["a", "b"]))
+
+        assert len({pipeline.id, *(result.structure.id for result in results)}) == 3
+
+    def test_run_cancels_pending_runs_when_closed(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def run(task: CodeExecutionTask) -> TextArtifact:
+            if task.structure.execution_args[0]:
+                started.set()
+                release.wait(5)
+
+            return TextArtifact("done")
+
+        agent = Agent(prompt_driver=MockPromptDriver())
+        agent.add_task(CodeExecutionTask(run_fn=run))
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        submitted = []
+        submit = executor.submit
+        executor.submit = lambda *args: submitted.append(submit(*args)) or submitted[-1]
+        results = BatchRunner(structure=agent, max_concurrency=3, futures_executor=executor).run(range(10))
+
+        try:
+            assert next(results).index == 0
+            assert started.wait(5)
+
+            results.close()
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+        assert [future.cancelled() for future in submitted] == [False, False, True, True]
+
+    def test_run_unpacks_tuples(self):
+        agent = Agent(prompt_driver=MockPromptDriver())
+        agent.add_task(CodeExecutionTask(run_fn=lambda task: TextArtifact("-".join(task.structure.execution_args))))
+
+        results = list(BatchRunner(structure=agent).run([("a", "b")]))
+
+        assert results[0].output.value == "a-b"
+
+    def test_run_bounds_concurrency(self):
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+
+        def run(task: CodeExecutionTask) -> TextArtifact:
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+
+            threading.Event().wait(0.01)
+
+            with lock:
+                running[0] -= 1
+
+            return TextArtifact("done")
+
+        agent = Agent(prompt_driver=MockPromptDriver())
+        agent.add_task(CodeExecutionTask(run_fn=run))
+
+        results = list(BatchRunner(structure=agent, max_concurrency=2).run(range(10)))
+
+        assert len(results) == 10
+        assert all(result.output.value == "done" for result in results)
+        assert max_running[0] <= 2
+
+    def test_run_reports_errors(self):
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+        workflow.add_task(
+            CodeExecutionTask(
+                run_fn=lambda task: ErrorArtifact("error")
+                if task.structure.execution_args[0] % 2
+                else TextArtifact("ok")
+            )
+        )
+        runner = BatchRunner(structure=workflow)
+
+        results = list(runner.run(range(4)))
+
+        assert sorted(result.is_error() for result in results) == [False, False, True, True]
+        assert runner.stats.completed == 4
+        assert runner.stats.failed == 2
+
+    def test_run_catches_exceptions(self):
+        task1 = PromptTask("test1")
+        task2 = PromptTask("test2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+        workflow + [task1, task2]
+        task1.parent_ids.append(task2.id)
+        task2.child_ids.append(task1.id)
+
+        results = list(BatchRunner(structure=workflow).run(["a"]))
+
+        assert results[0].error is not None
+        assert results[0].output is None
+        assert results[0].is_error()
+
+    def test_stats(self, pipeline):
+        runner = BatchRunner(structure=pipeline)
+
+        list(runner.run(["a", "b", "c"]))
+
+        assert runner.stats.completed == 3
+        assert runner.stats.failed == 0
+        assert len(runner.stats.latencies) == 3
+        assert runner.stats.throughput > 0
+        assert runner.stats.mean_latency > 0
+        assert runner.stats.latency_percentile(50) <= runner.stats.latency_percentile(95)
+        assert runner.stats.latency_percentile(100) == max(runner.stats.latencies)
+
+    def test_stats_empty(self, pipeline):
+        runner = BatchRunner(structure=pipeline)
+
+        assert list(runner.run([])) == []
+        assert runner.stats.throughput == 0
+        assert runner.stats.mean_latency == 0
+        assert runner.stats.latency_percentile(95) == 0
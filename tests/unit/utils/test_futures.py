@@ -12,5 +12,13 @@ class TestFutures:
             assert result["foo"] == "foo-bar"
             assert result["baz"] == "baz-bar"
 
+    def test_execute_futures_list(self):
+        with futures.ThreadPoolExecutor() as executor:
+            result = utils.execute_futures_list(
+                [executor.submit(self.foobar, "foo"), executor.submit(self.foobar, "baz")]
+            )
+
+            assert result == ["foo-bar", "baz-bar"]
+
     def foobar(self, foo):
         return f"{foo}-bar"
@@ -0,0 +1,32 @@
+import pytest
+from griptape.utils import J2
+
+
+class TestJ2:
+    def test_render(self):
+        assert J2("rulesets/rulesets.j2").render(rulesets=[]) == ""
+
+    def test_render_without_template_name(self):
+        with pytest.raises(ValueError):
+            J2().render()
+
+    def test_render_from_string(self):
+        assert J2().render_from_string("{{ foo }} bar", foo="foo") == "foo bar"
+        assert J2().render_from_string("{{ foo }} bar", foo="baz") == "baz bar"
+
+    def test_shared_environment(self, tmp_path):
+        assert J2("rulesets/rulesets.j2").environment is J2().environment
+        assert J2(templates_dir=str(tmp_path)).environment is J2(templates_dir=str(tmp_path)).environment
+        assert J2(templates_dir=str(tmp_path)).environment is not J2().environment
+
+    def test_compiled_template_cache(self):
+        environment = J2().environment
+
+        assert environment.get_template("rulesets/rulesets.j2") is environment.get_template("rulesets/rulesets.j2")
+
+    def test_custom_templates_dir_reloads(self, tmp_path):
+        (tmp_path / "test.j2").write_text("foo")
+        assert J2("test.j2", templates_dir=str(tmp_path)).render() == "foo"
+
+        (tmp_path / "test.j2").write_text("bar baz")
+        assert J2("test.j2", templates_dir=str(tmp_path)).render() == "bar baz"
@@ -1,9 +1,11 @@
 import pytest
+from griptape.drivers import OpenAiChatPromptDriver
+from griptape.tokenizers import OpenAiTokenizer
 from griptape.utils import PromptStack
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_tokenizer import MockTokenizer
 from griptape.structures.agent import Agent
-from griptape.memory.structure import ConversationMemory, Run
+from griptape.memory.structure import ConversationMemory, Run, SummaryConversationMemory
 
 
 class TestPromptStack:
@@ -137,3 +139,96 @@ class TestPromptStack:
         assert prompt_stack.inputs[2].content == "bar2"
         assert prompt_stack.inputs[-2].content == "foo"
         assert prompt_stack.inputs[-1].content == "bar"
+
+    def test_input_token_count(self, mocker):
+        tokenizer = MockTokenizer(model="foo")
+        count_tokens = mocker.spy(MockTokenizer, "count_tokens")
+        prompt_input = PromptStack.Input("foo", role=PromptStack.USER_ROLE)
+
+        assert prompt_input.token_count(tokenizer) == 3
+        assert prompt_input.token_count(tokenizer) == 3
+        assert count_tokens.call_count == 1
+
+        prompt_input.content = "foobar"
+
+        assert prompt_input.token_count(tokenizer) == 6
+        assert prompt_input.token_count(MockTokenizer(model="bar")) == 6
+        assert count_tokens.call_count == 3
+
+    def test_token_count(self, prompt_stack):
+        prompt_stack.add_system_input("fizz")
+        prompt_stack.add_user_input("foo")
+
+        assert prompt_stack.token_count(MockTokenizer(model="foo")) == 7
+
+    def test_reuse_token_counts(self, prompt_stack, mocker):
+        tokenizer = MockTokenizer(model="foo")
+        prompt_stack.add_system_input("fizz")
+        prompt_stack.add_user_input("foo")
+        prompt_stack.token_count(tokenizer)
+
+        new_prompt_stack = PromptStack()
+        new_prompt_stack.add_system_input("fizz")
+        new_prompt_stack.add_user_input("foo")
+        new_prompt_stack.add_assistant_input("bar")
+        new_prompt_stack.reuse_token_counts(prompt_stack)
+        count_tokens = mocker.spy(MockTokenizer, "count_tokens")
+
+        assert new_prompt_stack.token_count(tokenizer) == 10
+        assert [c.args[1] for c in count_tokens.call_args_list] == ["bar"]
+
+    @pytest.mark.parametrize("max_tokens", [100, 1000, 2500, 10000])
+    def test_add_conversation_memory_autopruning_fits_most_runs(self, max_tokens):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_tokens=max_tokens))
+        agent = Agent(prompt_driver=prompt_driver)
+        memory = ConversationMemory(
+            autoprune=True, runs=[Run(input=f"foo{i}" * (i % 7 + 1), output=f"bar{i}") for i in range(100)]
+        )
+        memory.structure = agent
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_input("fizz")
+        prompt_stack.add_conversation_memory(memory)
+
+        num_runs = (len(prompt_stack.inputs) - 1) // 2
+        fits = [
+            prompt_driver.token_count(PromptStack(inputs=[prompt_stack.inputs[0], *memory.to_prompt_stack(n).inputs]))
+            < max_tokens
+            for n in range(1, len(memory.runs) + 1)
+        ]
+
+        assert num_runs == sum(fits)
+        assert fits == [True] * num_runs + [False] * (len(memory.runs) - num_runs)
+
+    @pytest.mark.parametrize("max_tokens", [50, 300, 1000, 100000])
+    @pytest.mark.parametrize("summary_index", [None, 0, 40, 100])
+    def test_add_conversation_memory_autopruning_with_input_token_counts(self, mocker, max_tokens, summary_index):
+        tokenizer = OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, max_tokens=max_tokens)
+        prompt_driver = OpenAiChatPromptDriver(
+            model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, tokenizer=tokenizer
+        )
+        agent = Agent(prompt_driver=prompt_driver)
+        runs = [Run(input=f"foo{i} " * (i % 7 + 1), output=f"bar{i}") for i in range(100)]
+        if summary_index is None:
+            memory = ConversationMemory(autoprune=True, runs=runs)
+        else:
+            memory = SummaryConversationMemory(
+                autoprune=True, runs=runs, summary="fizz buzz", summary_index=summary_index
+            )
+        memory.structure = agent
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_input("fizz")
+        count_tokens = mocker.spy(OpenAiTokenizer, "count_tokens")
+        prompt_stack.add_conversation_memory(memory)
+        tokenizer_calls = count_tokens.call_count
+
+        fits = [
+            prompt_driver.token_count(PromptStack(inputs=[prompt_stack.inputs[0], *memory.to_prompt_stack(n).inputs]))
+            < max_tokens
+            for n in range(1, len(memory.runs) + 1)
+        ]
+        num_runs = fits.count(True)
+
+        assert fits == [True] * num_runs + [False] * (len(memory.runs) - num_runs)
+        assert prompt_stack.inputs[1:] == (memory.to_prompt_stack(num_runs).inputs if num_runs else [])
+        # Each input is tokenized once, plus a few empty messages for the formatting of each role.
+        assert tokenizer_calls <= len(memory.to_prompt_stack().inputs) + 10